@@ -0,0 +1,197 @@
+import hashlib
+import json
+from array import array
+
+
+# --------------------------------------------
+# Streaming Aggregate Report
+# --------------------------------------------
+#
+# Consumes results as they are produced and keeps memory bounded:
+# classifications and SF codes have small fixed domains and are counted
+# exactly; failed_index and ConstraintSet size are counted exactly up to
+# EXACT_BUCKETS and in power-of-two ranges beyond; intents and actors
+# (unbounded) go through a SpaceSaving heavy-hitter table for the top-k
+# and, for actors, a count-min sketch for point estimates. Sketches
+# hash with blake2b, so the same input always yields the same report.
+
+EXACT_BUCKETS = 16
+
+HEAVY_HITTERS = 64
+
+SKETCH_WIDTH = 4096
+
+SKETCH_DEPTH = 4
+
+
+def bucket(value: int) -> str:
+    """
+    The value itself below EXACT_BUCKETS, otherwise its power-of-two
+    range, e.g. "16-31".
+    """
+
+    if value < EXACT_BUCKETS:
+        return str(value)
+
+    low = 1 << (value.bit_length() - 1)
+    return f"{low}-{2 * low - 1}"
+
+
+def _bucket_order(item):
+    return int(item[0].split("-")[0])
+
+
+class SpaceSaving:
+    """
+    Top-k heavy hitters in at most capacity counters (Metwally et al.).
+    Each count overestimates the true count by at most its error.
+    """
+
+    def __init__(self, capacity: int = HEAVY_HITTERS):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+
+    def add(self, key, count: int = 1):
+        counts = self.counts
+
+        if key in counts:
+            counts[key] += count
+            return
+
+        if len(counts) < self.capacity:
+            counts[key] = count
+            self.errors[key] = 0
+            return
+
+        # Replace the smallest counter; min over a small table is cheap
+        # compared to maintaining a heap on every hit.
+        evicted = min(counts, key=counts.__getitem__)
+        floor = counts.pop(evicted)
+        del self.errors[evicted]
+
+        counts[key] = floor + count
+        self.errors[key] = floor
+
+    def top(self, n: int = None) -> list:
+        ranked = sorted(self.counts.items(), key=lambda item: (-item[1], str(item[0])))
+        return [
+            {"key": key, "count": count, "max_error": self.errors[key]}
+            for key, count in ranked[:n]
+        ]
+
+
+class CountMinSketch:
+    """
+    Point-count estimates for any number of keys in width x depth
+    counters. Estimates never undercount.
+    """
+
+    def __init__(self, width: int = SKETCH_WIDTH, depth: int = SKETCH_DEPTH):
+        self.width = width
+        self.depth = depth
+        self.rows = [array("Q", bytes(8 * width)) for _ in range(depth)]
+
+    def _columns(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8", "surrogatepass"), digest_size=4 * self.depth).digest()
+
+        for row in range(self.depth):
+            yield int.from_bytes(digest[4 * row:4 * row + 4], "little") % self.width
+
+    def add(self, key: str, count: int = 1):
+        for row, column in zip(self.rows, self._columns(key)):
+            row[column] += count
+
+    def estimate(self, key: str) -> int:
+        return min(row[column] for row, column in zip(self.rows, self._columns(key)))
+
+
+class ResultAggregator:
+
+    def __init__(self, heavy_hitters: int = HEAVY_HITTERS):
+        self.total = 0
+        self.classifications = {}
+        self.failure_classes = {}
+        self.failed_indices = {}
+        self.constraint_counts = {}
+        self.intents = SpaceSaving(heavy_hitters)
+        self.actors = SpaceSaving(heavy_hitters)
+        self.actor_sketch = CountMinSketch()
+
+    def observe(
+        self,
+        classification: str,
+        failure_class: str = None,
+        failed_index: int = None,
+        intent: str = None,
+        actor: str = None,
+        constraint_count: int = None
+    ):
+        self.total += 1
+        self.classifications[classification] = self.classifications.get(classification, 0) + 1
+
+        if failure_class is not None:
+            self.failure_classes[failure_class] = self.failure_classes.get(failure_class, 0) + 1
+
+        if failed_index is not None:
+            key = bucket(failed_index)
+            self.failed_indices[key] = self.failed_indices.get(key, 0) + 1
+
+        if constraint_count is not None:
+            key = bucket(constraint_count)
+            self.constraint_counts[key] = self.constraint_counts.get(key, 0) + 1
+
+        if intent is not None:
+            self.intents.add(intent)
+
+        if actor is not None:
+            self.actors.add(actor)
+            self.actor_sketch.add(actor)
+
+    def observe_result(self, sentence, result: dict, failed_index: int = None):
+        """
+        Records one validate() result. Intent, actor and ConstraintSet
+        size are taken from sentence when it is a dictionary holding
+        them with the expected types.
+        """
+        self.observe(result["classification"], result.get("failure_class"), failed_index,
+                     *sentence_dimensions(sentence))
+
+    def actor_count(self, actor: str) -> int:
+        return self.actor_sketch.estimate(actor)
+
+    # ---------- Report ----------
+
+    def snapshot(self, top: int = 10) -> dict:
+        return {
+            "total": self.total,
+            "classifications": dict(sorted(self.classifications.items())),
+            "failure_classes": dict(sorted(self.failure_classes.items())),
+            "failed_indices": dict(sorted(self.failed_indices.items(), key=_bucket_order)),
+            "constraint_counts": dict(sorted(self.constraint_counts.items(), key=_bucket_order)),
+            "top_intents": self.intents.top(top),
+            "top_actors": self.actors.top(top)
+        }
+
+    def to_json(self, top: int = 10) -> str:
+        return json.dumps(self.snapshot(top), indent=2)
+
+
+def sentence_dimensions(sentence) -> tuple:
+    """
+    (intent, actor, constraint_count) of a sentence, None where absent
+    or of the wrong type.
+    """
+
+    if not isinstance(sentence, dict):
+        return None, None, None
+
+    intent = sentence.get("intent")
+    actor = sentence.get("actor")
+    constraints = sentence.get("constraints")
+
+    return (
+        intent if isinstance(intent, str) else None,
+        actor if isinstance(actor, str) else None,
+        len(constraints) if isinstance(constraints, list) else None
+    )
@@ -0,0 +1,120 @@
+import io
+import random
+from collections import Counter
+from aggregate import CountMinSketch, ResultAggregator, SpaceSaving, bucket
+from corpus import generate_lines
+from decoder import decode_sentence
+from main import summary_mode, validate_line
+
+
+# --------------------------------------------
+# Streaming Aggregate Report Tests
+# --------------------------------------------
+
+def zipf_stream(size: int, seed: int = 1) -> list:
+    rng = random.Random(seed)
+    return [f"actor_{int(rng.paretovariate(1.2))}" for _ in range(size)]
+
+
+def test_buckets():
+    assert [bucket(v) for v in (0, 15, 16, 31, 32, 1000)] == \
+        ["0", "15", "16-31", "16-31", "32-63", "512-1023"]
+
+
+def test_space_saving_bounds():
+    stream = zipf_stream(20000)
+    truth = Counter(stream)
+    table = SpaceSaving(32)
+
+    for key in stream:
+        table.add(key)
+
+    top = table.top()
+    assert len(top) == 32
+    assert top[0]["key"] == truth.most_common(1)[0][0]
+
+    for entry in top:
+        actual = truth[entry["key"]]
+        assert entry["count"] - entry["max_error"] <= actual <= entry["count"]
+
+
+def test_count_min_never_undercounts():
+    stream = zipf_stream(20000, seed=2)
+    truth = Counter(stream)
+    sketch = CountMinSketch(width=256, depth=4)
+
+    for key in stream:
+        sketch.add(key)
+
+    assert all(sketch.estimate(key) >= count for key, count in truth.items())
+    assert sketch.estimate("actor_1") - truth["actor_1"] < len(stream) * 0.05
+
+
+def test_summary_matches_full_results():
+    lines = list(generate_lines(3000, seed=6)) + ["{broken"]
+    report = summary_mode(io.StringIO("\n".join(lines))).snapshot()
+
+    results = [validate_line(line) for line in lines]
+    assert report["total"] == len(lines)
+    assert report["classifications"] == dict(sorted(Counter(
+        r["classification"] for r in results
+    ).items()))
+    assert report["failure_classes"] == dict(sorted(Counter(
+        r["failure_class"] for r in results if "failure_class" in r
+    ).items()))
+    assert sum(report["failed_indices"].values()) == \
+        report["classifications"]["Accepted + Refused"]
+
+    sizes = Counter(
+        bucket(len(decode_sentence(line)["constraints"]))
+        for line in lines[:-1]
+        if isinstance(decode_sentence(line).get("constraints"), list)
+    )
+    assert report["constraint_counts"] == dict(sizes)
+
+
+def test_report_is_deterministic():
+    lines = "\n".join(generate_lines(2000, seed=8))
+    first = summary_mode(io.StringIO(lines), workers=1).to_json()
+    second = summary_mode(io.StringIO(lines), workers=2).to_json()
+    assert first == second
+
+
+def test_observe_result_takes_dimensions_from_sentence():
+    aggregator = ResultAggregator()
+    aggregator.observe_result(
+        {"actor": "A", "intent": "Pay", "constraints": [1, 2]},
+        {"classification": "Accepted + Allowed"}
+    )
+    aggregator.observe_result(None, {"classification": "Rejected (Structural)",
+                                     "failure_class": "SF-08"})
+
+    report = aggregator.snapshot()
+    assert report["top_actors"][0]["key"] == "A" and aggregator.actor_count("A") == 1
+    assert report["constraint_counts"] == {"2": 1}
+    assert report["failure_classes"] == {"SF-08": 1}
+
+
+def test_lone_surrogate_dimensions():
+    # Valid JSON, classified normally by --ndjson.
+    line = '{"actor": "\\ud800", "intent": "\\udfff", "context": {"a": 1}, ' \
+        '"constraints": [{"field": "a", "value": 1}], "outcome": "Allowed"}'
+
+    aggregator = summary_mode(io.StringIO(line + "\n" + line))
+    report = aggregator.snapshot()
+
+    assert report["classifications"] == {"Accepted + Allowed": 2}
+    assert aggregator.actor_count("\ud800") == 2
+    assert report["top_intents"][0]["key"] == "\udfff"
+    assert aggregator.to_json()
+
+
+if __name__ == "__main__":
+    test_buckets()
+    test_space_saving_bounds()
+    test_count_min_never_undercounts()
+    test_summary_matches_full_results()
+    test_report_is_deterministic()
+    test_observe_result_takes_dimensions_from_sentence()
+    test_lone_surrogate_dimensions()
+    print("Aggregate report tests passed.")
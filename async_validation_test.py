@@ -0,0 +1,94 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from benchmarks.inputs import make_mix
+from structural import InputBudgets
+from validator import (
+    iter_validate_async,
+    validate,
+    validate_async,
+    validate_many_async
+)
+
+
+# --------------------------------------------
+# Asyncio Validation API Tests
+# --------------------------------------------
+
+BATCH = make_mix(600, 0.2)
+
+
+def test_validate_async_matches_validate():
+    result = asyncio.run(validate_async(BATCH[0]))
+    assert result == validate(BATCH[0])
+
+
+def test_batch_preserves_order():
+    results = asyncio.run(validate_many_async(BATCH, chunk_size=37, concurrency=3))
+    assert results == [validate(s) for s in BATCH]
+
+
+def test_async_source_is_accepted():
+    async def source():
+        for sentence in BATCH[:100]:
+            await asyncio.sleep(0)
+            yield sentence
+
+    results = asyncio.run(validate_many_async(source(), chunk_size=8))
+    assert results == [validate(s) for s in BATCH[:100]]
+
+
+def test_validation_runs_off_the_loop_thread():
+    loop_thread = threading.get_ident()
+    seen = set()
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, *args):
+            return super().submit(lambda: (seen.add(threading.get_ident()), fn(*args))[1])
+
+    async def scenario():
+        with RecordingExecutor(2) as executor:
+            return await validate_many_async(BATCH[:50], executor, chunk_size=10)
+
+    asyncio.run(scenario())
+    assert seen and loop_thread not in seen
+
+
+def test_closing_iterator_cancels_pending_chunks():
+    started = []
+
+    class CountingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, *args):
+            started.append(len(args[0]))
+            return super().submit(fn, *args)
+
+    async def scenario():
+        with CountingExecutor(1) as executor:
+            results = iter_validate_async(
+                iter(BATCH * 10), executor, chunk_size=10, concurrency=2
+            )
+            first = await results.__anext__()
+            await results.aclose()
+            return first
+
+    assert asyncio.run(scenario()) == validate(BATCH[0])
+    assert len(started) <= 3, f"Source was drained after close: {len(started)} chunks"
+
+
+def test_budgets_are_passed_through():
+    budgets = InputBudgets(max_context_fields=1)
+    expected = [validate(s, budgets=budgets) for s in BATCH]
+
+    assert asyncio.run(validate_async(BATCH[0], budgets=budgets)) == expected[0]
+    assert asyncio.run(validate_many_async(BATCH, chunk_size=37, budgets=budgets)) == expected
+    assert any(r.get("failure_class") == "SF-12" for r in expected)
+
+
+if __name__ == "__main__":
+    test_validate_async_matches_validate()
+    test_batch_preserves_order()
+    test_async_source_is_accepted()
+    test_validation_runs_off_the_loop_thread()
+    test_closing_iterator_cancels_pending_chunks()
+    test_budgets_are_passed_through()
+    print("Async validation tests passed.")
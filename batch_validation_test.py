@@ -0,0 +1,50 @@
+import json
+from corpus import CORPUS
+from validator import validate, validate_many, iter_validate_many
+
+
+# --------------------------------------------
+# Batch Validation (validate_many) Tests
+# --------------------------------------------
+
+def build_batch(size: int) -> list:
+    return [CORPUS[i % len(CORPUS)] for i in range(size)]
+
+
+def serialize(results: list) -> bytes:
+    return "\n".join(
+        json.dumps(result, sort_keys=True) for result in results
+    ).encode()
+
+
+def test_sequential_matches_validate():
+    batch = build_batch(30)
+
+    assert validate_many(batch, workers=1) == [validate(s) for s in batch]
+
+
+def test_pool_output_byte_identical():
+    batch = build_batch(500)
+    expected = serialize([validate(s) for s in batch])
+
+    for chunk_size in (1, 7, 512):
+        actual = serialize(validate_many(batch, workers=2, chunk_size=chunk_size))
+        assert actual == expected, \
+            f"Pool output diverged with chunk_size={chunk_size}"
+
+
+def test_iter_consumes_generators_lazily():
+    batch = (CORPUS[i % len(CORPUS)] for i in range(100))
+    results = iter_validate_many(batch, workers=1, chunk_size=10)
+
+    first = next(results)
+
+    assert first == validate(CORPUS[0])
+    assert len(list(results)) == 99
+
+
+if __name__ == "__main__":
+    test_sequential_matches_validate()
+    test_pool_output_byte_identical()
+    test_iter_consumes_generators_lazily()
+    print("Batch validation tests passed.")
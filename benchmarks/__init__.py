@@ -0,0 +1,2 @@
+# Performance benchmarks. Run from the repository root, e.g.
+#   python -m benchmarks.structural_bench
@@ -0,0 +1,111 @@
+import timeit
+
+from benchmarks.inputs import make_sentence
+from structural import DEFAULT_BUDGETS, InputBudgets
+from validator import validate
+
+
+# --------------------------------------------
+# Worst-Case Latency Under Input Size Budgets
+# --------------------------------------------
+#
+# Grows one dimension of a sentence from a tenth of its default budget
+# to 100x beyond it and times validate with the default budgets and
+# with budgets disabled. Oversized inputs are built so that validation
+# would have to read all of them (constrained fields, compared values),
+# so without budgets latency grows with the input; with budgets it
+# stays bounded by the cost of an input exactly at the budget.
+# Run with: python -m benchmarks.budget_bench
+
+UNLIMITED = InputBudgets(*[float("inf")] * 5)
+
+SCALES = [0.1, 1, 10, 100]
+
+
+def _context_fields(size: int) -> dict:
+    sentence = make_sentence(1, 1)
+    sentence["context"].update((f"extra_{i}", i) for i in range(size - 1))
+    return sentence
+
+
+def _constraints(size: int) -> dict:
+    sentence = make_sentence(1, 1)
+    sentence["constraints"] = sentence["constraints"] * size
+    return sentence
+
+
+def _string_length(size: int) -> dict:
+    sentence = make_sentence(1, 1)
+    sentence["context"]["field_0"] = "x" * size
+    # An equal but distinct string, so the comparison reads every character.
+    sentence["constraints"][0]["value"] = "".join(["x"] * size)
+    return sentence
+
+
+def _nested(depth: int):
+    # Nested lists whose innermost list sits at sentence depth `depth`
+    # when used as a constraint value (constraints 1, constraint 2).
+    value = []
+
+    for _ in range(depth - 3):
+        value = [value]
+
+    return value
+
+
+def _nesting_depth(size: int) -> dict:
+    sentence = make_sentence(1, 1)
+    sentence["context"]["field_0"] = _nested(size)
+    sentence["constraints"][0]["value"] = _nested(size)
+    return sentence
+
+
+def _value_count(size: int) -> dict:
+    sentence = make_sentence(1, 1)
+    sentence["context"]["field_0"] = list(range(size))
+    sentence["constraints"][0]["value"] = list(range(size))
+    return sentence
+
+
+# (name, builder, default budget). Nesting stops at 10x: comparing
+# deeper lists without a budget exceeds Python's recursion limit.
+DIMENSIONS = [
+    ("context fields", _context_fields, DEFAULT_BUDGETS.max_context_fields, SCALES),
+    ("constraints", _constraints, DEFAULT_BUDGETS.max_constraints, SCALES),
+    ("string length", _string_length, DEFAULT_BUDGETS.max_string_length, SCALES),
+    ("nesting depth", _nesting_depth, DEFAULT_BUDGETS.max_depth, SCALES[:3]),
+    ("value count", _value_count, DEFAULT_BUDGETS.max_values, SCALES)
+]
+
+
+def _validate_us(sentence: dict, budgets: InputBudgets) -> float:
+    seconds = min(timeit.repeat(lambda: validate(sentence, budgets=budgets), number=3, repeat=3))
+    return seconds / 3 * 1e6
+
+
+def run() -> dict:
+    results = {}
+
+    for name, build, budget, scales in DIMENSIONS:
+        for scale in scales:
+            size = max(int(budget * scale), 1)
+            sentence = build(size)
+            bounded = validate(sentence)
+
+            results[f"{name}={size}"] = {
+                "classification": bounded.get("failure_class", bounded["classification"]),
+                "budgeted_us": round(_validate_us(sentence, DEFAULT_BUDGETS), 1),
+                "unlimited_us": round(_validate_us(sentence, UNLIMITED), 1)
+            }
+
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'input':<28}{'result':>22}{'budgeted us':>14}{'unlimited us':>15}")
+
+    for name, row in run().items():
+        print(
+            f"{name:<28}{row['classification']:>22}"
+            f"{row['budgeted_us']:>14}{row['unlimited_us']:>15}"
+        )
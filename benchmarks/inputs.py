@@ -0,0 +1,53 @@
+# --------------------------------------------
+# Synthetic Benchmark Inputs
+# --------------------------------------------
+#
+# Deterministic sentence builders parameterised by ConstraintSet size,
+# context size, outcome and structural failure class (shared with the
+# corpus generator in corpus.py).
+
+
+from corpus import DICT_STRUCTURAL_KINDS, build_rejected, build_sentence
+
+
+def make_sentence(
+    constraint_count: int = 1,
+    context_size: int = 1,
+    refused: bool = False
+) -> dict:
+    """
+    A structurally valid sentence. Refused sentences fail on their
+    last constraint, so every constraint is evaluated.
+    """
+    return build_sentence(constraint_count, context_size, refused)
+
+
+def make_rejected(code: str, constraint_count: int = 1, context_size: int = 1) -> dict:
+    """
+    A sentence rejected with the given structural failure class.
+    SF-05 cannot be expressed by a decoded dictionary and is absent.
+    """
+    return build_rejected(code, constraint_count, context_size)
+
+
+REJECTABLE_CODES = DICT_STRUCTURAL_KINDS
+
+
+def make_mix(size: int, reject_rate: float, constraint_count: int = 4) -> list:
+    """
+    A batch in which reject_rate of the sentences are structural
+    rejections (cycling through every failure class), spread evenly.
+    """
+
+    batch = []
+    rejected = 0
+
+    for i in range(size):
+        if (i + 1) * reject_rate >= rejected + 1:
+            code = REJECTABLE_CODES[rejected % len(REJECTABLE_CODES)]
+            batch.append(make_rejected(code, constraint_count, constraint_count))
+            rejected += 1
+        else:
+            batch.append(make_sentence(constraint_count, constraint_count, i % 2 == 1))
+
+    return batch
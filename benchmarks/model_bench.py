@@ -0,0 +1,92 @@
+import gc
+import timeit
+import tracemalloc
+
+from benchmarks.inputs import make_sentence
+from model import Sentence
+from validator import validate
+
+
+# --------------------------------------------
+# Dict vs Compact (model.Sentence) Footprint
+# --------------------------------------------
+#
+# Builds the same batch as dictionaries and as compact Sentences,
+# measuring retained memory with tracemalloc and per-sentence validate
+# time. Run with: python -m benchmarks.model_bench
+
+BATCH_SIZE = 20000
+
+SHAPES = [
+    ("1 constraint", 1, 2),
+    ("4 constraints", 4, 4),
+    ("16 constraints", 16, 16),
+]
+
+
+def _retained_bytes(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        batch = build()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    del batch
+    return size
+
+
+def _dict_batch(constraint_count: int, context_size: int) -> list:
+    # Fresh objects per sentence, as a decoder would produce them.
+    return [
+        make_sentence(constraint_count, context_size, refused=i % 2 == 1)
+        for i in range(BATCH_SIZE)
+    ]
+
+
+def _compact_batch(constraint_count: int, context_size: int) -> list:
+    return [
+        Sentence.from_dict(make_sentence(constraint_count, context_size, refused=i % 2 == 1))
+        for i in range(BATCH_SIZE)
+    ]
+
+
+def _validate_ns(batch: list) -> float:
+    seconds = min(timeit.repeat(lambda: [validate(s) for s in batch], number=1, repeat=5))
+    return seconds / len(batch) * 1e9
+
+
+def run() -> dict:
+    results = {}
+
+    for name, constraint_count, context_size in SHAPES:
+        dict_bytes = _retained_bytes(lambda: _dict_batch(constraint_count, context_size))
+        compact_bytes = _retained_bytes(lambda: _compact_batch(constraint_count, context_size))
+
+        sample = _dict_batch(constraint_count, context_size)[:2000]
+        compact = [Sentence.from_dict(s) for s in sample]
+
+        results[name] = {
+            "dict_bytes": dict_bytes // BATCH_SIZE,
+            "compact_bytes": compact_bytes // BATCH_SIZE,
+            "memory_ratio": round(dict_bytes / compact_bytes, 2),
+            "dict_ns": round(_validate_ns(sample)),
+            "compact_ns": round(_validate_ns(compact))
+        }
+
+    return results
+
+
+if __name__ == "__main__":
+    print(
+        f"{'shape':<18}{'dict B':>10}{'compact B':>12}{'ratio':>8}"
+        f"{'dict ns':>10}{'compact ns':>12}"
+    )
+
+    for name, row in run().items():
+        print(
+            f"{name:<18}{row['dict_bytes']:>10}{row['compact_bytes']:>12}"
+            f"{row['memory_ratio']:>7}x{row['dict_ns']:>10}{row['compact_ns']:>12}"
+        )
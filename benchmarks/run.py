@@ -0,0 +1,220 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+
+from structural import validate_structure, StructuralValidationError
+from semantic import evaluate_constraints
+from resolution import resolve
+from validator import validate
+from benchmarks.inputs import (
+    make_sentence,
+    make_rejected,
+    make_mix,
+    REJECTABLE_CODES
+)
+
+
+# --------------------------------------------
+# Benchmark Runner
+# --------------------------------------------
+#
+# Times every validation phase on synthetic inputs, saves the results as
+# JSON and optionally compares them with a saved baseline:
+#
+#   python -m benchmarks.run --output results.json
+#   python -m benchmarks.run --save-baseline
+#   python -m benchmarks.run --compare benchmarks/baseline.json
+#
+# Timings are the best of several repeats, in nanoseconds per sentence.
+# The exit status is 1 when any case regressed beyond --threshold.
+# benchmarks/structural_bench.py compares the structural engine with
+# its legacy multi-pass implementation.
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+DEFAULT_THRESHOLD = 0.15
+
+CONSTRAINT_COUNTS = [1, 8, 64]
+CONTEXT_SIZES = [1, 32, 1024]
+REJECT_RATES = [0.0, 0.1, 0.5, 1.0]
+
+
+def _structural(sentence):
+    try:
+        validate_structure(sentence)
+    except StructuralValidationError:
+        pass
+
+
+def time_per_item(func, items: list, repeat: int, number: int) -> float:
+    def run():
+        for item in items:
+            func(item)
+
+    best = min(timeit.repeat(run, number=number, repeat=repeat))
+    return best / (number * len(items)) * 1e9
+
+
+def build_cases() -> dict:
+    """
+    Maps case name -> (callable, inputs). Each callable takes a single
+    input item.
+    """
+
+    cases = {}
+
+    for count in CONSTRAINT_COUNTS:
+        allowed = make_sentence(count, count)
+        refused = make_sentence(count, count, refused=True)
+        evaluation = evaluate_constraints(refused["constraints"], refused["context"])
+
+        cases[f"structural/constraints={count}"] = (_structural, [allowed])
+        cases[f"semantic/constraints={count}/satisfied"] = (
+            lambda s: evaluate_constraints(s["constraints"], s["context"]),
+            [allowed]
+        )
+        cases[f"semantic/constraints={count}/first_failure_last"] = (
+            lambda s: evaluate_constraints(s["constraints"], s["context"]),
+            [refused]
+        )
+        cases[f"resolution/constraints={count}"] = (resolve, [evaluation])
+        cases[f"validate/constraints={count}/allowed"] = (validate, [allowed])
+        cases[f"validate/constraints={count}/refused"] = (validate, [refused])
+
+    for size in CONTEXT_SIZES:
+        sentence = make_sentence(4, size)
+        cases[f"structural/context={size}"] = (_structural, [sentence])
+        cases[f"validate/context={size}"] = (validate, [sentence])
+
+    for rate in REJECT_RATES:
+        cases[f"validate/reject_rate={rate}"] = (validate, make_mix(200, rate))
+
+    for code in REJECTABLE_CODES:
+        sentence = make_rejected(code, 4, 4)
+        cases[f"structural/{code}"] = (_structural, [sentence])
+        cases[f"validate/{code}"] = (validate, [sentence])
+
+    return cases
+
+
+DEFAULT_BUDGET = 0.05
+
+
+def run(selected: str = None, repeat: int = 5, budget: float = DEFAULT_BUDGET) -> dict:
+    """
+    Runs every case (or those whose name contains selected). Each
+    repeat is sized to take roughly budget seconds.
+    """
+
+    results = {}
+
+    for name, (func, items) in build_cases().items():
+        if selected and selected not in name:
+            continue
+
+        single = timeit.timeit(lambda: [func(item) for item in items], number=1)
+        number = max(1, int(budget / max(single, 1e-9)))
+
+        results[name] = {
+            "ns_per_op": round(time_per_item(func, items, repeat, number), 1),
+            "items": len(items),
+            "loops": number
+        }
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform()
+        },
+        "results": results
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """
+    Returns (name, baseline_ns, current_ns, ratio) for every case
+    slower than baseline by more than threshold.
+    """
+
+    regressions = []
+
+    for name, row in current["results"].items():
+        previous = baseline["results"].get(name)
+
+        if previous is None:
+            continue
+
+        ratio = row["ns_per_op"] / previous["ns_per_op"]
+
+        if ratio > 1 + threshold:
+            regressions.append((name, previous["ns_per_op"], row["ns_per_op"], ratio))
+
+    return regressions
+
+
+def print_table(current: dict, baseline: dict = None) -> None:
+    print(f"{'case':<48}{'ns/op':>12}{'baseline':>12}{'ratio':>8}")
+
+    for name, row in current["results"].items():
+        previous = (baseline or {}).get("results", {}).get(name)
+
+        if previous:
+            ratio = row["ns_per_op"] / previous["ns_per_op"]
+            print(f"{name:<48}{row['ns_per_op']:>12}"
+                  f"{previous['ns_per_op']:>12}{ratio:>7.2f}x")
+        else:
+            print(f"{name:<48}{row['ns_per_op']:>12}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Validator benchmark suite")
+    parser.add_argument("--filter", help="only run cases containing this text")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=DEFAULT_BUDGET,
+        help="approximate seconds per repeat of each case"
+    )
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help=f"write results to {BASELINE_PATH}"
+    )
+    args = parser.parse_args()
+
+    current = run(args.filter, args.repeat, args.budget)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+
+    print_table(current, baseline)
+
+    for path in filter(None, [args.output, BASELINE_PATH if args.save_baseline else None]):
+        with open(path, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if baseline is None:
+        return 0
+
+    regressions = compare(current, baseline, args.threshold)
+
+    for name, before, after, ratio in regressions:
+        print(f"REGRESSION {name}: {before} -> {after} ns/op ({ratio:.2f}x)")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+import timeit
+
+from grammar import (
+    REQUIRED_PRIMITIVES,
+    OPTIONAL_PRIMITIVES,
+    CANONICAL_ORDER,
+    VALID_OUTCOMES
+)
+from structural import validate_structure, StructuralValidationError
+
+
+# --------------------------------------------
+# Legacy Multi-Pass Validator (Baseline)
+# --------------------------------------------
+#
+# The pre-table implementation, kept verbatim in behaviour so the
+# table-driven engine can be timed against it.
+
+def legacy_validate_structure(sentence: dict) -> None:
+    for primitive in REQUIRED_PRIMITIVES:
+        if primitive not in sentence:
+            raise StructuralValidationError(
+                "SF-01", f"Missing required primitive: {primitive}"
+            )
+
+    valid_primitives = set(REQUIRED_PRIMITIVES + OPTIONAL_PRIMITIVES)
+    for key in sentence.keys():
+        if key not in valid_primitives:
+            raise StructuralValidationError("SF-11", f"Unknown primitive: {key}")
+
+    if not isinstance(sentence["actor"], str):
+        raise StructuralValidationError("SF-08", "Actor must be string")
+
+    if not isinstance(sentence["intent"], str):
+        raise StructuralValidationError("SF-08", "Intent must be string")
+
+    if not isinstance(sentence["context"], dict):
+        raise StructuralValidationError("SF-08", "Context must be dictionary")
+
+    keys = list(sentence.keys())
+    expected_order = [key for key in CANONICAL_ORDER if key in sentence]
+
+    if keys != expected_order:
+        raise StructuralValidationError("SF-04", "Canonical primitive order violated")
+
+    outcome = sentence["outcome"]
+
+    if outcome not in VALID_OUTCOMES:
+        raise StructuralValidationError("SF-07", "Invalid outcome value")
+
+    if outcome == "Refused" and "reason" not in sentence:
+        raise StructuralValidationError("SF-03", "Reason required when outcome is Refused")
+
+    if outcome == "Allowed" and "reason" in sentence:
+        raise StructuralValidationError("SF-03", "Reason forbidden when outcome is Allowed")
+
+    if isinstance(sentence.get("reason"), list):
+        raise StructuralValidationError("SF-06", "Multiple reasons not allowed")
+
+    if len(set(sentence.keys())) != len(sentence.keys()):
+        raise StructuralValidationError("SF-05", "Duplicate primitive detected")
+
+    constraints = sentence["constraints"]
+
+    if not isinstance(constraints, list):
+        raise StructuralValidationError("SF-09", "ConstraintSet must be list")
+
+    if len(constraints) == 0:
+        raise StructuralValidationError("SF-02", "ConstraintSet must not be empty")
+
+    for constraint in constraints:
+        if not isinstance(constraint, dict):
+            raise StructuralValidationError("SF-08", "Constraint must be dictionary")
+
+        if "field" not in constraint or "value" not in constraint:
+            raise StructuralValidationError("SF-08", "Constraint missing field or value")
+
+    for key, value in sentence.items():
+        if isinstance(value, dict):
+            for nested_key in value.keys():
+                if nested_key in REQUIRED_PRIMITIVES:
+                    raise StructuralValidationError("SF-10", "Primitive nesting detected")
+
+
+# --------------------------------------------
+# Benchmark Inputs
+# --------------------------------------------
+
+VALID_ALLOWED = {
+    "actor": "User_001",
+    "intent": "Transfer",
+    "context": {"balance": 5000, "verified": True, "tier": "gold"},
+    "constraints": [
+        {"field": "verified", "value": True},
+        {"field": "balance", "value": 5000}
+    ],
+    "outcome": "Allowed"
+}
+
+VALID_REFUSED = dict(
+    VALID_ALLOWED,
+    outcome="Refused",
+    reason={"field": "balance", "value": 5000}
+)
+
+CASES = {
+    "valid_allowed": VALID_ALLOWED,
+    "valid_refused": VALID_REFUSED,
+    "sf01_missing_actor": {
+        k: v for k, v in VALID_ALLOWED.items() if k != "actor"
+    },
+    "sf04_order": dict(reversed(list(VALID_ALLOWED.items()))),
+    "sf07_outcome": dict(VALID_ALLOWED, outcome="INVALID"),
+    "sf10_nesting": dict(VALID_ALLOWED, context={"actor": "Injected"}),
+    "sf11_unknown": dict(VALID_ALLOWED, unknown="bad")
+}
+
+
+def time_call(func, sentence: dict, number: int) -> float:
+    def run():
+        try:
+            func(sentence)
+        except StructuralValidationError:
+            pass
+
+    return min(timeit.repeat(run, number=number, repeat=5)) / number
+
+
+def run(number: int = 100000) -> dict:
+    results = {}
+
+    for name, sentence in CASES.items():
+        legacy = time_call(legacy_validate_structure, sentence, number)
+        current = time_call(validate_structure, sentence, number)
+
+        results[name] = {
+            "legacy_ns": round(legacy * 1e9, 1),
+            "table_ns": round(current * 1e9, 1),
+            "speedup": round(legacy / current, 2)
+        }
+
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'case':<22}{'legacy ns':>12}{'table ns':>16}{'speedup':>10}")
+
+    for name, row in run().items():
+        print(
+            f"{name:<22}{row['legacy_ns']:>12}"
+            f"{row['table_ns']:>16}{row['speedup']:>9}x"
+        )
@@ -0,0 +1,181 @@
+import random
+from corpus import BUDGET_KINDS, build_rejected, build_sentence
+from decoder import decode_sentence
+from model import Sentence
+from structural import (
+    DEFAULT_BUDGETS,
+    InputBudgets,
+    StructuralValidationError,
+    _walk_values,
+    check_budgets
+)
+from validator import revalidate, validate, validate_many
+
+
+# --------------------------------------------
+# Input Size Budget Tests (SF-12 to SF-16)
+# --------------------------------------------
+
+SMALL = InputBudgets(
+    max_context_fields=4,
+    max_constraints=3,
+    max_string_length=8,
+    max_depth=4,
+    max_values=20
+)
+
+
+def failure(sentence, budgets=None) -> str:
+    return validate(sentence, budgets=budgets).get("failure_class")
+
+
+def test_default_budget_failures():
+    for code in BUDGET_KINDS:
+        sentence = build_rejected(code)
+        assert failure(sentence) == code, code
+        assert failure(sentence, DEFAULT_BUDGETS) == code, code
+        assert failure(Sentence.from_dict(sentence)) == code, code
+
+    assert failure(build_sentence(8, 32)) is None
+
+
+def test_configured_budgets():
+    sentence = build_sentence(3, 4)
+    assert failure(sentence, SMALL) is None
+
+    cases = [
+        ("SF-12", lambda s: s["context"].update(extra=1)),
+        ("SF-13", lambda s: s["constraints"].append(dict(s["constraints"][0]))),
+        ("SF-14", lambda s: s.update(actor="x" * 9)),
+        ("SF-14", lambda s: s["context"].update(field_0="x" * 9)),
+        ("SF-15", lambda s: s["context"].update(field_0=[[[[1]]]])),
+        ("SF-16", lambda s: s["context"].update(field_0=list(range(10))))
+    ]
+
+    for code, change in cases:
+        sentence = build_sentence(3, 4)
+        change(sentence)
+        assert failure(sentence, SMALL) == code, code
+        assert failure(sentence) is None or code == "SF-12", code
+
+
+def test_budgets_checked_before_value_checks():
+    sentence = build_sentence(1, 1)
+    sentence["constraints"] = ["invalid"] * 4
+    sentence["outcome"] = "INVALID"
+
+    assert failure(sentence, SMALL) == "SF-13"
+    assert failure(sentence) == "SF-07"
+
+    missing = build_sentence(1, 1)
+    missing.pop("actor")
+    missing["context"].update((f"x{i}", i) for i in range(10))
+    assert failure(missing, SMALL) == "SF-01"
+
+
+def random_value(rng: random.Random, depth: int):
+    roll = rng.random()
+
+    if depth > 5 or roll < 0.4:
+        return rng.choice([1, 2.5, True, None, "short", "x" * rng.randint(0, 12)])
+
+    if roll < 0.7:
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+
+    return {f"k{i}": random_value(rng, depth + 1) for i in range(rng.randint(0, 4))}
+
+
+def walk_outcome(roots, budgets):
+    try:
+        _walk_values(roots, budgets)
+    except StructuralValidationError as error:
+        return error.code
+
+
+def budget_outcome(roots, budgets):
+    try:
+        check_budgets("a", "b", *roots, budgets)
+    except StructuralValidationError as error:
+        return error.code
+
+
+def test_flat_fast_path_matches_walk():
+    rng = random.Random(11)
+
+    for _ in range(2000):
+        sentence = build_sentence(rng.randint(1, 3), rng.randint(1, 4))
+
+        for field in list(sentence["context"]):
+            if rng.random() < 0.3:
+                sentence["context"][field] = random_value(rng, 2)
+
+        if rng.random() < 0.3:
+            sentence["constraints"][0]["value"] = random_value(rng, 3)
+
+        if rng.random() < 0.1:
+            sentence["constraints"][-1].update((f"k{i}", i) for i in range(rng.randint(1, 12)))
+
+        reason = random_value(rng, 1) if rng.random() < 0.2 else None
+        roots = [sentence["context"], sentence["constraints"], reason]
+        expected = walk_outcome(roots, SMALL)
+
+        assert budget_outcome(roots, SMALL) == expected, roots
+
+        if all(len(c) == 2 for c in sentence["constraints"]):
+            constraints = Sentence.from_dict(sentence).constraints
+            assert budget_outcome([roots[0], constraints, reason], SMALL) == \
+                walk_outcome([roots[0], list(constraints), reason], SMALL), roots
+
+
+def test_value_count_bounded_before_reading_values():
+    sentence = build_sentence(1, 1)
+    sentence["constraints"][0].update((f"k{i}", [i]) for i in range(30))
+
+    assert failure(sentence, SMALL) == "SF-16"
+    assert failure(Sentence.from_dict(build_sentence(2, 3)), SMALL) is None
+
+
+def test_nested_duplicate_key_dicts_are_walked():
+    text = '{"a": {"b": {"c": {"d": {"e": 1, "e": 2}}}}}'
+    context = decode_sentence(text)
+    sentence = build_sentence(1, 1)
+    sentence["context"]["field_1"] = context
+
+    assert failure(sentence, SMALL) == "SF-15"
+
+
+def test_revalidate_rechecks_budgets():
+    sentence = build_sentence(2, 2)
+    previous = validate(sentence, budgets=SMALL)
+
+    result = revalidate(sentence, previous, {"field_0": 5}, budgets=SMALL)
+    assert result == validate(sentence, budgets=SMALL)
+
+    for delta in ({"extra_1": 1, "extra_2": 2, "extra_3": 3}, {"field_0": "x" * 9},
+                  {"field_1": [[[[1]]]]}):
+        sentence = build_sentence(2, 2)
+        previous = validate(sentence, budgets=SMALL)
+        result = revalidate(sentence, previous, delta, budgets=SMALL)
+
+        assert result["classification"] == "Rejected (Structural)", delta
+        assert result == validate(sentence, budgets=SMALL)
+
+
+def test_validate_many_passes_budgets():
+    sentences = [build_sentence(1, i + 1) for i in range(8)]
+    expected = [validate(s, budgets=SMALL) for s in sentences]
+
+    assert validate_many(sentences, workers=2, chunk_size=3, budgets=SMALL) == expected
+    assert [r.get("failure_class") for r in expected[4:]] == ["SF-12"] * 4
+
+
+if __name__ == "__main__":
+    test_default_budget_failures()
+    test_configured_budgets()
+    test_budgets_checked_before_value_checks()
+    test_flat_fast_path_matches_walk()
+    test_value_count_bounded_before_reading_values()
+    test_nested_duplicate_key_dicts_are_walked()
+    test_revalidate_rechecks_budgets()
+    test_validate_many_passes_budgets()
+    print("Input budget tests passed.")
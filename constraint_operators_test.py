@@ -0,0 +1,192 @@
+import random
+from semantic import (
+    compile_constraints,
+    evaluate_constraints,
+    first_failure_indices,
+    reevaluate_constraints
+)
+from structural import StructuralValidationError, validate_structure
+from validator import failed_index, validate
+
+
+# --------------------------------------------
+# Constraint Operator Tests (in / not_in / between)
+# --------------------------------------------
+
+CONSTRAINTS = [
+    {"field": "verified", "value": True},
+    {"field": "tier", "op": "in", "value": ["gold", "platinum"]},
+    {"field": "region", "op": "not_in", "value": ["embargoed", None]},
+    {"field": "balance", "op": "between", "value": [1000, 5000]}
+]
+
+VALUES = {
+    "verified": [True, False, 1, "yes"],
+    "tier": ["gold", "platinum", "silver", 1, ["gold"], None],
+    "region": ["eu", "embargoed", None, {"a": 1}, 0],
+    "balance": [1000, 5000, 999, 5000.5, 2500.0, True, "2000", None, 2 ** 60]
+}
+
+
+def sentence(constraints: list, context: dict, outcome: str = "Allowed", reason=None) -> dict:
+    result = {
+        "actor": "User_001",
+        "intent": "Transfer",
+        "context": context,
+        "constraints": constraints,
+        "outcome": outcome
+    }
+
+    if reason is not None:
+        result["reason"] = reason
+
+    return result
+
+
+def random_contexts(rng: random.Random, count: int) -> list:
+    contexts = []
+
+    for _ in range(count):
+        context = {}
+
+        for field, values in VALUES.items():
+            if rng.random() < 0.9:
+                context[field] = rng.choice(values)
+
+        contexts.append(context)
+
+    return contexts
+
+
+def test_operator_semantics():
+    context = {"verified": True, "tier": "gold", "region": "eu", "balance": 1000}
+    assert evaluate_constraints(CONSTRAINTS, context)["status"] == "Satisfied"
+
+    failures = [
+        ({"tier": "silver"}, 1),
+        ({"tier": ["gold"]}, 1),
+        ({"region": "embargoed"}, 2),
+        ({"region": None}, 2),
+        ({"balance": 5001}, 3),
+        ({"balance": True}, 3),
+        ({"balance": "2000"}, 3)
+    ]
+
+    for change, index in failures:
+        result = evaluate_constraints(CONSTRAINTS, {**context, **change})
+        assert result["failed_index"] == index, (change, result)
+        assert result["failed_constraint"] is CONSTRAINTS[index]
+
+    del context["region"]
+    assert evaluate_constraints(CONSTRAINTS, context)["failed_index"] == 2
+
+
+def test_membership_compiled_to_frozensets():
+    plan = compile_constraints(CONSTRAINTS)
+
+    assert [step[2] for step in plan.steps] == ["eq", "in", "not_in", "between"]
+    assert plan.steps[1][3] == frozenset({"gold", "platinum"})
+    assert type(plan.steps[2][3]) is frozenset
+    assert compile_constraints([dict(c) for c in CONSTRAINTS]) is plan
+
+
+def test_all_paths_agree():
+    rng = random.Random(5)
+    plan = compile_constraints(CONSTRAINTS)
+    contexts = random_contexts(rng, 500)
+    batch = list(first_failure_indices(CONSTRAINTS, contexts))
+
+    for context, batch_index in zip(contexts, batch):
+        expected = evaluate_constraints(CONSTRAINTS, context)
+        index = expected["failed_index"]
+
+        assert evaluate_constraints(CONSTRAINTS, context, plan=plan) == expected
+        assert batch_index == (-1 if index is None else index), context
+
+        changed = rng.sample(sorted(VALUES), 2)
+        updated = dict(context)
+
+        for field in changed:
+            updated[field] = rng.choice(VALUES[field])
+
+        assert reevaluate_constraints(CONSTRAINTS, updated, index, changed, plan) == \
+            evaluate_constraints(CONSTRAINTS, updated)
+
+
+def test_numeric_range_batch():
+    constraints = [{"field": "balance", "op": "between", "value": [1000, 5000.5]}]
+    balances = [999, 1000, 4000, 5000.5, 5001, -3.5, 1e9, float("nan")]
+    contexts = [{"balance": balance} for balance in balances] + [{}]
+    batch = list(first_failure_indices(constraints, contexts))
+
+    assert batch == [0, -1, -1, -1, 0, 0, 0, 0, 0]
+
+    for context, index in zip(contexts, batch):
+        expected = evaluate_constraints(constraints, context)["failed_index"]
+        assert index == (-1 if expected is None else expected), context
+
+
+def test_refused_reason_and_failed_index():
+    reason = CONSTRAINTS[3]
+    context = {"verified": True, "tier": "gold", "region": "eu", "balance": 9000}
+    refused = sentence(CONSTRAINTS, context, "Refused", reason)
+
+    result = validate(refused)
+    assert result == {"classification": "Accepted + Refused", "reason": reason}
+    assert failed_index(refused, result) == 3
+
+
+def test_structural_operator_checks():
+    invalid = [
+        {"field": "tier", "op": "contains", "value": ["gold"]},
+        {"field": "tier", "op": ["in"], "value": ["gold"]},
+        {"field": "tier", "op": "in", "value": "gold"},
+        {"field": "tier", "op": "in", "value": []},
+        {"field": "tier", "op": "not_in", "value": [["gold"]]},
+        {"field": "balance", "op": "between", "value": [5000, 1000]},
+        {"field": "balance", "op": "between", "value": [1000]},
+        {"field": "balance", "op": "between", "value": [False, 10]},
+        {"field": "balance", "op": "between", "value": ["a", "b"]},
+        {"field": "balance", "op": "between", "value": [0, float("nan")]}
+    ]
+
+    for constraint in invalid:
+        try:
+            validate_structure(sentence([constraint], {}))
+            assert False, f"Accepted malformed constraint {constraint}"
+        except StructuralValidationError as error:
+            assert error.code == "SF-08", constraint
+
+    validate_structure(sentence(CONSTRAINTS, {}))
+    validate_structure(sentence([{"field": "tier", "op": "eq", "value": "gold"}], {}))
+
+
+def test_malformed_operator_raises_when_reached():
+    constraints = [
+        {"field": "verified", "value": True},
+        {"field": "tier", "op": "contains", "value": ["gold"]}
+    ]
+    plan = compile_constraints(constraints)
+
+    assert evaluate_constraints(constraints, {"verified": False}, plan=plan)["failed_index"] == 0
+
+    for run in (
+        lambda: evaluate_constraints(constraints, {"verified": True}),
+        lambda: evaluate_constraints(constraints, {"verified": True}, plan=plan)
+    ):
+        try:
+            run()
+            assert False, "Unknown operator was evaluated"
+        except ValueError:
+            pass
+
+
+if __name__ == "__main__":
+    test_operator_semantics()
+    test_membership_compiled_to_frozensets()
+    test_all_paths_agree()
+    test_numeric_range_batch()
+    test_refused_reason_and_failed_index()
+    test_structural_operator_checks()
+    test_malformed_operator_raises_when_reached()
+    print("Constraint operator tests passed.")
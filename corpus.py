@@ -1,3 +1,12 @@
+import argparse
+import itertools
+import json
+import random
+import sys
+from decoder import decode_sentence
+from structural import DEFAULT_BUDGETS
+
+
 CORPUS = [
 
     # Allowed
@@ -33,3 +42,319 @@ CORPUS = [
         "outcome": "Allowed"
     }
 ]
+
+
+# --------------------------------------------
+# Sentence Builders
+# --------------------------------------------
+#
+# Deterministic builders for every outcome: Allowed, Refused and each
+# structural failure class. Shared by the corpus generator and the
+# benchmark suite.
+
+OUTCOME_KINDS = ["Allowed", "Refused"]
+
+STRUCTURAL_KINDS = [
+    "SF-01", "SF-02", "SF-03", "SF-04", "SF-05", "SF-06",
+    "SF-07", "SF-08", "SF-09", "SF-10", "SF-11"
+]
+
+# SF-05 (duplicate primitive) only exists in serialized text; a plain
+# dictionary cannot hold a key twice (decoder.decode_sentence detects it).
+DICT_STRUCTURAL_KINDS = [kind for kind in STRUCTURAL_KINDS if kind != "SF-05"]
+
+# Input size budget failures, built just beyond structural.DEFAULT_BUDGETS.
+# They are large, so the default mix leaves them out; name them in a mix
+# to include them.
+BUDGET_KINDS = ["SF-12", "SF-13", "SF-14", "SF-15", "SF-16"]
+
+
+def build_sentence(
+    constraint_count: int = 1,
+    context_size: int = 1,
+    refused: bool = False,
+    failing_index: int = None,
+    variant: int = 0
+) -> dict:
+    """
+    A structurally valid sentence over fields field_0..field_N.
+    Refused sentences fail at failing_index (default: the last
+    constraint); the declared reason is that constraint.
+    """
+
+    constraint_count = max(constraint_count, 1)
+
+    context = {
+        f"field_{i}": i + variant
+        for i in range(max(context_size, constraint_count))
+    }
+    constraints = [
+        {"field": f"field_{i}", "value": i + variant}
+        for i in range(constraint_count)
+    ]
+
+    sentence = {
+        "actor": f"User_{variant:03d}",
+        "intent": "Transfer",
+        "context": context,
+        "constraints": constraints
+    }
+
+    if refused:
+        if failing_index is None:
+            failing_index = constraint_count - 1
+
+        context[f"field_{failing_index}"] = -1
+        sentence["outcome"] = "Refused"
+        sentence["reason"] = dict(constraints[failing_index])
+    else:
+        sentence["outcome"] = "Allowed"
+
+    return sentence
+
+
+def build_rejected(
+    code: str,
+    constraint_count: int = 1,
+    context_size: int = 1,
+    variant: int = 0
+) -> dict:
+    """
+    A sentence rejected with the given structural failure class.
+    SF-05 cannot be built as a dictionary; see build_line.
+    """
+
+    s = build_sentence(constraint_count, context_size, variant=variant)
+
+    if code == "SF-01":
+        s.pop("actor")
+    elif code == "SF-02":
+        s["constraints"] = []
+    elif code == "SF-03":
+        s["outcome"] = "Refused"
+    elif code == "SF-04":
+        s = dict(reversed(list(s.items())))
+    elif code == "SF-06":
+        s["outcome"] = "Refused"
+        s["reason"] = [dict(c) for c in s["constraints"][:2]]
+    elif code == "SF-07":
+        s["outcome"] = "INVALID"
+    elif code == "SF-08":
+        s["constraints"] = s["constraints"][:-1] + ["invalid"]
+    elif code == "SF-09":
+        s["constraints"] = "invalid"
+    elif code == "SF-10":
+        s["context"]["actor"] = "Injected"
+    elif code == "SF-11":
+        s["unknown"] = "bad"
+    elif code == "SF-12":
+        s["context"].update(
+            (f"extra_{i}", i) for i in range(DEFAULT_BUDGETS.max_context_fields)
+        )
+    elif code == "SF-13":
+        s["constraints"] = s["constraints"] * (DEFAULT_BUDGETS.max_constraints + 1)
+    elif code == "SF-14":
+        s["context"]["note"] = "x" * (DEFAULT_BUDGETS.max_string_length + 1)
+    elif code == "SF-15":
+        nested = []
+        for _ in range(DEFAULT_BUDGETS.max_depth):
+            nested = [nested]
+        s["context"]["nested"] = nested
+    elif code == "SF-16":
+        s["context"]["values"] = list(range(DEFAULT_BUDGETS.max_values))
+    else:
+        raise ValueError(f"No dictionary form for {code}")
+
+    return s
+
+
+def build_line(kind: str, constraint_count: int, context_size: int, variant: int = 0) -> str:
+    """
+    Compact NDJSON text for one sentence of the given kind. SF-05 is
+    written with its actor primitive repeated.
+    """
+
+    if kind == "Allowed":
+        sentence = build_sentence(constraint_count, context_size, variant=variant)
+    elif kind == "Refused":
+        sentence = build_sentence(
+            constraint_count,
+            context_size,
+            refused=True,
+            failing_index=variant % max(constraint_count, 1),
+            variant=variant
+        )
+    elif kind == "SF-05":
+        sentence = build_sentence(constraint_count, context_size, variant=variant)
+        text = json.dumps(sentence, separators=(",", ":"))
+        actor = json.dumps({"actor": sentence["actor"]}, separators=(",", ":"))[1:-1]
+        return text.replace(actor, actor + "," + actor, 1)
+    else:
+        sentence = build_rejected(kind, constraint_count, context_size, variant)
+
+    return json.dumps(sentence, separators=(",", ":"))
+
+
+# --------------------------------------------
+# Seeded Corpus Generator
+# --------------------------------------------
+#
+# Every (kind, constraint count, context size) slot is rendered into a
+# handful of NDJSON templates once; generation then only draws weighted
+# template indices in blocks and splices in an actor id. The same seed
+# and parameters always produce the same corpus.
+
+DEFAULT_MIX = dict(
+    [("Allowed", 0.45), ("Refused", 0.45)] +
+    [(kind, 0.1 / len(STRUCTURAL_KINDS)) for kind in STRUCTURAL_KINDS]
+)
+
+DEFAULT_CONSTRAINT_COUNTS = {1: 0.4, 2: 0.3, 4: 0.2, 8: 0.1}
+
+DEFAULT_CONTEXT_SIZES = {2: 0.5, 8: 0.4, 32: 0.1}
+
+TEMPLATE_VARIANTS = 8
+
+ACTOR_POOL = 1_000_000
+
+_BLOCK = 8192
+
+
+def _templates(mix: dict, constraint_counts: dict, context_sizes: dict):
+    templates = []
+    weights = []
+
+    for kind, kind_weight in mix.items():
+        if kind not in OUTCOME_KINDS and kind not in STRUCTURAL_KINDS and \
+                kind not in BUDGET_KINDS:
+            raise ValueError(f"Unknown corpus kind: {kind}")
+
+        for count, count_weight in constraint_counts.items():
+            for size, size_weight in context_sizes.items():
+                weight = kind_weight * count_weight * size_weight / TEMPLATE_VARIANTS
+
+                if weight <= 0:
+                    continue
+
+                for variant in range(TEMPLATE_VARIANTS):
+                    line = build_line(kind, count, size, variant)
+                    marker = f"User_{variant:03d}"
+
+                    if kind == "SF-01":
+                        templates.append((line, None))
+                    else:
+                        head, _, tail = line.partition(marker)
+                        templates.append((head + "User_", tail.replace(marker, "User_{}")))
+
+                    weights.append(weight)
+
+    if not templates:
+        raise ValueError("Corpus mix has no positive weights")
+
+    return templates, weights
+
+
+def generate_lines(
+    count: int,
+    seed: int = 0,
+    mix: dict = None,
+    constraint_counts: dict = None,
+    context_sizes: dict = None
+):
+    """
+    Yields count NDJSON sentence lines (without newline).
+
+    mix weights outcome kinds ("Allowed", "Refused", "SF-01".."SF-11");
+    constraint_counts and context_sizes map sizes to weights.
+    """
+
+    templates, weights = _templates(
+        mix or DEFAULT_MIX,
+        constraint_counts or DEFAULT_CONSTRAINT_COUNTS,
+        context_sizes or DEFAULT_CONTEXT_SIZES
+    )
+
+    rng = random.Random(seed)
+    population = range(len(templates))
+    cumulative = list(itertools.accumulate(weights))
+    produced = 0
+
+    while produced < count:
+        # Always draw whole blocks so a shorter corpus is a prefix of a
+        # longer one with the same seed.
+        block = min(_BLOCK, count - produced)
+        picks = rng.choices(population, cum_weights=cumulative, k=_BLOCK)
+        actors = rng.choices(range(ACTOR_POOL), k=_BLOCK)
+
+        for pick, actor in zip(picks[:block], actors[:block]):
+            head, tail = templates[pick]
+
+            if tail is None:
+                yield head
+            else:
+                actor_id = str(actor)
+                yield head + actor_id + tail.replace("User_{}", "User_" + actor_id)
+
+        produced += block
+
+
+def generate_sentences(count: int, seed: int = 0, **distributions):
+    """
+    Yields decoded sentences. SF-05 sentences keep their repeated
+    primitive (see decoder.DuplicateKeyDict).
+    """
+
+    for line in generate_lines(count, seed, **distributions):
+        yield decode_sentence(line)
+
+
+def write_ndjson(path: str, count: int, seed: int = 0, **distributions) -> int:
+    with open(path, "w", encoding="utf-8") as f:
+        lines = generate_lines(count, seed, **distributions)
+
+        while True:
+            block = list(itertools.islice(lines, _BLOCK))
+
+            if not block:
+                break
+
+            f.write("\n".join(block))
+            f.write("\n")
+
+    return count
+
+
+def _weights(text: str, key) -> dict:
+    weights = {}
+
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        weights[key(name.strip())] = float(weight)
+
+    return weights
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Seeded synthetic corpus generator")
+    parser.add_argument("output", help="NDJSON file to write ('-' for stdout)")
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mix", help="e.g. Allowed=0.5,Refused=0.4,SF-01=0.1")
+    parser.add_argument("--constraints", help="constraint count weights, e.g. 1=0.7,8=0.3")
+    parser.add_argument("--context", help="context size weights, e.g. 4=0.9,256=0.1")
+    args = parser.parse_args()
+
+    distributions = {}
+    if args.mix:
+        distributions["mix"] = _weights(args.mix, str)
+    if args.constraints:
+        distributions["constraint_counts"] = _weights(args.constraints, int)
+    if args.context:
+        distributions["context_sizes"] = _weights(args.context, int)
+
+    if args.output == "-":
+        for line in generate_lines(args.count, args.seed, **distributions):
+            sys.stdout.write(line + "\n")
+    else:
+        write_ndjson(args.output, args.count, args.seed, **distributions)
@@ -0,0 +1,102 @@
+import json
+import os
+import tempfile
+from corpus import (
+    DICT_STRUCTURAL_KINDS,
+    build_line,
+    generate_lines,
+    write_ndjson
+)
+from decoder import decode_sentence
+from validator import validate
+
+
+# --------------------------------------------
+# Seeded Corpus Generator Tests
+# --------------------------------------------
+
+def test_same_seed_same_corpus():
+    first = list(generate_lines(2000, seed=7))
+    second = list(generate_lines(2000, seed=7))
+    other = list(generate_lines(2000, seed=8))
+
+    assert first == second, "Same seed produced different corpora"
+    assert first != other, "Different seeds produced the same corpus"
+
+
+def test_prefix_is_stable():
+    assert list(generate_lines(100, seed=3)) == list(generate_lines(10000, seed=3))[:100]
+
+
+def test_every_kind_validates_as_labelled():
+    for kind in DICT_STRUCTURAL_KINDS:
+        for count in (1, 2, 5):
+            result = validate(json.loads(build_line(kind, count, 3, variant=count)))
+            assert result.get("failure_class") == kind, f"{kind}: {result}"
+
+    for count in (1, 3, 6):
+        for variant in range(count):
+            allowed = validate(json.loads(build_line("Allowed", count, 2, variant)))
+            refused = validate(json.loads(build_line("Refused", count, 2, variant)))
+
+            assert allowed == {"classification": "Accepted + Allowed"}, allowed
+            assert refused["classification"] == "Accepted + Refused", refused
+            assert refused["reason"]["field"] == f"field_{variant}", refused
+
+
+def test_sf05_repeats_actor_key():
+    line = build_line("SF-05", 2, 2, variant=1)
+    assert line.count('"actor":') == 2, line
+
+    result = validate(decode_sentence(line))
+    assert result.get("failure_class") == "SF-05", result
+
+
+def test_mix_and_distributions_are_honoured():
+    lines = list(generate_lines(
+        500,
+        seed=1,
+        mix={"Refused": 1.0},
+        constraint_counts={3: 1.0},
+        context_sizes={10: 1.0}
+    ))
+
+    for line in lines:
+        sentence = json.loads(line)
+        assert len(sentence["constraints"]) == 3
+        assert len(sentence["context"]) == 10
+        assert validate(sentence)["classification"] == "Accepted + Refused"
+
+    failing = {json.loads(line)["reason"]["field"] for line in lines}
+    assert len(failing) == 3, f"Refusals should vary their failing index: {failing}"
+
+
+def test_unknown_kind_is_rejected():
+    try:
+        list(generate_lines(1, mix={"SF-99": 1.0}))
+    except ValueError:
+        return
+
+    raise AssertionError("Unknown corpus kind was accepted")
+
+
+def test_write_ndjson_matches_generator():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "corpus.ndjson")
+        write_ndjson(path, 9000, seed=5)
+
+        with open(path, encoding="utf-8") as f:
+            written = f.read().splitlines()
+
+    assert written == list(generate_lines(9000, seed=5))
+
+
+if __name__ == "__main__":
+    test_same_seed_same_corpus()
+    test_prefix_is_stable()
+    test_every_kind_validates_as_labelled()
+    test_sf05_repeats_actor_key()
+    test_mix_and_distributions_are_honoured()
+    test_unknown_kind_is_rejected()
+    test_write_ndjson_matches_generator()
+    print("Corpus generator tests passed.")
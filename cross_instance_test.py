@@ -0,0 +1,60 @@
+import itertools
+import threading
+import cross_validator_consistency
+from corpus import CORPUS
+from cross_validator_consistency import ValidatorInstance, verify_corpus
+from validator import validate
+
+
+# --------------------------------------------
+# Persistent Instance Line Protocol Tests
+# --------------------------------------------
+
+def test_instance_answers_each_line():
+    instance = ValidatorInstance()
+
+    try:
+        for sentence in CORPUS:
+            assert instance.validate(sentence) == validate(sentence)
+    finally:
+        instance.close()
+
+
+def test_verify_corpus_across_instances():
+    sentences = [CORPUS[i % len(CORPUS)] for i in range(300)]
+
+    assert verify_corpus(sentences, instances=2) == 300
+
+
+def test_mismatch_on_large_corpus_fails_fast():
+    # Far more input and output than a pipe buffer holds, so instances
+    # and feeders are still blocked on writes when the mismatch is found.
+    sentences = [CORPUS[i % len(CORPUS)] for i in range(20_000)]
+    outcome = []
+
+    def run():
+        try:
+            verify_corpus(sentences, instances=2)
+        except Exception as error:
+            outcome.append(str(error))
+
+    saved = cross_validator_consistency.hash_output
+    counter = itertools.count()
+    cross_validator_consistency.hash_output = lambda output: next(counter)
+
+    try:
+        runner = threading.Thread(target=run, daemon=True)
+        runner.start()
+        runner.join(timeout=60)
+    finally:
+        cross_validator_consistency.hash_output = saved
+
+    assert not runner.is_alive(), "verify_corpus hung after a mismatch"
+    assert outcome and outcome[0].startswith("Inconsistent outputs detected at sentence 0")
+
+
+if __name__ == "__main__":
+    test_instance_answers_each_line()
+    test_verify_corpus_across_instances()
+    test_mismatch_on_large_corpus_fails_fast()
+    print("Cross-instance line protocol tests passed.")
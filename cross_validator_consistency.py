@@ -1,9 +1,14 @@
+import argparse
 import json
-import hashlib
 import subprocess
 import sys
 import tempfile
+import threading
 import os
+from fingerprint import result_hash
+
+
+MAIN_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
 
 
 # --------------------------------------------
@@ -11,8 +16,7 @@ import os
 # --------------------------------------------
 
 def hash_output(output: dict) -> str:
-    serialized = json.dumps(output, sort_keys=True)
-    return hashlib.sha256(serialized.encode()).hexdigest()
+    return result_hash(output).hex()
 
 
 def run_external_instance(input_sentence: dict) -> dict:
@@ -41,6 +45,129 @@ def run_external_instance(input_sentence: dict) -> dict:
         os.remove(temp_file_path)
 
 
+# --------------------------------------------
+# Persistent Validator Instances (Line Protocol)
+# --------------------------------------------
+
+class ValidatorInstance:
+    """
+    A long-lived validator in its own Python interpreter, driven over
+    stdin/stdout with one compact JSON line per sentence and result.
+    """
+
+    def __init__(self):
+        self.process = subprocess.Popen(
+            [sys.executable, MAIN_SCRIPT, "--ndjson", "-", "--line-buffered"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8"
+        )
+
+    def send(self, line: str) -> None:
+        self.process.stdin.write(line)
+        self.process.stdin.write("\n")
+
+    def receive(self) -> dict:
+        line = self.process.stdout.readline()
+
+        if not line:
+            raise Exception(
+                f"Validator instance exited: {self.process.stderr.read()}"
+            )
+
+        return json.loads(line)
+
+    def validate(self, sentence: dict) -> dict:
+        self.send(json.dumps(sentence))
+        self.process.stdin.flush()
+        return self.receive()
+
+    def close(self) -> None:
+        if self.process.stdin and not self.process.stdin.closed:
+            self.process.stdin.close()
+
+        self.process.wait()
+        self.process.stdout.close()
+        self.process.stderr.close()
+
+    def kill(self) -> None:
+        """
+        Stops the instance without reading its remaining output, which
+        a child blocked on a full stdout pipe would otherwise wait for.
+        """
+
+        self.process.kill()
+        self.process.wait()
+
+
+def _feed(instance: ValidatorInstance, lines: list) -> None:
+    # Write errors mean the instance was stopped (killed after a
+    # mismatch, or exited); the reader reports what went wrong.
+    try:
+        for line in lines:
+            instance.send(line)
+    except (OSError, ValueError):
+        return
+    finally:
+        try:
+            instance.process.stdin.close()
+        except (OSError, ValueError):
+            pass
+
+
+def verify_corpus(sentences, instances: int = 2) -> int:
+    """
+    Sends every sentence to each of N persistent instances and
+    compares output hashes per sentence. Each instance is a separate
+    interpreter started once; input is fed from a thread per instance
+    so the pipes never deadlock. Returns the number of sentences.
+    """
+
+    if instances < 2:
+        raise ValueError("Cross-instance consistency needs at least 2 instances")
+
+    lines = [json.dumps(sentence) for sentence in sentences]
+    pool = [ValidatorInstance() for _ in range(instances)]
+
+    feeders = [
+        threading.Thread(target=_feed, args=(instance, lines), daemon=True)
+        for instance in pool
+    ]
+
+    try:
+        for feeder in feeders:
+            feeder.start()
+
+        for ordinal, line in enumerate(lines):
+            outputs = [instance.receive() for instance in pool]
+            hashes = {hash_output(output) for output in outputs}
+
+            if len(hashes) != 1:
+                raise Exception(
+                    f"Inconsistent outputs detected at sentence {ordinal}\n"
+                    f"Input: {line}\n"
+                    f"Outputs: {outputs}"
+                )
+    except BaseException:
+        # Instances may still be writing results nobody will read and
+        # feeders may still be writing input: stop the instances first,
+        # which unblocks the feeders, then join them.
+        for instance in pool:
+            instance.kill()
+
+        raise
+    finally:
+        for feeder in feeders:
+            feeder.join()
+
+        for instance in pool:
+            instance.close()
+
+    return len(lines)
+
+
 # --------------------------------------------
 # Test Sentences
 # --------------------------------------------
@@ -101,15 +228,32 @@ def verify_cross_instance(sentence: dict):
 # Run Script
 # --------------------------------------------
 
+def read_ndjson(path: str):
+    with open(path, "r", encoding="utf-8") as source:
+        for line in source:
+            if line.strip():
+                yield json.loads(line)
+
+
 if __name__ == "__main__":
 
-    print("Testing Allowed case...")
-    verify_cross_instance(VALID_ALLOWED)
+    parser = argparse.ArgumentParser(description="Cross-validator consistency")
+    parser.add_argument("corpus", nargs="?", help="NDJSON corpus to verify")
+    parser.add_argument("--instances", type=int, default=2)
+    args = parser.parse_args()
+
+    if args.corpus:
+        count = verify_corpus(read_ndjson(args.corpus), args.instances)
+        print(f"Consistent outputs for {count} sentences "
+              f"across {args.instances} instances.")
+    else:
+        print("Testing Allowed case...")
+        verify_cross_instance(VALID_ALLOWED)
 
-    print("Testing Refused case...")
-    verify_cross_instance(VALID_REFUSED)
+        print("Testing Refused case...")
+        verify_cross_instance(VALID_REFUSED)
 
-    print("Testing Structural case...")
-    verify_cross_instance(STRUCTURAL_INVALID)
+        print("Testing Structural case...")
+        verify_cross_instance(STRUCTURAL_INVALID)
 
-    print("Cross-validator consistency verified.")
+        print("Cross-validator consistency verified.")
@@ -0,0 +1,370 @@
+import argparse
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from main import encode_result, validate_line
+from structural import DEFAULT_BUDGETS, InputBudgets
+
+
+# --------------------------------------------
+# Local Validation Daemon (asyncio, NDJSON)
+# --------------------------------------------
+#
+# Clients send one sentence per line and receive one compact result per
+# line, in request order, on the same connection. Requests may be
+# pipelined. Lines from all connections feed one queue, bounded both in
+# lines and in bytes (counted until a line's batch is answered); a
+# batcher drains it into micro-batches, each validated with a single
+# executor hop, with up to batches_in_flight hops running at once and
+# answered in dispatch order. A full queue stops reading from clients,
+# and a client that stops reading its responses stops being read from
+# (backpressure).
+#
+# Control lines (not valid JSON, so they cannot collide with sentences):
+#   HEALTH  ->  {"status": "ok"}
+#   STATS   ->  server counters as a JSON object
+#
+# A line that cannot be answered with a result (it is longer than the
+# frame limit, or validating it raised) is answered with
+#   {"error": "<reason>"}
+# in its place, so every request still gets exactly one response line.
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_QUEUE_SIZE = 4096
+DEFAULT_QUEUE_BYTES = 64 << 20
+DEFAULT_PIPELINE_DEPTH = 1024
+
+
+def frame_limit(budgets: InputBudgets = DEFAULT_BUDGETS) -> int:
+    """
+    Longest accepted request line, in bytes: room for max_values short
+    values with their keys and separators, plus one string at the
+    string budget with every character \\u-escaped.
+    """
+
+    return budgets.max_values * 64 + budgets.max_string_length * 6
+
+
+def error_line(message: str) -> str:
+    return encode_result({"error": message})
+
+
+def encode_batch(lines: list) -> list:
+    """
+    Encodes one result per line. A line whose validation raises is
+    answered with an error line, so it cannot fail the rest of its batch.
+    """
+
+    encoded = []
+
+    for line in lines:
+        try:
+            encoded.append(encode_result(validate_line(line)))
+        except Exception as e:
+            encoded.append(error_line(f"{type(e).__name__}: {e}"))
+
+    return encoded
+
+
+class ValidationServer:
+
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        pipeline_depth: int = DEFAULT_PIPELINE_DEPTH,
+        executor=None,
+        max_line_bytes: int = None,
+        queue_bytes: int = DEFAULT_QUEUE_BYTES,
+        batches_in_flight: int = 1
+    ):
+        if batches_in_flight < 1:
+            raise ValueError("batches_in_flight must be positive")
+
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.pipeline_depth = pipeline_depth
+        self.executor = executor
+        self.max_line_bytes = frame_limit() if max_line_bytes is None else max_line_bytes
+        self.queue_bytes = queue_bytes
+        self.batches_in_flight = batches_in_flight
+
+        self.started = time.monotonic()
+        self.connections = 0
+        self.active_connections = 0
+        self.requests = 0
+        self.batches = 0
+
+        self._queue = None
+        self._queued_bytes = 0
+        self._space = None
+        self._batcher = None
+        self._server = None
+
+    # ---------- Lifecycle ----------
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0):
+        self._start_batcher()
+        self._server = await asyncio.start_server(
+            self._handle, host, port, limit=self.max_line_bytes
+        )
+        return self._server.sockets[0].getsockname()
+
+    async def start_unix(self, path: str):
+        self._start_batcher()
+        self._server = await asyncio.start_unix_server(
+            self._handle, path, limit=self.max_line_bytes
+        )
+        return path
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+        if self._batcher is not None:
+            self._batcher.cancel()
+
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+
+    def _start_batcher(self):
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._space = asyncio.Condition()
+        self._batcher = asyncio.create_task(self._run_batches())
+
+    # ---------- Stats ----------
+
+    def stats(self) -> dict:
+        return {
+            "uptime_seconds": round(time.monotonic() - self.started, 3),
+            "connections": self.connections,
+            "active_connections": self.active_connections,
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch_size": self.requests / self.batches if self.batches else 0.0,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "queue_size": self.queue_size,
+            "queued_bytes": self._queued_bytes,
+            "queue_bytes": self.queue_bytes
+        }
+
+    def _control(self, command: str):
+        if command == "HEALTH":
+            return encode_result({"status": "ok"})
+
+        if command == "STATS":
+            return encode_result(self.stats())
+
+        return None
+
+    # ---------- Micro-Batching ----------
+
+    async def _enqueue(self, line: str, future, size: int):
+        # A line larger than the whole byte budget still gets in once
+        # nothing else is queued.
+        async with self._space:
+            await self._space.wait_for(
+                lambda: not self._queued_bytes or
+                self._queued_bytes + size <= self.queue_bytes
+            )
+            self._queued_bytes += size
+
+        await self._queue.put((line, future, size))
+
+    async def _next_batch(self) -> list:
+        batch = [await self._queue.get()]
+
+        # Let concurrently scheduled producers enqueue before draining.
+        await asyncio.sleep(0)
+
+        while len(batch) < self.batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+        return batch
+
+    async def _run_batches(self):
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(self.batches_in_flight)
+        dispatched = asyncio.Queue()
+        resolver = asyncio.create_task(self._resolve_batches(dispatched, slots))
+
+        try:
+            while True:
+                # Waiting for a slot first lets requests pile up into
+                # the next batch while every slot is busy.
+                await slots.acquire()
+                batch = await self._next_batch()
+                lines = [line for line, _, _ in batch]
+                dispatched.put_nowait(
+                    (batch, loop.run_in_executor(self.executor, encode_batch, lines))
+                )
+        finally:
+            resolver.cancel()
+
+    async def _resolve_batches(self, dispatched: asyncio.Queue, slots: asyncio.Semaphore):
+        while True:
+            batch, pending = await dispatched.get()
+
+            try:
+                encoded = await pending
+            except Exception as e:
+                # The executor itself failed (e.g. a broken process pool).
+                encoded = [error_line(f"{type(e).__name__}: {e}")] * len(batch)
+            finally:
+                slots.release()
+
+            self.batches += 1
+            self.requests += len(batch)
+
+            for (_, future, _), result in zip(batch, encoded):
+                if not future.done():
+                    future.set_result(result)
+
+            async with self._space:
+                self._queued_bytes -= sum(size for _, _, size in batch)
+                self._space.notify_all()
+
+    # ---------- Connections ----------
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        self.active_connections += 1
+
+        responses = asyncio.Queue(maxsize=self.pipeline_depth)
+        sender = asyncio.create_task(self._send(responses, writer))
+        loop = asyncio.get_running_loop()
+
+        try:
+            while True:
+                raw = await self._read_frame(reader)
+
+                if raw is None:
+                    future = loop.create_future()
+                    future.set_result(
+                        error_line(f"Line longer than {self.max_line_bytes} bytes")
+                    )
+                    await responses.put(future)
+                    continue
+
+                if not raw:
+                    break
+
+                line = raw.decode("utf-8", "replace").strip()
+
+                if not line:
+                    continue
+
+                future = loop.create_future()
+                control = self._control(line)
+
+                if control is not None:
+                    future.set_result(control)
+                    await responses.put(future)
+                    continue
+
+                await responses.put(future)
+                await self._enqueue(line, future, len(raw))
+
+            await responses.put(None)
+            await sender
+        finally:
+            if not sender.done():
+                sender.cancel()
+
+            self.active_connections -= 1
+            writer.close()
+
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    async def _read_frame(reader):
+        # Returns the next line (b"" at end of stream), or None for a
+        # line over the reader's limit, which is discarded up to and
+        # including its newline so the next request starts cleanly.
+        try:
+            return await reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            return e.partial
+        except asyncio.LimitOverrunError as e:
+            consumed = e.consumed
+
+        while True:
+            try:
+                await reader.readexactly(consumed)
+                await reader.readuntil(b"\n")
+                return None
+            except asyncio.IncompleteReadError:
+                return None
+            except asyncio.LimitOverrunError as e:
+                consumed = e.consumed
+
+    async def _send(self, responses: asyncio.Queue, writer):
+        while True:
+            future = await responses.get()
+
+            if future is None:
+                return
+
+            writer.write((await future).encode("utf-8") + b"\n")
+
+            # Waits only while the transport buffer is over its high-water
+            # mark, i.e. while the client is not reading.
+            await writer.drain()
+
+
+# --------------------------------------------
+# Run Daemon
+# --------------------------------------------
+
+async def serve(args):
+    executor = ProcessPoolExecutor(args.workers) if args.workers > 1 else None
+    server = ValidationServer(
+        args.batch_size,
+        args.queue_size,
+        executor=executor,
+        queue_bytes=args.queue_mb << 20,
+        batches_in_flight=max(args.workers, 1)
+    )
+
+    if args.unix:
+        address = await server.start_unix(args.unix)
+    else:
+        address = await server.start_tcp(args.host, args.port)
+
+    print(f"Validation daemon listening on {address}", flush=True)
+
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+        if executor is not None:
+            executor.shutdown()
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Local validation daemon")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on a Unix socket path instead")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE)
+    parser.add_argument("--queue-mb", type=int, default=DEFAULT_QUEUE_BYTES >> 20,
+                        help="bytes of queued request lines, in MiB")
+    parser.add_argument("--workers", type=int, default=1)
+
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,227 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import daemon
+from corpus import CORPUS
+from daemon import ValidationServer
+from main import validate_line
+from validator import validate
+
+
+# --------------------------------------------
+# Validation Daemon Tests (Local Client)
+# --------------------------------------------
+
+async def exchange(port: int, lines: list) -> list:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+    # Pipelined: every request is written before any response is read.
+    writer.write("".join(line + "\n" for line in lines).encode())
+    await writer.drain()
+
+    responses = [json.loads(await reader.readline()) for _ in lines]
+
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+
+async def with_server(scenario, **options):
+    server = ValidationServer(**options)
+    _, port = await server.start_tcp()
+
+    try:
+        return await scenario(server, port)
+    finally:
+        await server.close()
+
+
+def test_pipelined_results_in_order():
+    sentences = [CORPUS[i % len(CORPUS)] for i in range(50)]
+
+    async def scenario(server, port):
+        return await exchange(port, [json.dumps(s) for s in sentences])
+
+    responses = asyncio.run(with_server(scenario))
+
+    assert responses == [validate(s) for s in sentences]
+
+
+def test_concurrent_clients_share_micro_batches():
+    async def scenario(server, port):
+        batches = await asyncio.gather(*[
+            exchange(port, [json.dumps(s) for s in CORPUS] * 20)
+            for _ in range(4)
+        ])
+        return batches, server.stats()
+
+    batches, stats = asyncio.run(with_server(scenario, batch_size=32, queue_size=16))
+
+    expected = [validate(s) for s in CORPUS] * 20
+
+    assert all(batch == expected for batch in batches)
+    assert stats["requests"] == 240
+    assert stats["batches"] < stats["requests"], f"No batching: {stats}"
+
+
+def test_health_and_stats_endpoint():
+    async def scenario(server, port):
+        return await exchange(port, ["HEALTH", json.dumps(CORPUS[0]), "STATS"])
+
+    health, result, stats = asyncio.run(with_server(scenario))
+
+    assert health == {"status": "ok"}
+    assert result == validate(CORPUS[0])
+    assert stats["connections"] == 1 and "queue_depth" in stats
+
+
+def test_failing_sentence_does_not_poison_batch():
+    def validate_or_raise(line):
+        if "raise" in line:
+            raise TypeError("forced failure")
+
+        return validate_line(line)
+
+    async def scenario(server, port):
+        return await asyncio.gather(
+            exchange(port, ['"raise"']),
+            exchange(port, [json.dumps(CORPUS[0])])
+        )
+
+    # The default executor runs batches in threads of this process.
+    daemon.validate_line = validate_or_raise
+
+    try:
+        (failed,), (answered,) = asyncio.run(with_server(scenario))
+    finally:
+        daemon.validate_line = validate_line
+
+    assert failed["error"].startswith("TypeError")
+    assert answered == validate(CORPUS[0])
+
+
+def test_frame_limit():
+    within_budgets = dict(
+        CORPUS[0],
+        context={f"field_{i:05d}": "x" * 10 for i in range(5000)}
+    )
+    oversized = json.dumps({"context": "x" * 200_000})
+
+    async def scenario(server, port):
+        return await exchange(port, [
+            json.dumps(within_budgets), oversized, json.dumps(CORPUS[0])
+        ])
+
+    large, rejected, after = asyncio.run(with_server(scenario, max_line_bytes=150_000))
+
+    assert large == validate(within_budgets)
+    assert rejected["error"] == "Line longer than 150000 bytes"
+    assert after == validate(CORPUS[0])
+
+
+def run_with_slow_batches(scenario, **options):
+    # Each batch takes 20 ms; records how many run at once.
+    state = {"running": 0, "peak": 0}
+    lock = threading.Lock()
+    encode_batch = daemon.encode_batch
+
+    def slow_batch(lines):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+
+        time.sleep(0.02)
+
+        with lock:
+            state["running"] -= 1
+
+        return encode_batch(lines)
+
+    daemon.encode_batch = slow_batch
+
+    try:
+        return asyncio.run(with_server(scenario, **options)), state["peak"]
+    finally:
+        daemon.encode_batch = encode_batch
+
+
+def test_batches_in_flight():
+    sentences = [CORPUS[i % len(CORPUS)] for i in range(12)]
+
+    async def scenario(server, port):
+        return await asyncio.gather(*[exchange(port, [json.dumps(s)]) for s in sentences])
+
+    with ThreadPoolExecutor(3) as executor:
+        responses, peak = run_with_slow_batches(
+            scenario, batch_size=1, executor=executor, batches_in_flight=3
+        )
+
+    assert [r for (r,) in responses] == [validate(s) for s in sentences]
+    assert peak == 3, f"Batches did not overlap: peak {peak}"
+
+
+def test_queue_bounded_by_bytes():
+    lines = [json.dumps(CORPUS[i % len(CORPUS)]) for i in range(40)]
+    observed = []
+
+    async def scenario(server, port):
+        async def watch():
+            while True:
+                observed.append(server.stats()["queued_bytes"])
+                await asyncio.sleep(0.001)
+
+        watcher = asyncio.create_task(watch())
+
+        try:
+            return await exchange(port, lines)
+        finally:
+            watcher.cancel()
+
+    limit = 2 * max(map(len, lines)) + 2
+    responses, _ = run_with_slow_batches(scenario, queue_bytes=limit)
+
+    assert responses == [json.loads(daemon.encode_batch([line])[0]) for line in lines]
+    assert 0 < max(observed) <= limit, max(observed)
+
+
+def test_every_response_is_drained():
+    class Writer:
+        def __init__(self):
+            self.events = []
+
+        def write(self, data):
+            self.events.append("write")
+
+        async def drain(self):
+            self.events.append("drain")
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        responses = asyncio.Queue()
+
+        for i in range(3):
+            future = loop.create_future()
+            future.set_result(str(i))
+            responses.put_nowait(future)
+
+        responses.put_nowait(None)
+        writer = Writer()
+        await ValidationServer()._send(responses, writer)
+        return writer.events
+
+    # A client that never reads must not let the write buffer grow.
+    assert asyncio.run(scenario()) == ["write", "drain"] * 3
+
+
+if __name__ == "__main__":
+    test_pipelined_results_in_order()
+    test_concurrent_clients_share_micro_batches()
+    test_health_and_stats_endpoint()
+    test_failing_sentence_does_not_poison_batch()
+    test_frame_limit()
+    test_batches_in_flight()
+    test_queue_bounded_by_bytes()
+    test_every_response_is_drained()
+    print("Validation daemon tests passed.")
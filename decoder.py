@@ -0,0 +1,75 @@
+import json
+
+
+# --------------------------------------------
+# Duplicate-Aware Sentence Decoder
+# --------------------------------------------
+#
+# Plain json.loads keeps the last value of a repeated key and forgets
+# the repetition, which hides SF-05 from the structural phase. This
+# decoder sees every object's key/value pairs while parsing. Objects
+# without repeated keys are returned as plain dictionaries, whose
+# insertion order is the key sequence structural.py checks for
+# canonical order. Objects with repeated keys come back as
+# DuplicateKeyDict, recording the repeated keys and the full key
+# sequence; the dictionary itself keeps first-occurrence order and
+# last-occurrence values, exactly like json.loads.
+
+
+class DuplicateKeyDict(dict):
+    """
+    A decoded JSON object whose text repeated one or more keys.
+    """
+
+    def __init__(self, pairs: list):
+        super().__init__(pairs)
+        self.key_sequence = tuple(key for key, _ in pairs)
+
+        seen = set()
+        duplicates = []
+
+        for key in self.key_sequence:
+            if key in seen and key not in duplicates:
+                duplicates.append(key)
+            seen.add(key)
+
+        self.duplicate_keys = tuple(duplicates)
+
+    def __repr__(self) -> str:
+        # Distinct from the collapsed dictionary, so repr-keyed caches
+        # and fingerprints never confuse the two.
+        return (
+            f"DuplicateKeyDict({dict.__repr__(self)}, "
+            f"duplicate_keys={self.duplicate_keys!r})"
+        )
+
+
+def _object(pairs: list) -> dict:
+    obj = dict(pairs)
+
+    if len(obj) != len(pairs):
+        return DuplicateKeyDict(pairs)
+
+    return obj
+
+
+_DECODER = json.JSONDecoder(object_pairs_hook=_object)
+
+
+def decode_sentence(text: str):
+    """
+    Decodes one JSON document. Raises json.JSONDecodeError (a
+    ValueError) on malformed input.
+    """
+    return _DECODER.decode(text)
+
+
+def load_sentence(f):
+    return decode_sentence(f.read())
+
+
+def duplicate_keys(obj) -> tuple:
+    """
+    Keys repeated in the text of a decoded object (empty if none).
+    """
+    return getattr(obj, "duplicate_keys", ())
@@ -0,0 +1,77 @@
+import json
+from decoder import DuplicateKeyDict, decode_sentence, duplicate_keys
+from main import validate_line
+from result_cache import sentence_key
+
+
+# --------------------------------------------
+# Duplicate-Aware Decoder Tests
+# --------------------------------------------
+
+VALID_TEXT = json.dumps({
+    "actor": "User_001",
+    "intent": "Transfer",
+    "context": {"balance": 5000},
+    "constraints": [{"field": "balance", "value": 5000}],
+    "outcome": "Allowed"
+})
+
+DUPLICATE_TEXT = VALID_TEXT.replace(
+    '"intent": "Transfer"',
+    '"intent": "Transfer", "actor": "User_002"'
+)
+
+
+def test_plain_objects_decode_like_json_loads():
+    decoded = decode_sentence(VALID_TEXT)
+
+    assert type(decoded) is dict
+    assert decoded == json.loads(VALID_TEXT)
+    assert list(decoded) == list(json.loads(VALID_TEXT))
+    assert duplicate_keys(decoded) == ()
+
+
+def test_duplicates_are_recorded():
+    decoded = decode_sentence(DUPLICATE_TEXT)
+
+    assert isinstance(decoded, DuplicateKeyDict)
+    assert decoded == json.loads(DUPLICATE_TEXT), "Values must match json.loads"
+    assert duplicate_keys(decoded) == ("actor",)
+    assert decoded.key_sequence == (
+        "actor", "intent", "actor", "context", "constraints", "outcome"
+    )
+
+
+def test_escaped_duplicate_is_detected():
+    text = VALID_TEXT.replace('"intent"', '"\\u0061ctor": "x", "intent"')
+    assert duplicate_keys(decode_sentence(text)) == ("actor",)
+
+
+def test_duplicate_primitive_is_sf05():
+    result = validate_line(DUPLICATE_TEXT)
+    assert result["failure_class"] == "SF-05", result
+
+
+def test_duplicates_keep_canonical_order_checks():
+    text = VALID_TEXT.replace(
+        '"outcome": "Allowed"',
+        '"outcome": "Allowed", "intent": "Again"'
+    ).replace('"actor": "User_001", ', '"intent": "First", "actor": "User_001", ')
+
+    result = validate_line(text)
+    assert result["failure_class"] == "SF-04", result
+
+
+def test_cache_keys_differ_from_collapsed_sentence():
+    assert sentence_key(decode_sentence(DUPLICATE_TEXT)) != \
+        sentence_key(json.loads(DUPLICATE_TEXT))
+
+
+if __name__ == "__main__":
+    test_plain_objects_decode_like_json_loads()
+    test_duplicates_are_recorded()
+    test_escaped_duplicate_is_detected()
+    test_duplicate_primitive_is_sf05()
+    test_duplicates_keep_canonical_order_checks()
+    test_cache_keys_differ_from_collapsed_sentence()
+    print("Decoder tests passed.")
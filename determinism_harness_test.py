@@ -0,0 +1,60 @@
+import determinism_harness
+from determinism_harness import check_sentence, VALID_REFUSED
+from validator import validate
+
+
+# --------------------------------------------
+# Determinism Harness Self-Tests
+# --------------------------------------------
+
+def expect_violation(fake_validate):
+    saved = determinism_harness.validate
+    determinism_harness.validate = fake_validate
+
+    try:
+        check_sentence(VALID_REFUSED, iterations=50, block_size=20)
+    except Exception as e:
+        assert "Determinism violated" in str(e), str(e)
+    else:
+        raise AssertionError("Harness missed a determinism violation")
+    finally:
+        determinism_harness.validate = saved
+
+
+def test_report_on_pass():
+    report = check_sentence(VALID_REFUSED, iterations=100, block_size=30)
+
+    assert report["verdict"] == "pass"
+    assert report["iterations"] == 100
+    assert report["runs_per_second"] > 0
+    assert report["baseline_hash"] == \
+        determinism_harness.hash_output(validate(VALID_REFUSED))
+
+
+def test_detects_drifting_output():
+    calls = []
+
+    def drifting(sentence):
+        calls.append(1)
+        result = validate(sentence)
+        if len(calls) == 30:
+            result["classification"] = "Accepted + Allowed"
+        return result
+
+    expect_violation(drifting)
+
+
+def test_detects_input_mutation():
+    def mutating(sentence):
+        result = validate(sentence)
+        sentence["context"]["balance"] += 1
+        return result
+
+    expect_violation(mutating)
+
+
+if __name__ == "__main__":
+    test_report_on_pass()
+    test_detects_drifting_output()
+    test_detects_input_mutation()
+    print("Determinism harness self-tests passed.")
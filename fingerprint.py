@@ -0,0 +1,201 @@
+import argparse
+import hashlib
+import json
+
+
+# --------------------------------------------
+# Merkle Fingerprint of Batch Outputs
+# --------------------------------------------
+#
+# Leaf i is the SHA-256 of result i serialized with sorted keys (the
+# per-result hash the harnesses have always used); each interior node
+# is SHA-256(0x01 || left || right), and a node without a right sibling
+# is carried up unchanged. Equal roots mean equal runs; when roots
+# differ, descending into the differing child locates the first
+# differing result in O(log n) comparisons.
+#
+# RollingFingerprint computes the same root in O(log n) memory for
+# streams; MerkleTree keeps every level so it can be compared, saved
+# and reloaded as a run artifact.
+
+_NODE = b"\x01"
+
+ARTIFACT_MAGIC = b"SLMT1"
+
+
+def result_hash(result: dict) -> bytes:
+    serialized = json.dumps(result, sort_keys=True)
+    return hashlib.sha256(serialized.encode()).digest()
+
+
+def _node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE + left + right).digest()
+
+
+class RollingFingerprint:
+    """
+    Streaming Merkle root: keeps one pending subtree per level.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._pending = []      # (height, hash), heights strictly decreasing
+
+    def add(self, result: dict):
+        self.add_leaf(result_hash(result))
+
+    def add_leaf(self, leaf: bytes):
+        height = 0
+
+        while self._pending and self._pending[-1][0] == height:
+            _, left = self._pending.pop()
+            leaf = _node(left, leaf)
+            height += 1
+
+        self._pending.append((height, leaf))
+        self.count += 1
+
+    def root(self) -> bytes:
+        if not self._pending:
+            return hashlib.sha256(b"").digest()
+
+        root = self._pending[-1][1]
+
+        for _, left in reversed(self._pending[:-1]):
+            root = _node(left, root)
+
+        return root
+
+    def hexdigest(self) -> str:
+        return self.root().hex()
+
+
+class MerkleTree:
+
+    def __init__(self, leaves):
+        self.levels = [list(leaves)]
+
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            parents = [_node(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+
+            if len(level) % 2:
+                parents.append(level[-1])
+
+            self.levels.append(parents)
+
+    @classmethod
+    def from_results(cls, results) -> "MerkleTree":
+        return cls(map(result_hash, results))
+
+    @property
+    def leaves(self) -> list:
+        return self.levels[0]
+
+    def __len__(self) -> int:
+        return len(self.levels[0])
+
+    def root(self) -> bytes:
+        if not self.levels[0]:
+            return hashlib.sha256(b"").digest()
+
+        return self.levels[-1][0]
+
+    def hexdigest(self) -> str:
+        return self.root().hex()
+
+    # ---------- Artifact ----------
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            f.write(ARTIFACT_MAGIC)
+            f.write(len(self).to_bytes(8, "big"))
+            f.write(b"".join(self.leaves))
+
+    @classmethod
+    def load(cls, path: str) -> "MerkleTree":
+        with open(path, "rb") as f:
+            data = f.read()
+
+        if not data.startswith(ARTIFACT_MAGIC):
+            raise ValueError(f"{path} is not a fingerprint artifact")
+
+        start = len(ARTIFACT_MAGIC) + 8
+        count = int.from_bytes(data[len(ARTIFACT_MAGIC):start], "big")
+
+        if len(data) != start + 32 * count:
+            raise ValueError(f"{path} is truncated")
+
+        return cls(data[i:i + 32] for i in range(start, len(data), 32))
+
+
+def first_difference(a: MerkleTree, b: MerkleTree):
+    """
+    Index of the first result that differs between two runs, or None
+    if they are identical. A run that is a strict prefix of the other
+    differs at the shorter run's length.
+    """
+
+    if len(a) != len(b):
+        shorter = min(len(a), len(b))
+
+        if shorter and a.leaves[:shorter] != b.leaves[:shorter]:
+            return first_difference(MerkleTree(a.leaves[:shorter]), MerkleTree(b.leaves[:shorter]))
+
+        return shorter
+
+    if a.root() == b.root():
+        return None
+
+    index = 0
+
+    for level in range(len(a.levels) - 2, -1, -1):
+        left = 2 * index
+        index = left if a.levels[level][left] != b.levels[level][left] else left + 1
+
+    return index
+
+
+def tree_from_ndjson(path: str) -> MerkleTree:
+    """
+    Fingerprint of a results file (one JSON result per line).
+    """
+
+    with open(path, "r", encoding="utf-8") as f:
+        return MerkleTree.from_results(json.loads(line) for line in f if line.strip())
+
+
+def _load_any(path: str) -> MerkleTree:
+    with open(path, "rb") as f:
+        is_artifact = f.read(len(ARTIFACT_MAGIC)) == ARTIFACT_MAGIC
+
+    return MerkleTree.load(path) if is_artifact else tree_from_ndjson(path)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Merkle fingerprint of validator results")
+    parser.add_argument("results", help="NDJSON results or a saved fingerprint")
+    parser.add_argument("other", nargs="?", help="second run to compare against")
+    parser.add_argument("--save", metavar="PATH", help="save the fingerprint artifact")
+    args = parser.parse_args()
+
+    tree = _load_any(args.results)
+
+    if args.save:
+        tree.save(args.save)
+
+    if args.other is None:
+        print(json.dumps({"results": len(tree), "root": tree.hexdigest()}))
+    else:
+        other = _load_any(args.other)
+        index = first_difference(tree, other)
+
+        print(json.dumps({
+            "identical": index is None,
+            "first_difference": index,
+            "roots": [tree.hexdigest(), other.hexdigest()]
+        }))
+
+        if index is not None:
+            raise SystemExit(1)
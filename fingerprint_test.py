@@ -0,0 +1,96 @@
+import json
+import os
+import random
+import tempfile
+from corpus import CORPUS
+from determinism_harness import hash_output, run_corpus
+from fingerprint import (
+    MerkleTree,
+    RollingFingerprint,
+    first_difference,
+    result_hash,
+    tree_from_ndjson
+)
+from validator import validate
+
+
+# --------------------------------------------
+# Merkle Fingerprint Tests
+# --------------------------------------------
+
+def results(count: int) -> list:
+    return [{"classification": "Accepted + Allowed", "n": i} for i in range(count)]
+
+
+def test_rolling_root_matches_tree():
+    for count in range(0, 40):
+        rolling = RollingFingerprint()
+
+        for result in results(count):
+            rolling.add(result)
+
+        assert rolling.root() == MerkleTree.from_results(results(count)).root(), count
+
+
+def test_leaves_are_the_harness_hashes():
+    result = {"classification": "Accepted + Refused", "reason": {"value": 1, "field": "a"}}
+    assert result_hash(result).hex() == hash_output(result)
+
+
+def test_first_difference_is_located():
+    rng = random.Random(2)
+
+    for count in (1, 2, 7, 64, 1000):
+        base = results(count)
+        tree = MerkleTree.from_results(base)
+        assert first_difference(tree, MerkleTree.from_results(base)) is None
+
+        for _ in range(10):
+            changed = [dict(r) for r in base]
+            positions = sorted(rng.sample(range(count), min(3, count)))
+
+            for position in positions:
+                changed[position]["n"] = -1
+
+            assert first_difference(tree, MerkleTree.from_results(changed)) == positions[0]
+
+
+def test_different_lengths():
+    short = MerkleTree.from_results(results(5))
+    longer = MerkleTree.from_results(results(9))
+    assert first_difference(short, longer) == 5
+
+    altered = results(9)
+    altered[3]["n"] = -1
+    assert first_difference(short, MerkleTree.from_results(altered)) == 3
+
+
+def test_artifact_round_trip():
+    tree = MerkleTree.from_results(results(33))
+
+    with tempfile.TemporaryDirectory() as directory:
+        artifact = os.path.join(directory, "run.merkle")
+        tree.save(artifact)
+        assert MerkleTree.load(artifact).root() == tree.root()
+
+        ndjson = os.path.join(directory, "results.ndjson")
+        with open(ndjson, "w") as f:
+            f.write("".join(json.dumps(r) + "\n" for r in results(33)))
+
+        assert tree_from_ndjson(ndjson).root() == tree.root()
+
+
+def test_determinism_corpus_reports_root():
+    report = run_corpus(CORPUS, iterations=3)
+    expected = MerkleTree.from_results(validate(sentence) for sentence in CORPUS)
+    assert report["merkle_root"] == expected.hexdigest()
+
+
+if __name__ == "__main__":
+    test_rolling_root_matches_tree()
+    test_leaves_are_the_harness_hashes()
+    test_first_difference_is_located()
+    test_different_lengths()
+    test_artifact_round_trip()
+    test_determinism_corpus_reports_root()
+    print("Merkle fingerprint tests passed.")
@@ -22,3 +22,13 @@ CANONICAL_ORDER = [
 ]
 
 VALID_OUTCOMES = {"Allowed", "Refused"}
+
+# Constraint operators. A constraint without "op" is an equality check.
+#   eq       context[field] == value
+#   in       context[field] is one of value (a list of scalars)
+#   not_in   context[field] is none of value (a list of scalars)
+#   between  value[0] <= context[field] <= value[1] (numbers, inclusive)
+
+CONSTRAINT_OPERATORS = ("eq", "in", "not_in", "between")
+
+DEFAULT_OPERATOR = "eq"
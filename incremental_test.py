@@ -0,0 +1,91 @@
+import random
+from corpus import build_sentence
+from model import Sentence
+from semantic import compile_constraints, reevaluate_constraints
+from validator import revalidate, validate
+
+
+# --------------------------------------------
+# Incremental Revalidation Tests
+# --------------------------------------------
+
+def test_failure_moves_earlier_and_later():
+    s = build_sentence(4, 4, refused=True, failing_index=2)
+    previous = validate(s)
+    assert previous["reason"]["field"] == "field_2"
+
+    earlier = revalidate(s, previous, {"field_0": -5})
+    assert earlier == validate(s) and earlier["reason"]["field"] == "field_0"
+
+    restored = revalidate(s, earlier, {"field_0": 0, "field_2": 2})
+    assert restored == validate(s) == {"classification": "Accepted + Allowed"}
+
+
+def test_removed_field_fails_its_constraint():
+    s = build_sentence(3, 3)
+    result = revalidate(s, validate(s), removed=["field_1"])
+
+    assert "field_1" not in s["context"]
+    assert result["reason"] == {"field": "field_1", "value": 1}
+
+
+def test_primitive_delta_falls_back_to_structural_check():
+    s = build_sentence(2, 2)
+    result = revalidate(s, validate(s), {"actor": "Injected"})
+    assert result["failure_class"] == "SF-10", result
+
+    fixed = revalidate(s, result, removed=["actor"])
+    assert fixed == {"classification": "Accepted + Allowed"}
+
+
+def test_reevaluate_matches_full_evaluation():
+    rng = random.Random(3)
+    plan_cache = {}
+
+    for _ in range(2000):
+        n = rng.randint(1, 6)
+        constraints = [
+            {"field": f"f{rng.randint(0, n)}", "value": rng.randint(0, 1)}
+            for _ in range(n)
+        ]
+        context = {f"f{i}": rng.randint(0, 1) for i in range(n + 1)}
+        compact = rng.random() < 0.5
+        s = {
+            "actor": "u",
+            "intent": "t",
+            "context": context,
+            "constraints": constraints,
+            "outcome": "Allowed"
+        }
+
+        if compact:
+            s = Sentence.from_dict(s)
+
+        previous = validate(s)
+        key = repr(constraints)
+        plan = plan_cache.setdefault(key, compile_constraints(constraints))
+
+        for _ in range(4):
+            delta = {f"f{rng.randint(0, n + 1)}": rng.randint(0, 1)}
+            removed = [f"f{rng.randint(0, n + 1)}"] if rng.random() < 0.3 else []
+            previous = revalidate(s, previous, delta, removed, plan=None if compact else plan)
+            assert previous == validate(s), (s, delta, removed)
+
+
+def test_reevaluate_constraints_direct():
+    constraints = [{"field": "a", "value": 1}, {"field": "b", "value": 2}]
+
+    result = reevaluate_constraints(constraints, {"a": 1, "b": 2}, 1, {"b"})
+    assert result["status"] == "Satisfied"
+
+    result = reevaluate_constraints(constraints, {"a": 0, "b": 2}, None, {"a"})
+    assert result["failed_index"] == 0
+
+
+if __name__ == "__main__":
+    test_failure_moves_earlier_and_later()
+    test_removed_field_fails_its_constraint()
+    test_primitive_delta_falls_back_to_structural_check()
+    test_reevaluate_matches_full_evaluation()
+    test_reevaluate_constraints_direct()
+    print("Incremental revalidation tests passed.")
@@ -1,21 +1,581 @@
+import argparse
+import glob
 import json
+import os
 import sys
-from validator import validate
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from validator import validate, imap_chunks, failed_index
+from result_cache import ResultCache, text_key
+from phase_tracker import PhaseMetrics
+from decoder import decode_sentence, load_sentence
+from result_format import BinaryResultWriter
+from aggregate import ResultAggregator, sentence_dimensions
 
 
-def cli_mode():
-    if len(sys.argv) != 2:
-        print("Usage: python main.py <input.json>")
+# --------------------------------------------
+# Streaming (NDJSON) Mode
+# --------------------------------------------
+
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+def malformed_result(message: str) -> dict:
+    return {
+        "classification": "Rejected (Structural)",
+        "failure_class": "SF-08",
+        "message": message
+    }
+
+
+def encode_result(result: dict) -> str:
+    """
+    Compact, single-line encoding of one validator result.
+    """
+    return json.dumps(result, separators=(",", ":"))
+
+
+def read_sentence(line: str):
+    """
+    Returns (sentence, None) for a JSON object line, otherwise
+    (None, the SF-08 result for the line).
+    """
+
+    try:
+        sentence = decode_sentence(line)
+    except ValueError:
+        return None, malformed_result("Sentence is not valid JSON")
+
+    if not isinstance(sentence, dict):
+        return None, malformed_result("Sentence must be a JSON object")
+
+    return sentence, None
+
+
+def validate_line(line: str, metrics: PhaseMetrics = None) -> dict:
+    """
+    Decodes and validates one NDJSON line. A line that is not a
+    JSON object is reported as structural corruption instead of
+    aborting the stream; repeated primitives are reported as SF-05.
+    """
+
+    sentence, malformed = read_sentence(line)
+
+    if malformed is not None:
+        return malformed
+
+    return validate(sentence, metrics=metrics)
+
+
+def validate_lines(lines):
+    """
+    Yields one validator result per non-blank input line.
+
+    Lines are consumed lazily, so memory stays flat regardless
+    of input size.
+    """
+
+    for line in lines:
+        if line.strip():
+            yield validate_line(line)
+
+
+def encode_lines(lines: list) -> list:
+    return [encode_result(result) for result in validate_lines(lines)]
+
+
+def encode_lines_cached(lines, cache: ResultCache, metrics: PhaseMetrics = None):
+    """
+    Yields encoded results, reusing the stored line for any input
+    line seen before. A hit skips decoding, validation and encoding.
+    """
+
+    for line in lines:
+        key = text_key(line.strip())
+        encoded = cache.get(key)
+
+        if encoded is None:
+            encoded = encode_result(validate_line(line, metrics))
+            cache.put(key, encoded)
+
+        yield encoded
+
+
+def stream_mode(
+    source,
+    sink,
+    workers: int = 1,
+    cache: ResultCache = None,
+    line_buffered: bool = False,
+    metrics: PhaseMetrics = None
+) -> int:
+    """
+    Validates NDJSON sentences from source and writes one compact
+    result line per sentence to sink. Returns the number of results.
+
+    With workers > 1, raw lines are decoded and validated in a
+    process pool; output order always matches input order. A
+    ResultCache (in-process only) replays results for repeated lines.
+    line_buffered answers and flushes each line as soon as it is read,
+    which turns the stream into a request/response line protocol.
+    PhaseMetrics, when given, records every validated (non-cached) line.
+    """
+
+    count = 0
+    lines = (line for line in source if line.strip())
+    caching = cache is not None and cache.enabled
+
+    if workers > 1 and (line_buffered or caching or metrics is not None):
+        raise ValueError("Result cache, line buffering and metrics require workers=1")
+
+    if caching:
+        encoded_lines = encode_lines_cached(lines, cache, metrics)
+    elif line_buffered or metrics is not None:
+        encoded_lines = (encode_result(validate_line(line, metrics)) for line in lines)
+    else:
+        encoded_lines = imap_chunks(encode_lines, lines, workers)
+
+    for encoded in encoded_lines:
+        sink.write(encoded)
+        sink.write("\n")
+        count += 1
+
+        if line_buffered:
+            sink.flush()
+
+    sink.flush()
+    return count
+
+
+def record_lines(lines: list) -> list:
+    """
+    (result, failed constraint index) for every non-blank line.
+    """
+
+    records = []
+
+    for line in lines:
+        if not line.strip():
+            continue
+
+        sentence, result = read_sentence(line)
+
+        if result is None:
+            result = validate(sentence)
+            records.append((result, failed_index(sentence, result)))
+        else:
+            records.append((result, None))
+
+    return records
+
+
+def binary_stream_mode(source, sink, workers: int = 1) -> int:
+    """
+    Like stream_mode, but writes the compact binary result stream (see
+    result_format) to the binary sink. Returns the number of results.
+    """
+
+    writer = BinaryResultWriter(sink)
+    count = 0
+    lines = (line for line in source if line.strip())
+
+    for result, index in imap_chunks(record_lines, lines, workers):
+        writer.write(result, index)
+        count += 1
+
+    sink.flush()
+    return count
+
+
+def summary_records(lines: list) -> list:
+    """
+    Aggregator observations (see ResultAggregator.observe) for every
+    non-blank line; small tuples instead of full results.
+    """
+
+    records = []
+
+    for line in lines:
+        if not line.strip():
+            continue
+
+        sentence, result = read_sentence(line)
+        index = None
+
+        if result is None:
+            result = validate(sentence)
+            index = failed_index(sentence, result)
+
+        records.append(
+            (result["classification"], result.get("failure_class"), index) +
+            sentence_dimensions(sentence)
+        )
+
+    return records
+
+
+def summary_mode(source, workers: int = 1) -> ResultAggregator:
+    """
+    Validates every line and returns only the aggregate report.
+    """
+
+    aggregator = ResultAggregator()
+    lines = (line for line in source if line.strip())
+
+    for record in imap_chunks(summary_records, lines, workers):
+        aggregator.observe(*record)
+
+    return aggregator
+
+
+def open_sink():
+    return open(
+        sys.stdout.fileno(),
+        "w",
+        buffering=OUTPUT_BUFFER_SIZE,
+        encoding="utf-8",
+        closefd=False
+    )
+
+
+def ndjson_mode(
+    path: str,
+    workers: int = 1,
+    cache_size: int = 0,
+    line_buffered: bool = False,
+    metrics_path: str = None,
+    output_format: str = "json",
+    summary: bool = False
+):
+    if summary:
+        if path == "-":
+            aggregator = summary_mode(sys.stdin, workers)
+        else:
+            with open(path, "r", encoding="utf-8") as source:
+                aggregator = summary_mode(source, workers)
+
+        print(aggregator.to_json())
+        return
+
+    if output_format == "binary":
+        sys.stdout.flush()
+
+        if path == "-":
+            binary_stream_mode(sys.stdin, sys.stdout.buffer, workers)
+        else:
+            with open(path, "r", encoding="utf-8") as source:
+                binary_stream_mode(source, sys.stdout.buffer, workers)
         return
 
-    file_path = sys.argv[1]
+    cache = ResultCache(cache_size, copy=None) if cache_size > 0 else None
+    metrics = PhaseMetrics() if metrics_path else None
 
+    sys.stdout.flush()
+    sink = open_sink()
+
+    try:
+        if path == "-":
+            stream_mode(sys.stdin, sink, workers, cache, line_buffered, metrics)
+        else:
+            with open(path, "r", encoding="utf-8") as source:
+                stream_mode(source, sink, workers, cache, line_buffered, metrics)
+    finally:
+        sink.flush()
+
+    if cache is not None:
+        print(json.dumps(cache.stats()), file=sys.stderr)
+
+    if metrics is not None:
+        write_metrics(metrics, metrics_path)
+
+
+def write_metrics(metrics: PhaseMetrics, path: str):
+    """
+    Writes a JSON snapshot for *.json paths, Prometheus text otherwise.
+    """
+
+    with open(path, "w", encoding="utf-8") as f:
+        if path.endswith(".json"):
+            f.write(metrics.to_json())
+        else:
+            f.write(metrics.to_prometheus())
+
+
+# --------------------------------------------
+# Multi-File Mode
+# --------------------------------------------
+
+DEFAULT_IO_THREADS = 8
+
+SENTENCE_FILE_SUFFIX = ".json"
+
+
+def expand_paths(patterns) -> list:
+    """
+    Sorted, de-duplicated sentence files named by files, glob patterns
+    (** recurses) and directories (every *.json file below them).
+    Raises FileNotFoundError for a pattern that matches nothing.
+    """
+
+    paths = set()
+
+    for pattern in patterns:
+        matches = [pattern] if os.path.exists(pattern) else glob.glob(pattern, recursive=True)
+        found = False
+
+        for match in matches:
+            if os.path.isdir(match):
+                for root, _, files in os.walk(match):
+                    for name in files:
+                        if name.endswith(SENTENCE_FILE_SUFFIX):
+                            paths.add(os.path.normpath(os.path.join(root, name)))
+                            found = True
+            elif os.path.isfile(match):
+                paths.add(os.path.normpath(match))
+                found = True
+
+        if not found:
+            raise FileNotFoundError(f"No sentence files match: {pattern}")
+
+    return sorted(paths)
+
+
+def _read_file(path: str) -> str:
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8", "replace")
+
+
+def read_files(paths, io_threads: int = DEFAULT_IO_THREADS):
+    """
+    Yields (path, text) in the order of paths while a thread pool reads
+    ahead, so file I/O overlaps with validating earlier files. At most
+    io_threads * 4 files are held in memory.
+    """
+
+    if io_threads <= 1:
+        for path in paths:
+            yield path, _read_file(path)
+        return
+
+    pending = deque()
+
+    with ThreadPoolExecutor(max_workers=io_threads) as pool:
+        try:
+            for path in paths:
+                pending.append((path, pool.submit(_read_file, path)))
+
+                if len(pending) >= io_threads * 4:
+                    path, future = pending.popleft()
+                    yield path, future.result()
+
+            while pending:
+                path, future = pending.popleft()
+                yield path, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def file_lines(files: list) -> list:
+    """
+    One encoded result line, carrying its source path, per (path, text).
+    """
+
+    lines = []
+
+    for path, text in files:
+        sentence, result = read_sentence(text)
+
+        if result is None:
+            result = validate(sentence)
+
+        lines.append(encode_result({"source": path, **result}))
+
+    return lines
+
+
+def files_mode(
+    patterns,
+    sink,
+    workers: int = 1,
+    io_threads: int = DEFAULT_IO_THREADS
+) -> int:
+    """
+    Validates one sentence per file for every file named by patterns
+    (see expand_paths) and writes one result line per file to sink, in
+    sorted path order. Returns the number of results.
+    """
+
+    count = 0
+    files = read_files(expand_paths(patterns), io_threads)
+
+    for encoded in imap_chunks(file_lines, files, workers):
+        sink.write(encoded)
+        sink.write("\n")
+        count += 1
+
+    sink.flush()
+    return count
+
+
+# --------------------------------------------
+# Single Sentence Mode
+# --------------------------------------------
+
+def single_mode(file_path: str):
     with open(file_path, "r") as f:
-        sentence = json.load(f)
+        sentence = load_sentence(f)
 
     result = validate(sentence)
     print(json.dumps(result, indent=2))
 
 
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Sovereign Language reference validator"
+    )
+    parser.add_argument(
+        "input",
+        nargs="+",
+        help="sentence file, or NDJSON file / '-' with --ndjson; several "
+             "files, globs or directories give one result line per file"
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="treat input as newline-delimited sentences"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="validator processes for --ndjson (default: 1)"
+    )
+    parser.add_argument(
+        "--io-threads",
+        type=int,
+        default=DEFAULT_IO_THREADS,
+        help=f"file reader threads for several input files (default: {DEFAULT_IO_THREADS})"
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=0,
+        help="replay results for up to N repeated lines (default: off)"
+    )
+    parser.add_argument(
+        "--line-buffered",
+        action="store_true",
+        help="answer and flush each line immediately (line protocol)"
+    )
+    parser.add_argument(
+        "--metrics",
+        metavar="PATH",
+        help="write phase metrics (Prometheus text, or JSON for *.json)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=("json", "binary"),
+        default="json",
+        help="--ndjson output: compact JSON lines or the binary result stream"
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="print only an aggregate report (counts, top actors/intents)"
+    )
+    parser.add_argument(
+        "--resumable",
+        metavar="OUTPUT",
+        help="memory-map the NDJSON file, validate byte ranges in parallel "
+             "into OUTPUT and checkpoint progress (rerun to resume)"
+    )
+    return parser
+
+
+def flag_conflict(args):
+    """
+    Returns the first conflict between command-line options as an
+    error message, or None. Checked before dispatching to any mode.
+    """
+
+    if not args.ndjson:
+        return "--resumable requires --ndjson" if args.resumable else None
+
+    if args.summary and (
+        args.format == "binary" or args.cache_size > 0 or args.line_buffered
+        or args.metrics or args.resumable
+    ):
+        return "--summary cannot be combined with other --ndjson output options"
+
+    if args.format == "binary" and (
+        args.cache_size > 0 or args.line_buffered or args.metrics or args.resumable
+    ):
+        return (
+            "--format binary cannot be combined with --cache-size, "
+            "--line-buffered, --metrics or --resumable"
+        )
+
+    if args.resumable and (args.cache_size > 0 or args.line_buffered or args.metrics):
+        return "--resumable cannot be combined with --cache-size, --line-buffered or --metrics"
+
+    if args.resumable and args.input == "-":
+        return "--resumable needs a file, not stdin"
+
+    if args.workers > 1 and (args.cache_size > 0 or args.line_buffered or args.metrics):
+        return "--cache-size, --line-buffered and --metrics require --workers 1"
+
+    return None
+
+
+def cli_mode():
+    args = build_parser().parse_args()
+
+    if args.ndjson:
+        if len(args.input) > 1:
+            build_parser().error("--ndjson takes a single file or '-'")
+
+        args.input = args.input[0]
+
+    conflict = flag_conflict(args)
+
+    if conflict is not None:
+        build_parser().error(conflict)
+
+    if not args.ndjson and (len(args.input) > 1 or not os.path.isfile(args.input[0])):
+        sys.stdout.flush()
+        sink = open_sink()
+
+        try:
+            files_mode(args.input, sink, args.workers, args.io_threads)
+        except FileNotFoundError as error:
+            build_parser().error(str(error))
+        finally:
+            sink.flush()
+        return
+
+    if args.resumable:
+        # Imported here: resumable builds on this module.
+        from resumable import validate_file
+
+        report = validate_file(args.input, args.resumable, args.workers)
+        print(json.dumps(report), file=sys.stderr)
+        return
+
+    if args.ndjson:
+        ndjson_mode(
+            args.input,
+            args.workers,
+            args.cache_size,
+            args.line_buffered,
+            args.metrics,
+            args.format,
+            args.summary
+        )
+        return
+
+    single_mode(args.input[0])
+
+
 if __name__ == "__main__":
     cli_mode()
@@ -0,0 +1,180 @@
+# --------------------------------------------
+# Compact Sentence Representation
+# --------------------------------------------
+#
+# Slotted classes for holding large batches of sentences in memory.
+# A Constraint replaces a two-key dictionary, a ConstraintSet wraps a
+# tuple of Constraints, and a Sentence holds its six primitives in
+# slots (the reason slot is left unset when absent). validate_structure,
+# evaluate_constraints, resolve and validate accept them directly.
+#
+# Conversion is lossless: from_dict only compacts values of the exact
+# dictionary shape (a constraint with precisely field and value) and
+# keeps anything else as given, so validation reports the same failure
+# either way. Operator constraints ("op": "in", ...) stay dictionaries.
+# to_dict restores the original dictionaries.
+
+from grammar import CANONICAL_ORDER
+
+
+_ABSENT = object()
+
+
+class Constraint:
+    __slots__ = ("field", "value")
+
+    def __init__(self, field, value):
+        self.field = field
+        self.value = value
+
+    @classmethod
+    def from_dict(cls, constraint: dict) -> "Constraint":
+        return cls(constraint["field"], constraint["value"])
+
+    def to_dict(self) -> dict:
+        return {"field": self.field, "value": self.value}
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Constraint):
+            return NotImplemented
+
+        return self.field == other.field and self.value == other.value
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Constraint({self.field!r}, {self.value!r})"
+
+
+def _is_constraint_dict(value) -> bool:
+    return type(value) is dict and len(value) == 2 and \
+        "field" in value and "value" in value
+
+
+class ConstraintSet:
+    __slots__ = ("items",)
+
+    def __init__(self, items=()):
+        self.items = tuple(items)
+
+    @classmethod
+    def from_list(cls, constraints: list) -> "ConstraintSet":
+        return cls(map(Constraint.from_dict, constraints))
+
+    def to_list(self) -> list:
+        return [constraint.to_dict() for constraint in self.items]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index: int) -> Constraint:
+        return self.items[index]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ConstraintSet):
+            return NotImplemented
+
+        return self.items == other.items
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ConstraintSet({list(self.items)!r})"
+
+
+class Sentence:
+    __slots__ = tuple(CANONICAL_ORDER)
+
+    def __init__(self, actor, intent, context, constraints, outcome, reason=_ABSENT):
+        self.actor = actor
+        self.intent = intent
+        self.context = context
+        self.constraints = constraints
+        self.outcome = outcome
+
+        if reason is not _ABSENT:
+            self.reason = reason
+
+    @property
+    def has_reason(self) -> bool:
+        return hasattr(self, "reason")
+
+    @classmethod
+    def from_dict(cls, sentence: dict) -> "Sentence":
+        """
+        Compacts a dictionary sentence. Raises ValueError unless its
+        keys are required primitives plus an optional reason, in
+        canonical order; validate the dictionary first when that is
+        not known.
+        """
+
+        # Imported here: structural.py accepts Sentence objects.
+        from structural import CANONICAL_SHAPES
+
+        if tuple(sentence) not in CANONICAL_SHAPES or \
+                getattr(sentence, "duplicate_keys", None):
+            raise ValueError("Sentence keys are not a canonical primitive sequence")
+
+        constraints = sentence["constraints"]
+
+        if type(constraints) is list and constraints and \
+                all(map(_is_constraint_dict, constraints)):
+            constraints = ConstraintSet.from_list(constraints)
+
+        reason = sentence.get("reason", _ABSENT)
+
+        if _is_constraint_dict(reason):
+            reason = Constraint.from_dict(reason)
+
+        return cls(
+            sentence["actor"],
+            sentence["intent"],
+            sentence["context"],
+            constraints,
+            sentence["outcome"],
+            reason
+        )
+
+    def to_dict(self) -> dict:
+        constraints = self.constraints
+        if isinstance(constraints, ConstraintSet):
+            constraints = constraints.to_list()
+
+        sentence = {
+            "actor": self.actor,
+            "intent": self.intent,
+            "context": self.context,
+            "constraints": constraints,
+            "outcome": self.outcome
+        }
+
+        if self.has_reason:
+            reason = self.reason
+            sentence["reason"] = reason.to_dict() if isinstance(reason, Constraint) else reason
+
+        return sentence
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sentence):
+            return NotImplemented
+
+        return all(
+            getattr(self, slot, _ABSENT) == getattr(other, slot, _ABSENT)
+            for slot in self.__slots__
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{slot}={getattr(self, slot)!r}"
+            for slot in self.__slots__ if hasattr(self, slot)
+        )
+        return f"Sentence({fields})"
+
+
+def compact(sentences) -> list:
+    return [Sentence.from_dict(sentence) for sentence in sentences]
@@ -0,0 +1,90 @@
+import pickle
+from corpus import DICT_STRUCTURAL_KINDS, build_rejected, build_sentence
+from model import Constraint, ConstraintSet, Sentence
+from semantic import evaluate_constraints
+from structural import validate_structure, StructuralValidationError
+from validator import validate, validate_many
+
+
+# --------------------------------------------
+# Compact Sentence Representation Tests
+# --------------------------------------------
+
+REFUSED = build_sentence(3, 4, refused=True, failing_index=1)
+
+
+def test_round_trip_is_lossless():
+    for sentence in (build_sentence(2, 3), REFUSED):
+        compact = Sentence.from_dict(sentence)
+
+        assert isinstance(compact.constraints, ConstraintSet)
+        assert compact.to_dict() == sentence
+        assert list(compact.to_dict()) == list(sentence)
+
+
+def test_reason_slot_tracks_presence():
+    allowed = Sentence.from_dict(build_sentence(1, 1))
+    refused = Sentence.from_dict(REFUSED)
+
+    assert not allowed.has_reason
+    assert refused.reason == Constraint("field_1", 1)
+
+    explicit_null = dict(build_sentence(1, 1), reason=None)
+    assert Sentence.from_dict(explicit_null).to_dict() == explicit_null
+
+
+def test_results_match_dict_path():
+    sentences = [build_sentence(2, 2), REFUSED]
+    sentences += [
+        build_rejected(code, 2, 2)
+        for code in DICT_STRUCTURAL_KINDS
+        if code not in ("SF-01", "SF-04", "SF-11")
+    ]
+    sentences.append(dict(build_sentence(1, 1), reason=None))
+    sentences.append(dict(REFUSED, constraints=[{"field": "x", "value": 1, "note": "kept"}]))
+
+    for sentence in sentences:
+        assert validate(Sentence.from_dict(sentence)) == validate(sentence), sentence
+
+
+def test_key_level_failures_are_not_compacted():
+    for code in ("SF-01", "SF-04", "SF-11"):
+        try:
+            Sentence.from_dict(build_rejected(code, 2, 2))
+        except ValueError:
+            continue
+
+        raise AssertionError(f"{code} sentence was compacted")
+
+
+def test_phases_accept_compact_objects():
+    compact = Sentence.from_dict(REFUSED)
+    validate_structure(compact)
+
+    result = evaluate_constraints(compact.constraints, compact.context)
+    assert result["failed_index"] == 1
+    assert result["failed_constraint"] == Constraint("field_1", 1)
+
+    try:
+        validate_structure(Sentence("a", "b", {}, ConstraintSet(), "Allowed"))
+    except StructuralValidationError as e:
+        assert e.code == "SF-02"
+    else:
+        raise AssertionError("Empty ConstraintSet accepted")
+
+
+def test_compact_sentences_pickle_for_worker_pools():
+    batch = [Sentence.from_dict(build_sentence(2, 2)), Sentence.from_dict(REFUSED)]
+
+    assert pickle.loads(pickle.dumps(batch)) == batch
+    assert validate_many(batch, workers=2, chunk_size=1) == [validate(s) for s in batch]
+
+
+if __name__ == "__main__":
+    test_round_trip_is_lossless()
+    test_reason_slot_tracks_presence()
+    test_results_match_dict_path()
+    test_key_level_failures_are_not_compacted()
+    test_phases_accept_compact_objects()
+    test_compact_sentences_pickle_for_worker_pools()
+    print("Compact model tests passed.")
@@ -0,0 +1,122 @@
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from main import expand_paths, files_mode, read_files
+
+
+# --------------------------------------------
+# Multi-File Mode Tests
+# --------------------------------------------
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def make_tree(directory: str):
+    for name in ("sample_allowed.json", "sample_refused.json", "sf01_missing_actor.json"):
+        shutil.copy(os.path.join(HERE, name), directory)
+
+    nested = os.path.join(directory, "nested", "deeper")
+    os.makedirs(nested)
+    shutil.copy(os.path.join(HERE, "sample_allowed.json"), os.path.join(nested, "b.json"))
+
+    with open(os.path.join(nested, "a.json"), "w") as f:
+        f.write("{not json")
+
+    with open(os.path.join(nested, "notes.txt"), "w") as f:
+        f.write("ignored")
+
+
+def run_files(patterns, **kwargs) -> list:
+    sink = io.StringIO()
+    files_mode(patterns, sink, **kwargs)
+    return [json.loads(line) for line in sink.getvalue().splitlines()]
+
+
+def test_directory_tree_sorted_with_sources():
+    with tempfile.TemporaryDirectory() as directory:
+        make_tree(directory)
+        results = run_files([directory])
+
+    sources = [os.path.relpath(result["source"], directory) for result in results]
+    assert sources == sorted(sources)
+    assert len(sources) == 5 and "nested/deeper/notes.txt" not in sources
+
+    by_name = {os.path.basename(r["source"]): r for r in results}
+    assert by_name["sample_allowed.json"]["classification"] == "Accepted + Allowed"
+    assert by_name["sample_refused.json"]["classification"] == "Accepted + Refused"
+    assert by_name["sf01_missing_actor.json"]["failure_class"] == "SF-01"
+    assert by_name["a.json"]["failure_class"] == "SF-08"
+
+
+def test_globs_and_duplicates():
+    with tempfile.TemporaryDirectory() as directory:
+        make_tree(directory)
+        paths = expand_paths([
+            os.path.join(directory, "sample_*.json"),
+            os.path.join(directory, "**", "b.json"),
+            os.path.join(directory, "sample_allowed.json")
+        ])
+
+    assert [os.path.basename(p) for p in paths] == \
+        ["b.json", "sample_allowed.json", "sample_refused.json"]
+
+    try:
+        expand_paths([os.path.join(HERE, "no_such_*.json")])
+        assert False, "Unmatched pattern was accepted"
+    except FileNotFoundError:
+        pass
+
+
+def test_output_independent_of_threads_and_workers():
+    with tempfile.TemporaryDirectory() as directory:
+        make_tree(directory)
+        baseline = run_files([directory], io_threads=1)
+
+        assert run_files([directory], io_threads=8) == baseline
+        assert run_files([directory], workers=2, io_threads=3) == baseline
+
+
+def test_read_ahead_keeps_order():
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+
+        for i in range(100):
+            path = os.path.join(directory, f"{i:03d}.json")
+            with open(path, "w") as f:
+                f.write(str(i))
+            paths.append(path)
+
+        assert [int(text) for _, text in read_files(paths, io_threads=4)] == list(range(100))
+
+
+def test_cli_single_file_unchanged():
+    output = subprocess.run(
+        [sys.executable, os.path.join(HERE, "main.py"), os.path.join(HERE, "sample_allowed.json")],
+        capture_output=True, text=True, check=True
+    ).stdout
+
+    assert json.loads(output) == {"classification": "Accepted + Allowed"}
+
+
+def test_cli_many_paths():
+    output = subprocess.run(
+        [sys.executable, "main.py", "sample_refused.json", "sample_allowed.json"],
+        capture_output=True, text=True, check=True, cwd=HERE
+    ).stdout.splitlines()
+
+    assert [json.loads(line)["source"] for line in output] == \
+        ["sample_allowed.json", "sample_refused.json"]
+
+
+if __name__ == "__main__":
+    test_directory_tree_sorted_with_sources()
+    test_globs_and_duplicates()
+    test_output_independent_of_threads_and_workers()
+    test_read_ahead_keeps_order()
+    test_cli_single_file_unchanged()
+    test_cli_many_paths()
+    print("Multi-file mode tests passed.")
@@ -0,0 +1,67 @@
+import json
+from corpus import CORPUS
+from phase_tracker import PhaseMetrics, PhaseTracker
+from validator import validate
+
+
+# --------------------------------------------
+# Phase Metrics Tests
+# --------------------------------------------
+
+def collect() -> PhaseMetrics:
+    metrics = PhaseMetrics()
+
+    for sentence in CORPUS * 2:
+        validate(sentence, metrics=metrics)
+
+    return metrics
+
+
+def test_counters_by_outcome():
+    snapshot = collect().snapshot()
+
+    assert snapshot["classifications"] == {
+        "Accepted + Allowed": 2,
+        "Accepted + Refused": 2,
+        "Rejected (Structural)": 2
+    }
+    assert snapshot["failure_classes"] == {"SF-01": 2}
+    assert snapshot["failed_indices"] == {"0": 2}
+
+
+def test_phase_latency_counts_follow_phase_flow():
+    snapshot = collect().snapshot()
+    phases = snapshot["phase_latency"]
+
+    assert phases["Structural"]["count"] == 6
+    assert phases["Semantic"]["count"] == 4
+    assert phases["Resolution"]["count"] == 4
+    assert snapshot["validation_latency"]["buckets"]["+Inf"] == 6
+    json.dumps(snapshot)
+
+
+def test_prometheus_exposition():
+    text = collect().to_prometheus()
+
+    assert "# TYPE sl_phase_duration_seconds histogram" in text
+    assert 'sl_phase_duration_seconds_count{phase="Semantic"} 4' in text
+    assert 'sl_validations_total{classification="Accepted + Refused"} 2' in text
+    assert 'sl_structural_failures_total{failure_class="SF-01"} 2' in text
+    assert 'sl_constraint_failures_total{failed_index="0"} 2' in text
+
+
+def test_disabled_tracker_records_nothing():
+    tracker = PhaseTracker()
+    tracker.enter("Structural")
+    tracker.finish()
+
+    assert tracker.phases == ["Structural"]
+    assert tracker._started is None
+
+
+if __name__ == "__main__":
+    test_counters_by_outcome()
+    test_phase_latency_counts_follow_phase_flow()
+    test_prometheus_exposition()
+    test_disabled_tracker_records_nothing()
+    print("Phase metrics tests passed.")
@@ -1,15 +1,205 @@
+import json
+from bisect import bisect_left
+from time import perf_counter
+
+
 class PhaseTracker:
     VALID_SEQUENCE = ["Structural", "Semantic", "Resolution"]
 
-    def __init__(self):
+    def __init__(self, metrics=None):
         self.phases = []
+        self.metrics = metrics
+        self._started = None
 
     def enter(self, phase_name: str):
+        if self.metrics is not None:
+            self._lap()
+
         self.phases.append(phase_name)
 
+    def finish(self):
+        """
+        Closes the timer of the last entered phase. No-op unless
+        metrics are enabled.
+        """
+        if self.metrics is not None:
+            self._lap()
+
+    def _lap(self):
+        now = perf_counter()
+
+        if self._started is not None and self.phases:
+            self.metrics.observe_phase(self.phases[-1], now - self._started)
+
+        self._started = now
+
     def verify_sequence(self):
         expected = self.VALID_SEQUENCE[:len(self.phases)]
         if self.phases != expected:
             raise Exception(
                 f"Phase order violated. Expected {expected}, got {self.phases}"
             )
+
+
+# --------------------------------------------
+# Opt-In Phase Metrics
+# --------------------------------------------
+#
+# Pass a PhaseMetrics to validate(..., metrics=m) to collect monotonic
+# per-phase timings, latency histograms and outcome counters. Without
+# one, PhaseTracker does no timing at all.
+
+LATENCY_BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5,
+    1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2, 1e-1
+)
+
+METRIC_PREFIX = "sl"
+
+
+class LatencyHistogram:
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def cumulative(self) -> list:
+        running = 0
+        result = []
+
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            running += count
+            result.append((bound, running))
+
+        return result
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum_seconds": self.total,
+            "buckets": {
+                ("+Inf" if bound == float("inf") else repr(bound)): count
+                for bound, count in self.cumulative()
+            }
+        }
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+class PhaseMetrics:
+
+    def __init__(self):
+        self.phase_latency = {}
+        self.validation_latency = LatencyHistogram()
+        self.classifications = {}
+        self.failure_classes = {}
+        self.failed_indices = {}
+
+    def observe_phase(self, phase: str, seconds: float):
+        histogram = self.phase_latency.get(phase)
+
+        if histogram is None:
+            histogram = self.phase_latency[phase] = LatencyHistogram()
+
+        histogram.observe(seconds)
+
+    def observe_failed_index(self, index: int):
+        self.failed_indices[index] = self.failed_indices.get(index, 0) + 1
+
+    def observe_result(self, result: dict, seconds: float = None):
+        classification = result["classification"]
+        self.classifications[classification] = \
+            self.classifications.get(classification, 0) + 1
+
+        failure_class = result.get("failure_class")
+        if failure_class is not None:
+            self.failure_classes[failure_class] = \
+                self.failure_classes.get(failure_class, 0) + 1
+
+        if seconds is not None:
+            self.validation_latency.observe(seconds)
+
+    # ---------- Export ----------
+
+    def snapshot(self) -> dict:
+        return {
+            "validation_latency": self.validation_latency.snapshot(),
+            "phase_latency": {
+                phase: histogram.snapshot()
+                for phase, histogram in self.phase_latency.items()
+            },
+            "classifications": dict(self.classifications),
+            "failure_classes": dict(sorted(self.failure_classes.items())),
+            "failed_indices": {
+                str(index): count
+                for index, count in sorted(self.failed_indices.items())
+            }
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        lines = []
+
+        def histogram(name: str, help_text: str, series: list):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+
+            for labels, hist in series:
+                prefix = "".join(f'{key}="{_escape(value)}",' for key, value in labels)
+
+                for bound, count in hist.cumulative():
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{name}_bucket{{{prefix}le="{le}"}} {count}')
+
+                label_text = "{" + prefix.rstrip(",") + "}" if prefix else ""
+                lines.append(f"{name}_sum{label_text} {hist.total!r}")
+                lines.append(f"{name}_count{label_text} {hist.count}")
+
+        def counter(name: str, help_text: str, label: str, values: dict):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+
+            for value, count in values.items():
+                lines.append(f'{name}{{{label}="{_escape(value)}"}} {count}')
+
+        histogram(
+            f"{METRIC_PREFIX}_validation_duration_seconds",
+            "End-to-end validate() latency.",
+            [((), self.validation_latency)]
+        )
+        histogram(
+            f"{METRIC_PREFIX}_phase_duration_seconds",
+            "Time spent in each validation phase.",
+            [((("phase", phase),), hist) for phase, hist in self.phase_latency.items()]
+        )
+        counter(
+            f"{METRIC_PREFIX}_validations_total",
+            "Validated sentences by classification.",
+            "classification",
+            self.classifications
+        )
+        counter(
+            f"{METRIC_PREFIX}_structural_failures_total",
+            "Structural rejections by failure class.",
+            "failure_class",
+            dict(sorted(self.failure_classes.items()))
+        )
+        counter(
+            f"{METRIC_PREFIX}_constraint_failures_total",
+            "Refusals by index of the first failing constraint.",
+            "failed_index",
+            dict(sorted(self.failed_indices.items()))
+        )
+
+        return "\n".join(lines) + "\n"
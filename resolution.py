@@ -1,10 +1,19 @@
+from model import Constraint
+
+
 def resolve(evaluation_result: dict) -> dict:
     if evaluation_result["status"] == "Satisfied":
         return {
             "classification": "Accepted + Allowed"
         }
 
+    reason = evaluation_result["failed_constraint"]
+
+    # Compact constraints resolve to the same output as dict ones.
+    if type(reason) is Constraint:
+        reason = reason.to_dict()
+
     return {
         "classification": "Accepted + Refused",
-        "reason": evaluation_result["failed_constraint"]
+        "reason": reason
     }
@@ -0,0 +1,125 @@
+import copy
+import hashlib
+from collections import OrderedDict
+
+
+# --------------------------------------------
+# Content-Addressed Result Cache
+# --------------------------------------------
+#
+# The validator is deterministic, so a sentence's result depends only on
+# its content. Decoded sentences are addressed by a digest of their repr,
+# which keeps primitive order and distinguishes 1 / 1.0 / True / "1"; this
+# is canonical for JSON-decoded sentences (dicts, lists, str, numbers,
+# bool, None), which is what the validator is fed; input budgets other
+# than the defaults are part of the key. Raw NDJSON lines are
+# addressed by a digest of their text, so a hit also skips decoding.
+
+DEFAULT_CACHE_SIZE = 65536
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def text_key(text: str) -> bytes:
+    return hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"),
+        digest_size=16
+    ).digest()
+
+
+def sentence_key(sentence, budgets=None) -> bytes:
+    """
+    Digest of a decoded sentence. Non-default input budgets (a
+    structural.InputBudgets, whose repr lists every limit) are part
+    of the key, since they change the result.
+    """
+
+    if budgets is None:
+        return text_key(repr(sentence))
+
+    return text_key(f"{budgets!r}\n{sentence!r}")
+
+
+def _copy_value(value):
+    if isinstance(value, _SCALARS):
+        return value
+
+    if isinstance(value, dict) and all(
+        isinstance(item, _SCALARS) for item in value.values()
+    ):
+        return dict(value)
+
+    return copy.deepcopy(value)
+
+
+def copy_result(result: dict) -> dict:
+    """
+    Fresh copy of a validator result; nothing is shared with the
+    stored entry, so callers may mutate what they receive.
+    """
+    return {key: _copy_value(value) for key, value in result.items()}
+
+
+class ResultCache:
+    """
+    Bounded LRU cache of validator results keyed by content digest.
+
+    Stored and returned values pass through copy (copy_result by
+    default); pass copy=None for immutable values such as encoded
+    result lines.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        enabled: bool = True,
+        copy=copy_result
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self._copy = copy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes):
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry if self._copy is None else self._copy(entry)
+
+    def put(self, key: bytes, result) -> None:
+        self._entries[key] = result if self._copy is None else self._copy(result)
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
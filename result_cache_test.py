@@ -0,0 +1,96 @@
+import copy
+from validator import validate
+from result_cache import ResultCache, sentence_key
+from structural import InputBudgets
+
+
+# --------------------------------------------
+# Result Cache Tests
+# --------------------------------------------
+
+REFUSED = {
+    "actor": "User_002",
+    "intent": "Transfer",
+    "context": {"balance": 1000},
+    "constraints": [
+        {"field": "balance", "value": 5000}
+    ],
+    "outcome": "Refused",
+    "reason": {"field": "balance", "value": 5000}
+}
+
+
+def test_hit_returns_identical_fresh_copy():
+    cache = ResultCache(maxsize=8)
+
+    first = validate(copy.deepcopy(REFUSED), cache=cache)
+    first["reason"]["value"] = "tampered"
+
+    second = validate(copy.deepcopy(REFUSED), cache=cache)
+
+    assert second == validate(REFUSED), f"Cached result drifted: {second}"
+    assert cache.hits == 1 and cache.misses == 1
+
+
+def test_eviction_bounded_by_maxsize():
+    cache = ResultCache(maxsize=2)
+
+    for balance in range(5):
+        sentence = copy.deepcopy(REFUSED)
+        sentence["context"]["balance"] = balance
+        validate(sentence, cache=cache)
+
+    assert len(cache) == 2
+    assert cache.evictions == 3
+
+
+def test_disabled_cache_runs_every_phase():
+    cache = ResultCache(enabled=False)
+
+    validate(REFUSED, cache=cache)
+    validate(REFUSED, cache=cache)
+
+    assert cache.stats()["hits"] == 0 and len(cache) == 0
+
+
+def test_phase_log_bypasses_cache():
+    cache = ResultCache()
+
+    validate(REFUSED, cache=cache)
+    result = validate(REFUSED, return_phase_log=True, cache=cache)
+
+    assert result["phase_log"] == ["Structural", "Semantic", "Resolution"]
+    assert cache.hits == 0
+
+
+def test_key_distinguishes_equal_but_different_values():
+    as_int = dict(REFUSED, context={"balance": 1})
+    as_bool = dict(REFUSED, context={"balance": True})
+    reordered = dict(reversed(list(REFUSED.items())))
+
+    assert sentence_key(as_int) != sentence_key(as_bool)
+    assert sentence_key(REFUSED) != sentence_key(reordered)
+
+
+def test_budgets_are_part_of_the_key():
+    cache = ResultCache(maxsize=8)
+    tight = InputBudgets(max_context_fields=0)
+
+    loose = validate(REFUSED, cache=cache)
+    rejected = validate(REFUSED, cache=cache, budgets=tight)
+
+    assert rejected == validate(REFUSED, budgets=tight) != loose
+    assert rejected["failure_class"] == "SF-12"
+    assert validate(REFUSED, cache=cache, budgets=InputBudgets(max_context_fields=0)) == rejected
+    assert validate(REFUSED, cache=cache) == loose
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+if __name__ == "__main__":
+    test_hit_returns_identical_fresh_copy()
+    test_eviction_bounded_by_maxsize()
+    test_disabled_cache_runs_every_phase()
+    test_phase_log_bypasses_cache()
+    test_key_distinguishes_equal_but_different_values()
+    test_budgets_are_part_of_the_key()
+    print("Result cache tests passed.")
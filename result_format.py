@@ -0,0 +1,265 @@
+import io
+import mmap
+import os
+from taxonomy import STRUCTURAL_FAILURES
+
+
+# --------------------------------------------
+# Compact Binary Result Stream
+# --------------------------------------------
+#
+# A stream starts with MAGIC and is followed by records, each opening
+# with one tag byte. Integers are unsigned LEB128 varints.
+#
+#   TAG_STRING    length, UTF-8 bytes         (next string table id)
+#   TAG_ALLOWED   ordinal delta
+#   TAG_REFUSED   ordinal delta, failed constraint index
+#   TAG_REJECTED  ordinal delta, SF code, message string id
+#
+# The ordinal delta is the distance from the previous record's ordinal
+# (the first record's from -1), so consecutive results cost one byte.
+# SF codes are 1-based positions in taxonomy.STRUCTURAL_FAILURES.
+# Messages are written once per stream into the string table and then
+# referenced by id. A Refused record stores the index of the failed
+# constraint instead of a copy of it; the sentence restores the reason.
+
+MAGIC = b"SLR1"
+
+TAG_STRING = 0
+TAG_ALLOWED = 1
+TAG_REFUSED = 2
+TAG_REJECTED = 3
+
+ALLOWED = "Accepted + Allowed"
+REFUSED = "Accepted + Refused"
+REJECTED = "Rejected (Structural)"
+
+SF_CODES = list(STRUCTURAL_FAILURES)
+
+_SF_ENUM = {code: number for number, code in enumerate(SF_CODES, 1)}
+
+
+class ResultFormatError(ValueError):
+    pass
+
+
+# ---------- Varints ----------
+
+def _varint(value: int) -> bytes:
+    if value < 0x80:
+        return bytes((value,))
+
+    out = bytearray()
+
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    out.append(value)
+    return bytes(out)
+
+
+def _read_varint(data, position: int):
+    value = 0
+    shift = 0
+
+    while True:
+        try:
+            byte = data[position]
+        except IndexError:
+            raise ResultFormatError("Truncated result stream")
+
+        position += 1
+        value |= (byte & 0x7F) << shift
+
+        if byte < 0x80:
+            return value, position
+
+        shift += 7
+
+
+# ---------- Writer ----------
+
+class BinaryResultWriter:
+    """
+    Writes results to a binary stream (anything with write(bytes)).
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.strings = {}
+        self.last_ordinal = -1
+        stream.write(MAGIC)
+
+    def _string_id(self, text: str) -> int:
+        string_id = self.strings.get(text)
+
+        if string_id is None:
+            data = text.encode("utf-8")
+            self.stream.write(bytes((TAG_STRING,)) + _varint(len(data)) + data)
+            string_id = self.strings[text] = len(self.strings)
+
+        return string_id
+
+    def write(self, result: dict, failed_index: int = None, ordinal: int = None):
+        """
+        Appends one validator result. Refused results need the index of
+        the failed constraint (see validator.failed_index). ordinal
+        defaults to the one after the previous record.
+        """
+
+        if ordinal is None:
+            ordinal = self.last_ordinal + 1
+
+        if ordinal <= self.last_ordinal:
+            raise ResultFormatError("Ordinals must increase")
+
+        delta = _varint(ordinal - self.last_ordinal - 1)
+        classification = result["classification"]
+
+        if classification == ALLOWED:
+            record = bytes((TAG_ALLOWED,)) + delta
+
+        elif classification == REFUSED:
+            if failed_index is None:
+                raise ResultFormatError("Refused result needs its failed constraint index")
+
+            record = bytes((TAG_REFUSED,)) + delta + _varint(failed_index)
+
+        elif classification == REJECTED:
+            code = _SF_ENUM.get(result["failure_class"])
+
+            if code is None:
+                raise ResultFormatError(f"Unknown failure class: {result['failure_class']}")
+
+            message_id = self._string_id(result["message"])
+            record = bytes((TAG_REJECTED,)) + delta + _varint(code) + _varint(message_id)
+
+        else:
+            raise ResultFormatError(f"Unknown classification: {classification}")
+
+        self.stream.write(record)
+        self.last_ordinal = ordinal
+
+
+# ---------- Reader ----------
+
+def iter_records(data: bytes):
+    """
+    Yields (ordinal, classification, failure_class, message,
+    failed_index) for every result in a binary stream; fields that do
+    not apply are None.
+    """
+
+    if data[:len(MAGIC)] != MAGIC:
+        raise ResultFormatError("Not a binary result stream")
+
+    strings = []
+    ordinal = -1
+    position = len(MAGIC)
+    end = len(data)
+
+    while position < end:
+        tag = data[position]
+        position += 1
+
+        if tag == TAG_STRING:
+            length, position = _read_varint(data, position)
+
+            if position + length > end:
+                raise ResultFormatError("Truncated result stream")
+
+            strings.append(bytes(data[position:position + length]).decode("utf-8"))
+            position += length
+            continue
+
+        delta, position = _read_varint(data, position)
+        ordinal += delta + 1
+
+        if tag == TAG_ALLOWED:
+            yield ordinal, ALLOWED, None, None, None
+
+        elif tag == TAG_REFUSED:
+            index, position = _read_varint(data, position)
+            yield ordinal, REFUSED, None, None, index
+
+        elif tag == TAG_REJECTED:
+            code, position = _read_varint(data, position)
+            message_id, position = _read_varint(data, position)
+
+            try:
+                yield ordinal, REJECTED, SF_CODES[code - 1], strings[message_id], None
+            except IndexError:
+                raise ResultFormatError("Unknown SF code or message id")
+
+        else:
+            raise ResultFormatError(f"Unknown record tag: {tag}")
+
+
+def read_records(path: str):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ResultFormatError("Not a binary result stream")
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield from iter_records(data)
+
+
+# ---------- JSON Result Converters ----------
+
+def to_json_result(record: tuple, sentence=None) -> dict:
+    """
+    The validator result for a record. A Refused record gets its reason
+    back from sentence's constraints; without the sentence, the result
+    carries failed_index instead.
+    """
+
+    _, classification, failure_class, message, index = record
+
+    if classification == ALLOWED:
+        return {"classification": ALLOWED}
+
+    if classification == REJECTED:
+        return {
+            "classification": REJECTED,
+            "failure_class": failure_class,
+            "message": message
+        }
+
+    if sentence is None:
+        return {"classification": REFUSED, "failed_index": index}
+
+    constraints = sentence.constraints if hasattr(sentence, "constraints") \
+        else sentence["constraints"]
+    reason = constraints[index]
+
+    return {
+        "classification": REFUSED,
+        "reason": reason.to_dict() if hasattr(reason, "to_dict") else reason
+    }
+
+
+def from_json_results(results, sentences=None) -> bytes:
+    """
+    Encodes validator results (in ordinal order) as one binary stream.
+    Refused results take their failed index from a failed_index key or,
+    given sentences, from the matching sentence.
+    """
+
+    # Imported here so that reading the format never loads the validator.
+    from validator import failed_index
+
+    stream = io.BytesIO()
+    writer = BinaryResultWriter(stream)
+    sentences = iter(sentences) if sentences is not None else None
+
+    for result in results:
+        sentence = next(sentences) if sentences is not None else None
+        index = result.get("failed_index")
+
+        if index is None and sentence is not None:
+            index = failed_index(sentence, result)
+
+        writer.write(result, index)
+
+    return stream.getvalue()
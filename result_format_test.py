@@ -0,0 +1,102 @@
+import io
+import json
+from corpus import build_line, STRUCTURAL_KINDS
+from decoder import decode_sentence
+from main import binary_stream_mode, stream_mode
+from result_format import (
+    BinaryResultWriter,
+    ResultFormatError,
+    from_json_results,
+    iter_records,
+    to_json_result
+)
+from validator import validate
+
+
+# --------------------------------------------
+# Binary Result Format Tests
+# --------------------------------------------
+
+LINES = [build_line(kind, 3, 3, variant) for variant in range(3)
+         for kind in ["Allowed", "Refused"] + STRUCTURAL_KINDS]
+LINES.append("{broken")
+
+
+def sentences():
+    out = []
+
+    for line in LINES:
+        try:
+            out.append(decode_sentence(line))
+        except ValueError:
+            out.append(None)
+
+    return out
+
+
+def json_results() -> list:
+    sink = io.StringIO()
+    stream_mode(io.StringIO("\n".join(LINES)), sink)
+    return [json.loads(line) for line in sink.getvalue().splitlines()]
+
+
+def test_stream_round_trips_to_json_results():
+    sink = io.BytesIO()
+    assert binary_stream_mode(io.StringIO("\n".join(LINES) + "\n\n"), sink) == len(LINES)
+
+    records = list(iter_records(sink.getvalue()))
+    restored = [to_json_result(r, s) for r, s in zip(records, sentences())]
+
+    assert [r[0] for r in records] == list(range(len(LINES)))
+    assert restored == json_results()
+
+
+def test_converters_round_trip():
+    results = json_results()
+    data = from_json_results(results, sentences())
+    records = list(iter_records(data))
+
+    assert [to_json_result(r, s) for r, s in zip(records, sentences())] == results
+    assert to_json_result(records[1])["failed_index"] == 0
+
+
+def test_messages_are_interned():
+    sink = io.BytesIO()
+    writer = BinaryResultWriter(sink)
+    rejected = validate({"intent": "x"})
+
+    for _ in range(100):
+        writer.write(rejected)
+
+    # One string table entry, then four bytes per record.
+    assert len(sink.getvalue()) < len(rejected["message"]) + 10 + 400
+
+
+def test_sparse_ordinals_and_errors():
+    sink = io.BytesIO()
+    writer = BinaryResultWriter(sink)
+    writer.write({"classification": "Accepted + Allowed"}, ordinal=5)
+    writer.write({"classification": "Accepted + Refused"}, 2, ordinal=300)
+
+    assert [r[0] for r in iter_records(sink.getvalue())] == [5, 300]
+
+    for bad in (
+        lambda: writer.write({"classification": "Accepted + Refused"}),
+        lambda: writer.write({"classification": "Accepted + Allowed"}, ordinal=300),
+        lambda: list(iter_records(b"nope")),
+        lambda: list(iter_records(sink.getvalue()[:-1]))
+    ):
+        try:
+            bad()
+        except ResultFormatError:
+            continue
+
+        raise AssertionError("Invalid input was accepted")
+
+
+if __name__ == "__main__":
+    test_stream_round_trips_to_json_results()
+    test_converters_round_trip()
+    test_messages_are_interned()
+    test_sparse_ordinals_and_errors()
+    print("Binary result format tests passed.")
@@ -0,0 +1,273 @@
+import argparse
+import json
+import mmap
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from main import encode_result, validate_line
+
+
+# --------------------------------------------
+# Memory-Mapped, Resumable NDJSON Validation
+# --------------------------------------------
+#
+# The input is split into byte ranges of about RANGE_SIZE bytes, each
+# ending on a line boundary; the range index is found by memory-mapping
+# the file and looking for the first newline after every multiple of
+# RANGE_SIZE, so building it reads a few bytes per range. Ranges are
+# validated in parallel, each into its own part file (renamed into
+# place only when complete). A state file next to the output records
+# the index and every completed range, so an interrupted run resumes
+# with the ranges still missing. Concatenating the parts in range order
+# gives exactly the output of a sequential --ndjson run.
+#
+# Lines are read as the sequential run's text-mode reader reads them:
+# "\r\n" and a lone "\r" also end a line (universal newlines), and
+# bytes that are not valid UTF-8 raise UnicodeDecodeError. Every range
+# ends just after a "\n", so a "\r\n" pair never straddles two ranges.
+#
+# Files kept next to OUTPUT until the run completes:
+#   OUTPUT.state.json   index (with source size/mtime) and completed ranges
+#   OUTPUT.parts/       one NNNNNNNN.ndjson per completed range
+
+RANGE_SIZE = 64 << 20
+
+STATE_VERSION = 1
+
+
+# ---------- Range Index ----------
+
+def build_range_index(path: str, range_size: int = RANGE_SIZE) -> list:
+    """
+    [(start, end), ...] byte ranges covering the file, each ending
+    just after a newline (or at end of file).
+    """
+
+    size = os.path.getsize(path)
+
+    if size == 0:
+        return []
+
+    ranges = []
+    start = 0
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        while start < size:
+            newline = mm.find(b"\n", min(start + range_size, size) - 1)
+            end = size if newline == -1 else newline + 1
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+def _source_identity(path: str, range_size: int) -> dict:
+    stat = os.stat(path)
+
+    return {
+        "source": os.path.abspath(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "range_size": range_size
+    }
+
+
+# ---------- Range Worker ----------
+
+def _decode_lines(raw: bytes, path: str, offset: int) -> list:
+    # One "\n"-terminated run of bytes (without the "\n") as the lines
+    # text mode would yield for it.
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise UnicodeDecodeError(
+            e.encoding, e.object, e.start, e.end,
+            f"invalid UTF-8 at byte {offset + e.start} of {path}"
+        ) from None
+
+    if "\r" not in text:
+        return [text]
+
+    if text.endswith("\r"):
+        text = text[:-1]
+
+    return text.split("\r")
+
+
+def validate_range(path: str, start: int, end: int, part_path: str) -> int:
+    """
+    Validates the lines in [start, end) into part_path. Returns the
+    number of results written. Raises UnicodeDecodeError for bytes
+    that are not valid UTF-8, as the sequential run does.
+    """
+
+    count = 0
+    temp_path = part_path + ".tmp"
+
+    with open(path, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+            open(temp_path, "w", encoding="utf-8", buffering=1 << 20) as sink:
+
+        position = start
+
+        while position < end:
+            newline = mm.find(b"\n", position, end)
+            stop = end if newline == -1 else newline
+            lines = _decode_lines(mm[position:stop], path, position)
+            position = stop + 1
+
+            for line in lines:
+                if line.strip():
+                    sink.write(encode_result(validate_line(line)))
+                    sink.write("\n")
+                    count += 1
+
+    os.replace(temp_path, part_path)
+    return count
+
+
+# ---------- Checkpoint State ----------
+
+def _state_path(output: str) -> str:
+    return output + ".state.json"
+
+
+def _parts_dir(output: str) -> str:
+    return output + ".parts"
+
+
+def _part_path(output: str, number: int) -> str:
+    return os.path.join(_parts_dir(output), f"{number:08d}.ndjson")
+
+
+def write_state(output: str, state: dict) -> None:
+    temp_path = _state_path(output) + ".tmp"
+
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+
+    os.replace(temp_path, _state_path(output))
+
+
+def load_state(path: str, output: str, range_size: int = RANGE_SIZE) -> dict:
+    """
+    Returns the saved state if it belongs to this source file (same
+    path, size, mtime and range size), otherwise a fresh state with a
+    newly built index. Completed ranges whose part is missing are
+    dropped.
+    """
+
+    identity = _source_identity(path, range_size)
+
+    try:
+        with open(_state_path(output), "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        state = None
+
+    if state is None or state.get("version") != STATE_VERSION or \
+            state.get("identity") != identity:
+        shutil.rmtree(_parts_dir(output), ignore_errors=True)
+
+        return {
+            "version": STATE_VERSION,
+            "identity": identity,
+            "ranges": build_range_index(path, range_size),
+            "completed": {}
+        }
+
+    state["completed"] = {
+        number: count
+        for number, count in state["completed"].items()
+        if os.path.exists(_part_path(output, int(number)))
+    }
+    return state
+
+
+# ---------- File Mode ----------
+
+def _merge_parts(output: str, state: dict) -> int:
+    total = 0
+    temp_path = output + ".tmp"
+
+    with open(temp_path, "wb") as sink:
+        for number in range(len(state["ranges"])):
+            with open(_part_path(output, number), "rb") as part:
+                shutil.copyfileobj(part, sink, 1 << 20)
+
+            total += state["completed"][str(number)]
+
+    os.replace(temp_path, output)
+    return total
+
+
+def validate_file(
+    path: str,
+    output: str,
+    workers: int = None,
+    range_size: int = RANGE_SIZE
+) -> dict:
+    """
+    Validates an NDJSON file into output, resuming from the state left
+    by an interrupted run. Returns a report with the number of ranges,
+    how many were already complete, and the number of results.
+    """
+
+    state = load_state(path, output, range_size)
+    ranges = state["ranges"]
+    resumed = len(state["completed"])
+
+    os.makedirs(_parts_dir(output), exist_ok=True)
+    write_state(output, state)
+
+    remaining = [
+        number for number in range(len(ranges))
+        if str(number) not in state["completed"]
+    ]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    def record(number: int, count: int):
+        state["completed"][str(number)] = count
+        write_state(output, state)
+
+    if workers <= 1:
+        for number in remaining:
+            start, end = ranges[number]
+            record(number, validate_range(path, start, end, _part_path(output, number)))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(
+                    validate_range, path, *ranges[number], _part_path(output, number)
+                ): number
+                for number in remaining
+            }
+
+            for future in as_completed(futures):
+                record(futures[future], future.result())
+
+    results = _merge_parts(output, state)
+
+    shutil.rmtree(_parts_dir(output), ignore_errors=True)
+    os.remove(_state_path(output))
+
+    return {
+        "ranges": len(ranges),
+        "resumed_ranges": resumed,
+        "results": results
+    }
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Resumable NDJSON file validation")
+    parser.add_argument("input", help="NDJSON file to validate")
+    parser.add_argument("output", help="results file (NDJSON)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--range-mb", type=int, default=RANGE_SIZE >> 20)
+    args = parser.parse_args()
+
+    report = validate_file(args.input, args.output, args.workers, args.range_mb << 20)
+    print(json.dumps(report))
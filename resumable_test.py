@@ -0,0 +1,167 @@
+import io
+import os
+import tempfile
+from corpus import generate_lines
+from main import build_parser, flag_conflict, stream_mode
+from resumable import (
+    build_range_index,
+    load_state,
+    validate_file,
+    validate_range,
+    write_state,
+    _part_path,
+    _parts_dir
+)
+
+
+# --------------------------------------------
+# Resumable File Mode Tests
+# --------------------------------------------
+
+RANGE_SIZE = 4096
+
+
+def write_input(directory: str) -> str:
+    lines = list(generate_lines(3000, seed=11))
+    path = os.path.join(directory, "input.ndjson")
+
+    with open(path, "w", encoding="utf-8") as f:
+        # A blank line, a malformed line and no trailing newline.
+        f.write("\n".join(lines[:100]) + "\n\n{broken\n" + "\n".join(lines[100:]))
+
+    return path
+
+
+def sequential_output(path: str) -> str:
+    sink = io.StringIO()
+
+    with open(path, "r", encoding="utf-8") as source:
+        stream_mode(source, sink)
+
+    return sink.getvalue()
+
+
+def read(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def test_ranges_cover_file_on_line_boundaries():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_input(directory)
+        ranges = build_range_index(path, RANGE_SIZE)
+
+        with open(path, "rb") as f:
+            data = f.read()
+
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start and data[end - 1:end] == b"\n"
+
+
+def test_matches_sequential_run():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_input(directory)
+
+        for workers in (1, 2):
+            output = os.path.join(directory, f"out{workers}.ndjson")
+            report = validate_file(path, output, workers, RANGE_SIZE)
+
+            assert read(output) == sequential_output(path)
+            assert report["results"] == 3001
+            assert not os.path.exists(_parts_dir(output))
+
+
+def test_interrupted_run_resumes():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_input(directory)
+        output = os.path.join(directory, "out.ndjson")
+
+        # Simulate a run that stopped after every other range.
+        state = load_state(path, output, RANGE_SIZE)
+        os.makedirs(_parts_dir(output))
+
+        for number, (start, end) in enumerate(state["ranges"]):
+            if number % 2 == 0:
+                count = validate_range(path, start, end, _part_path(output, number))
+                state["completed"][str(number)] = count
+
+        write_state(output, state)
+
+        report = validate_file(path, output, 1, RANGE_SIZE)
+
+        assert report["resumed_ranges"] == (len(state["ranges"]) + 1) // 2
+        assert read(output) == sequential_output(path)
+
+
+def test_changed_source_discards_stale_state():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_input(directory)
+        output = os.path.join(directory, "out.ndjson")
+
+        state = load_state(path, output, RANGE_SIZE)
+        state["completed"] = {"0": 1}
+        state["identity"]["size"] += 1
+        os.makedirs(_parts_dir(output))
+        write_state(output, state)
+
+        with open(_part_path(output, 0), "w") as f:
+            f.write("stale\n")
+
+        report = validate_file(path, output, 1, RANGE_SIZE)
+
+        assert report["resumed_ranges"] == 0
+        assert read(output) == sequential_output(path)
+
+
+def test_line_endings_and_encoding_match_sequential_run():
+    with tempfile.TemporaryDirectory() as directory:
+        lines = list(generate_lines(200, seed=5))
+        path = os.path.join(directory, "input.ndjson")
+
+        with open(path, "wb") as f:
+            f.write(("\r\n".join(lines[:100]) + "\r" + "\r\r\n".join(lines[100:]) + "\r")
+                    .encode("utf-8"))
+
+        output = os.path.join(directory, "out.ndjson")
+        report = validate_file(path, output, 1, RANGE_SIZE)
+
+        assert read(output) == sequential_output(path)
+        assert report["results"] == 200
+
+        with open(path, "ab") as f:
+            f.write(b"\n" + lines[0].encode("utf-8")[:-1] + b"\xff}\n")
+
+        for reader in (sequential_output, lambda p: validate_file(p, output, 1, RANGE_SIZE)):
+            try:
+                reader(path)
+            except UnicodeDecodeError:
+                pass
+            else:
+                raise AssertionError("Invalid UTF-8 was not rejected")
+
+
+def test_resumable_flag_conflicts():
+    def conflict(*argv):
+        args = build_parser().parse_args(["in.ndjson", *argv])
+        args.input = args.input[0]
+        return flag_conflict(args)
+
+    assert conflict("--ndjson", "--resumable", "out.ndjson") is None
+    assert conflict("--ndjson", "--resumable", "out", "--summary").startswith("--summary")
+    assert conflict("--ndjson", "--resumable", "out", "--format", "binary") \
+        .startswith("--format binary")
+    assert conflict("--ndjson", "--resumable", "out", "--metrics", "m.prom") \
+        .startswith("--resumable")
+    assert conflict("--resumable", "out") == "--resumable requires --ndjson"
+
+
+if __name__ == "__main__":
+    test_ranges_cover_file_on_line_boundaries()
+    test_matches_sequential_run()
+    test_interrupted_run_resumes()
+    test_changed_source_discards_stale_state()
+    test_line_endings_and_encoding_match_sequential_run()
+    test_resumable_flag_conflicts()
+    print("Resumable file mode tests passed.")
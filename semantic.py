@@ -1,4 +1,294 @@
-def evaluate_constraints(constraints: list, context: dict) -> dict:
+from functools import lru_cache
+from itertools import repeat
+from operator import itemgetter, ne
+
+from grammar import DEFAULT_OPERATOR
+from model import ConstraintSet
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+# --------------------------------------------
+# Constraint Plan Compilation
+# --------------------------------------------
+#
+# A plan is a ConstraintSet compiled once into (index, field, op,
+# operand) steps plus a first-failure function. The operand is the
+# expected value for eq, a frozenset for in/not_in and a (low, high)
+# pair for between (see grammar.CONSTRAINT_OPERATORS). Well-formed sets
+# are compiled to straight-line code and cached under a canonical key.
+# A malformed constraint compiles to an error step that raises only when
+# evaluation reaches it, exactly as the sequential loop does.
+
+PLAN_CACHE_SIZE = 1024
+
+_INVALID = object()
+
+_DICT = repeat(dict)
+
+_OP = repeat("op")
+
+_FIELD_VALUE = itemgetter("field", "value")
+
+_NUMBERS = (int, float)
+
+
+def _operand(constraint: dict) -> tuple:
+    # (op, operand) of a constraint with field and value; raises
+    # ValueError for an unknown operator or a malformed operand.
+    op = constraint.get("op", DEFAULT_OPERATOR)
+    value = constraint["value"]
+
+    if op == "eq":
+        return op, value
+
+    if op == "in" or op == "not_in":
+        if not isinstance(value, list):
+            raise ValueError("Membership value must be a list")
+
+        try:
+            return op, frozenset(value)
+        except TypeError:
+            raise ValueError("Membership values must be scalars")
+
+    if op == "between":
+        if not isinstance(value, list) or len(value) != 2 or \
+                type(value[0]) not in _NUMBERS or type(value[1]) not in _NUMBERS:
+            raise ValueError("Range value must be [low, high] numbers")
+
+        return op, (value[0], value[1])
+
+    raise ValueError(f"Unknown constraint operator: {op!r}")
+
+
+def _member(actual, members: frozenset) -> bool:
+    # Unhashable values (lists, dictionaries) are never set members.
+    try:
+        return actual in members
+    except TypeError:
+        return False
+
+
+def _fails(context: dict, field, op: str, operand) -> bool:
+    if field not in context:
+        return True
+
+    actual = context[field]
+
+    if op == "eq":
+        return actual != operand
+
+    if op == "between":
+        return type(actual) not in _NUMBERS or not operand[0] <= actual <= operand[1]
+
+    member = _member(actual, operand)
+    return member if op == "not_in" else not member
+
+
+class ConstraintPlan:
+    __slots__ = ("steps", "first_failure", "field_indices")
+
+    def __init__(self, steps: tuple, first_failure):
+        self.steps = steps
+        self.first_failure = first_failure
+
+        # field -> constraint indices, built on first incremental use.
+        self.field_indices = None
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+
+def _loop_evaluator(steps: tuple):
+    def first_failure(context: dict):
+        for index, field, op, operand in steps:
+
+            if field is _INVALID:
+                raise ValueError(operand)
+
+            if _fails(context, field, op, operand):
+                return index
+
+        return None
+
+    return first_failure
+
+
+# Failure test per operator, for field f{i} and operand v{i} (low l{i}
+# and high h{i} for between).
+_GENERATED_TESTS = {
+    "eq": "context[f{i}] != v{i}",
+    "in": "not _member(context[f{i}], v{i})",
+    "not_in": "_member(context[f{i}], v{i})",
+    "between": "type(context[f{i}]) not in _NUMBERS or not l{i} <= context[f{i}] <= h{i}"
+}
+
+
+def _generated_evaluator(steps: tuple):
+    # Fields and values are bound through the namespace, never
+    # interpolated into the source text.
+    namespace = {"_member": _member, "_NUMBERS": _NUMBERS}
+    source = ["def first_failure(context):"]
+
+    for index, field, op, operand in steps:
+        namespace[f"f{index}"] = field
+
+        if op == "between":
+            namespace[f"l{index}"], namespace[f"h{index}"] = operand
+        else:
+            namespace[f"v{index}"] = operand
+
+        test = _GENERATED_TESTS[op].format(i=index)
+        source.append(f"    if f{index} not in context or {test}:")
+        source.append(f"        return {index}")
+
+    source.append("    return None")
+
+    exec("\n".join(source), namespace)
+    return namespace["first_failure"]
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _compile_key(key: tuple) -> ConstraintPlan:
+    # Key entries are (field, value) for equality and (field, value,
+    # op) otherwise, with list values turned into tuples.
+    steps = []
+
+    for index, entry in enumerate(key):
+        if len(entry) == 2:
+            steps.append((index, entry[0], "eq", entry[1]))
+        else:
+            field, value, op = entry
+            steps.append((index, field) + _operand({"value": list(value), "op": op}))
+
+    steps = tuple(steps)
+    return ConstraintPlan(steps, _generated_evaluator(steps))
+
+
+def _operator_key(constraint: dict) -> tuple:
+    op = constraint.get("op", DEFAULT_OPERATOR)
+    value = constraint["value"]
+
+    if op == "eq":
+        return constraint["field"], value
+
+    # Malformed operators and operands are compiled without caching.
+    _operand(constraint)
+    return constraint["field"], tuple(value), op
+
+
+def _compile_uncached(constraints: list) -> ConstraintPlan:
+    steps = []
+
+    for index, constraint in enumerate(constraints):
+
+        if not isinstance(constraint, dict):
+            steps.append((index, _INVALID, None, "Invalid constraint structure"))
+            break
+
+        if "field" not in constraint or "value" not in constraint:
+            steps.append((index, _INVALID, None, "Constraint must contain field and value"))
+            break
+
+        try:
+            steps.append((index, constraint["field"]) + _operand(constraint))
+        except ValueError as error:
+            steps.append((index, _INVALID, None, str(error)))
+            break
+
+    steps = tuple(steps)
+    return ConstraintPlan(steps, _loop_evaluator(steps))
+
+
+def compile_constraints(constraints: list) -> ConstraintPlan:
+    """
+    Compiles a ConstraintSet (a list of constraint dictionaries or a
+    model.ConstraintSet) into a reusable evaluation plan.
+
+    Building the cache key reads every field/value once, so a plan
+    pays off when it is reused for the same ConstraintSet across
+    many contexts (pass it to evaluate_constraints via plan=).
+    """
+
+    if type(constraints) is ConstraintSet:
+        key = tuple([(c.field, c.value) for c in constraints.items])
+
+        try:
+            return _compile_key(key)
+        except TypeError:
+            return _compile_uncached(constraints.to_list())
+
+    if not isinstance(constraints, list):
+        raise ValueError("ConstraintSet must be a list")
+
+    if not all(map(isinstance, constraints, _DICT)):
+        return _compile_uncached(constraints)
+
+    try:
+        if any(map(dict.__contains__, constraints, _OP)):
+            key = tuple(map(_operator_key, constraints))
+        else:
+            key = tuple(map(_FIELD_VALUE, constraints))
+    except (KeyError, ValueError):
+        return _compile_uncached(constraints)
+
+    try:
+        return _compile_key(key)
+    except TypeError:
+        # Unhashable field or value: compile without caching.
+        return _compile_uncached(constraints)
+
+
+def plan_cache_info():
+    return _compile_key.cache_info()
+
+
+def clear_plan_cache() -> None:
+    _compile_key.cache_clear()
+
+
+# --------------------------------------------
+# Sequential Constraint Evaluation
+# --------------------------------------------
+
+def _satisfied() -> dict:
+    return {
+        "status": "Satisfied",
+        "failed_constraint": None,
+        "failed_index": None
+    }
+
+
+def _failed(constraint, index: int) -> dict:
+    return {
+        "status": "Failed",
+        "failed_constraint": constraint,
+        "failed_index": index
+    }
+
+
+def evaluate_constraints(constraints: list, context: dict, plan: ConstraintPlan = None) -> dict:
+    """
+    Evaluates constraints in declared order and reports the first
+    failure. A plan from compile_constraints(constraints) may be
+    passed to skip per-constraint parsing. constraints may also be a
+    model.ConstraintSet.
+    """
+
+    if plan is not None:
+        index = plan.first_failure(context)
+
+        if index is None:
+            return _satisfied()
+
+        return _failed(constraints[index], index)
+
+    if type(constraints) is ConstraintSet:
+        return _evaluate_compact(constraints, context)
+
     if not isinstance(constraints, list):
         raise ValueError("ConstraintSet must be a list")
 
@@ -11,26 +301,274 @@ def evaluate_constraints(constraints: list, context: dict) -> dict:
             raise ValueError("Constraint must contain field and value")
 
         field = constraint["field"]
+
+        if "op" in constraint:
+            if _fails(context, field, *_operand(constraint)):
+                return _failed(constraint, index)
+            continue
+
         expected = constraint["value"]
 
         if field not in context:
-            return {
-                "status": "Failed",
-                "failed_constraint": constraint,
-                "failed_index": index
-            }
+            return _failed(constraint, index)
 
         actual = context[field]
 
         if actual != expected:
-            return {
-                "status": "Failed",
-                "failed_constraint": constraint,
-                "failed_index": index
-            }
+            return _failed(constraint, index)
 
-    return {
-        "status": "Satisfied",
-        "failed_constraint": None,
-        "failed_index": None
-    }
+    return _satisfied()
+
+
+def _evaluate_compact(constraints: ConstraintSet, context: dict) -> dict:
+    # Constraint objects are well-formed by construction; the failed
+    # constraint is reported as a Constraint.
+    for index, constraint in enumerate(constraints.items):
+        field = constraint.field
+
+        if field not in context or context[field] != constraint.value:
+            return _failed(constraint, index)
+
+    return _satisfied()
+
+
+# --------------------------------------------
+# Incremental Re-Evaluation (Context Deltas)
+# --------------------------------------------
+#
+# Given the first failing index f of a previous evaluation and the
+# fields that changed since, only these constraints need checking:
+# changed ones before f (all others there still hold), f itself if its
+# field changed (otherwise it still fails), and, once f holds, every
+# constraint after f (none of them was evaluated before).
+
+def _field_indices(plan: ConstraintPlan) -> dict:
+    if plan.field_indices is None:
+        indices = {}
+
+        for index, field, _, _ in plan.steps:
+            indices.setdefault(field, []).append(index)
+
+        plan.field_indices = indices
+
+    return plan.field_indices
+
+
+def _step_fails(step: tuple, context: dict) -> bool:
+    _, field, op, operand = step
+
+    if field is _INVALID:
+        raise ValueError(operand)
+
+    return _fails(context, field, op, operand)
+
+
+def reevaluate_constraints(
+    constraints: list,
+    context: dict,
+    previous_index,
+    changed_fields,
+    plan: ConstraintPlan = None
+) -> dict:
+    """
+    Re-evaluates constraints after the context fields in changed_fields
+    were set or removed. previous_index is the failed_index of the
+    evaluation before the change (None if all were satisfied). Returns
+    exactly what evaluate_constraints(constraints, context) returns.
+    """
+
+    if plan is None:
+        plan = compile_constraints(constraints)
+
+    steps = plan.steps
+    end = len(steps) if previous_index is None else previous_index
+
+    try:
+        field_indices = _field_indices(plan)
+    except TypeError:
+        # Unhashable constraint field: no index, evaluate in full.
+        return evaluate_constraints(constraints, context)
+
+    changed = sorted({
+        index
+        for field in changed_fields
+        for index in field_indices.get(field, ())
+    })
+
+    for index in changed:
+        if index >= end:
+            break
+
+        if _step_fails(steps[index], context):
+            return _failed(constraints[index], index)
+
+    if previous_index is None:
+        return _satisfied()
+
+    if previous_index not in changed or _step_fails(steps[previous_index], context):
+        return _failed(constraints[previous_index], previous_index)
+
+    for step in steps[previous_index + 1:]:
+        if _step_fails(step, context):
+            return _failed(constraints[step[0]], step[0])
+
+    return _satisfied()
+
+
+# --------------------------------------------
+# Batch Evaluation (One ConstraintSet, Many Contexts)
+# --------------------------------------------
+#
+# Each constrained field becomes a column across all contexts. Numeric
+# columns are compared as NumPy arrays; anything else is compared with
+# Python's own != so results match the sequential loop exactly. A row's
+# first failure is the lowest constraint index whose column fails on it.
+
+_EXACT_FLOAT_LIMIT = 2 ** 53
+
+
+def _numeric_column(values: list, *operands):
+    # A NumPy column for values, or None when comparing it with the
+    # operands in float64 could differ from Python's exact comparison.
+    for operand in operands:
+        if type(operand) not in (int, float, bool) or abs(operand) >= _EXACT_FLOAT_LIMIT:
+            return None
+
+    try:
+        column = np.array(values)
+    except (OverflowError, TypeError, ValueError):
+        return None
+
+    if column.ndim != 1 or column.dtype.kind not in "biuf" or not len(column):
+        return None
+
+    kind = column.dtype.kind
+
+    # Ints of magnitude 2**53 or more are rounded once promoted to
+    # float64: in a mixed column, against a float operand, or (for
+    # uint64) against any operand. Values already rounded to float64
+    # can land on 2**53 exactly, hence >=.
+    if kind == "f":
+        if np.nanmax(np.abs(column)) >= _EXACT_FLOAT_LIMIT:
+            return None
+
+    elif kind in "iu" and (
+        column.max() >= _EXACT_FLOAT_LIMIT or column.min() <= -_EXACT_FLOAT_LIMIT
+    ):
+        if kind == "u" or any(type(operand) is float for operand in operands):
+            return None
+
+    return column
+
+
+def _field_column(contexts: list, field):
+    present = np.fromiter(
+        map(dict.__contains__, contexts, repeat(field)),
+        dtype=bool,
+        count=len(contexts)
+    )
+    values = list(map(dict.get, contexts, repeat(field), repeat(0)))
+    return present, values
+
+
+def _column_failures(present, values: list, op: str, operand):
+    if op == "eq":
+        column = _numeric_column(values, operand)
+
+        if column is not None:
+            return ~present | (column != operand)
+
+        predicate = map(ne, values, repeat(operand))
+
+    elif op == "between":
+        low, high = operand
+
+        # Vectorized only for plain int/float columns: bools and other
+        # types never fall in a range.
+        if set(map(type, values)) <= set(_NUMBERS):
+            column = _numeric_column(values, low, high)
+
+            if column is not None:
+                # Written as a negated range test so NaN, which fails
+                # low <= actual <= high, fails here too.
+                return ~present | ~((column >= low) & (column <= high))
+
+        predicate = (
+            type(value) not in _NUMBERS or not low <= value <= high
+            for value in values
+        )
+
+    else:
+        members = map(_member, values, repeat(operand))
+        predicate = members if op == "not_in" else (not member for member in members)
+
+    mismatched = np.fromiter(predicate, dtype=bool, count=len(values))
+    return ~present | mismatched
+
+
+def first_failure_indices(constraints: list, contexts: list, plan: ConstraintPlan = None):
+    """
+    Returns, for every context, the index of the first failing
+    constraint or -1 when all constraints are satisfied.
+
+    Uses vectorized column comparisons when NumPy is installed
+    (returning an int64 array) and the sequential plan otherwise
+    (returning a list).
+    """
+
+    if plan is None:
+        plan = compile_constraints(constraints)
+
+    if np is None or not all(map(isinstance, contexts, repeat(dict))):
+        failures = []
+
+        for context in contexts:
+            index = plan.first_failure(context)
+            failures.append(-1 if index is None else index)
+
+        return failures
+
+    first = np.full(len(contexts), -1, dtype=np.int64)
+    undecided = np.ones(len(contexts), dtype=bool)
+    columns = {}
+
+    for index, field, op, operand in plan.steps:
+
+        if not undecided.any():
+            break
+
+        if field is _INVALID:
+            raise ValueError(operand)
+
+        if field not in columns:
+            columns[field] = _field_column(contexts, field)
+
+        present, values = columns[field]
+
+        failing = undecided & _column_failures(present, values, op, operand)
+        first[failing] = index
+        undecided &= ~failing
+
+    return first
+
+
+def evaluate_constraints_batch(constraints: list, contexts: list) -> list:
+    """
+    Evaluates one ConstraintSet against many contexts. The result
+    list matches [evaluate_constraints(constraints, c) for c in contexts].
+    """
+
+    indices = first_failure_indices(constraints, contexts)
+
+    if np is not None and isinstance(indices, np.ndarray):
+        indices = indices.tolist()
+
+    results = []
+
+    for index in indices:
+        if index < 0:
+            results.append(_satisfied())
+        else:
+            results.append(_failed(constraints[index], index))
+
+    return results
@@ -0,0 +1,153 @@
+import semantic
+from semantic import (
+    evaluate_constraints,
+    evaluate_constraints_batch,
+    compile_constraints,
+    clear_plan_cache,
+    plan_cache_info
+)
+
+
+# --------------------------------------------
+# Compiled Constraint Plan Tests
+# --------------------------------------------
+
+CONSTRAINTS = [
+    {"field": "verified", "value": True},
+    {"field": "balance", "value": 5000},
+    {"field": "tier", "value": "gold"}
+]
+
+CONTEXTS = [
+    {"verified": True, "balance": 5000, "tier": "gold"},
+    {"verified": False, "balance": 5000, "tier": "gold"},
+    {"verified": True, "balance": 100, "tier": "gold"},
+    {"verified": True, "balance": 5000},
+    {},
+    {"verified": 1, "balance": 5000.0, "tier": "gold"}
+]
+
+
+def test_plan_matches_sequential_evaluation():
+    plan = compile_constraints(CONSTRAINTS)
+
+    for context in CONTEXTS:
+        expected = evaluate_constraints(CONSTRAINTS, context)
+        actual = evaluate_constraints(CONSTRAINTS, context, plan=plan)
+
+        assert actual == expected, f"Plan diverged for {context}: {actual}"
+        assert actual["failed_constraint"] is expected["failed_constraint"]
+
+
+def test_repeated_sets_hit_cache():
+    clear_plan_cache()
+
+    first = compile_constraints([dict(c) for c in CONSTRAINTS])
+    second = compile_constraints([dict(c) for c in CONSTRAINTS])
+
+    assert first is second, "Equal ConstraintSets compiled twice"
+    assert plan_cache_info().hits == 1
+
+
+def test_failed_constraint_reported_from_caller_list():
+    constraints = [{"field": "balance", "value": 5000}]
+    plan = compile_constraints([{"field": "balance", "value": 5000}])
+
+    result = evaluate_constraints(constraints, {"balance": 1}, plan=plan)
+
+    assert result["failed_constraint"] is constraints[0]
+    assert result["failed_index"] == 0
+
+
+def test_malformed_constraint_raises_only_when_reached():
+    constraints = [{"field": "balance", "value": 5000}, "invalid"]
+    plan = compile_constraints(constraints)
+
+    result = evaluate_constraints(constraints, {"balance": 1}, plan=plan)
+    assert result["failed_index"] == 0
+
+    try:
+        evaluate_constraints(constraints, {"balance": 5000}, plan=plan)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Malformed constraint was not reported")
+
+
+def test_unhashable_values_compile_uncached():
+    constraints = [{"field": "tags", "value": ["a", "b"]}]
+    plan = compile_constraints(constraints)
+
+    assert plan.first_failure({"tags": ["a", "b"]}) is None
+    assert plan.first_failure({"tags": ["a"]}) == 0
+
+
+# --------------------------------------------
+# Batch (Columnar) Evaluation
+# --------------------------------------------
+
+BATCH_CONTEXTS = CONTEXTS + [
+    {"verified": True, "balance": "5000", "tier": "gold"},
+    {"verified": True, "balance": None, "tier": "gold"},
+    {"verified": True, "balance": 5000, "tier": ["gold"]},
+    {"verified": True, "balance": 2 ** 60, "tier": "gold"},
+    {"verified": None, "balance": 5000.5, "tier": 5}
+]
+
+
+def test_batch_matches_sequential_evaluation():
+    expected = [evaluate_constraints(CONSTRAINTS, c) for c in BATCH_CONTEXTS]
+
+    assert evaluate_constraints_batch(CONSTRAINTS, BATCH_CONTEXTS) == expected
+
+
+def test_batch_numeric_column_only():
+    constraints = [{"field": "balance", "value": 5000}]
+    contexts = [{"balance": 5000}, {"balance": 5000.0}, {"balance": 1}, {}]
+
+    results = evaluate_constraints_batch(constraints, contexts)
+
+    assert [r["failed_index"] for r in results] == [None, None, 0, 0]
+
+
+def test_batch_large_ints_match_sequential():
+    big = 2 ** 53 + 1
+    cases = [
+        ([{"field": "x", "value": 9007199254740992.0}], [big, 1]),
+        ([{"field": "x", "op": "between", "value": [0, 9007199254740992.0]}], [big, 1]),
+        ([{"field": "x", "op": "between", "value": [0, 2 ** 53]}], [big, 1.5, 1]),
+        ([{"field": "x", "value": 2 ** 53}], [big, 2 ** 53, 2 ** 64 - 1]),
+        ([{"field": "x", "value": 5}], [big, 5, -big])
+    ]
+
+    for constraints, values in cases:
+        contexts = [{"x": value} for value in values]
+        expected = [evaluate_constraints(constraints, c) for c in contexts]
+
+        assert evaluate_constraints_batch(constraints, contexts) == expected, constraints
+
+    assert evaluate_constraints_batch(cases[0][0], [{"x": big}])[0]["failed_index"] == 0
+
+
+def test_batch_without_numpy():
+    saved = semantic.np
+    semantic.np = None
+
+    try:
+        expected = [evaluate_constraints(CONSTRAINTS, c) for c in BATCH_CONTEXTS]
+        assert evaluate_constraints_batch(CONSTRAINTS, BATCH_CONTEXTS) == expected
+    finally:
+        semantic.np = saved
+
+
+if __name__ == "__main__":
+    test_plan_matches_sequential_evaluation()
+    test_repeated_sets_hit_cache()
+    test_failed_constraint_reported_from_caller_list()
+    test_malformed_constraint_raises_only_when_reached()
+    test_unhashable_values_compile_uncached()
+    test_batch_matches_sequential_evaluation()
+    test_batch_numeric_column_only()
+    test_batch_large_ints_match_sequential()
+    test_batch_without_numpy()
+    print("Constraint plan tests passed.")
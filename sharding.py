@@ -0,0 +1,352 @@
+import argparse
+import hashlib
+import heapq
+import json
+import os
+import subprocess
+import sys
+from decoder import decode_sentence
+from fingerprint import RollingFingerprint
+from main import encode_result, validate_line
+
+
+# --------------------------------------------
+# Deterministic Sharded Validation
+# --------------------------------------------
+#
+# plan   splits an NDJSON input into shard inputs by a stable hash of
+#        the sentence text (or of its actor). Every line keeps its
+#        input ordinal: "<ordinal>\t<sentence>".
+# work   validates one shard (on any host) into "<ordinal>\t<result>"
+#        lines plus a manifest with counts and fingerprints.
+# merge  checks every manifest against the plan (count and fingerprint
+#        of the shard input it was given) and the shard results,
+#        then merges the results back into input order. Its report
+#        carries the Merkle root of the merged results (fingerprint.py).
+#
+# The merged output equals a sequential `main.py --ndjson` run, so it
+# is the same for any shard count. Shard directory layout:
+#   plan.json
+#   shard-NNNN.input.ndjson
+#   shard-NNNN.results.ndjson
+#   shard-NNNN.manifest.json
+
+SHARD_KEYS = ("sentence", "actor")
+
+_WORKER_SCRIPT = os.path.abspath(__file__)
+
+
+class ShardMergeError(Exception):
+    pass
+
+
+def stable_hash(text: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=8).digest(),
+        "big"
+    )
+
+
+def shard_key(line: str, key: str) -> str:
+    """
+    The text hashed to place a line. Lines without a string actor
+    (malformed or structurally broken) fall back to the sentence text.
+    """
+
+    if key == "actor":
+        try:
+            actor = decode_sentence(line).get("actor")
+        except (ValueError, AttributeError):
+            actor = None
+
+        if isinstance(actor, str):
+            return actor
+
+    return line
+
+
+def _shard_path(directory: str, shard: int, kind: str) -> str:
+    return os.path.join(directory, f"shard-{shard:04d}.{kind}")
+
+
+class _Fingerprint:
+    # Ordered fingerprint of a sequence of lines.
+
+    def __init__(self):
+        self._hash = hashlib.blake2b(digest_size=16)
+
+    def update(self, line: str):
+        self._hash.update(line.encode("utf-8"))
+        self._hash.update(b"\n")
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+# ---------- Planner ----------
+
+def plan_shards(input_path: str, directory: str, shards: int, key: str = "sentence") -> dict:
+    if shards < 1:
+        raise ValueError("shards must be positive")
+
+    if key not in SHARD_KEYS:
+        raise ValueError(f"Unknown shard key: {key}")
+
+    os.makedirs(directory, exist_ok=True)
+
+    sinks = [
+        open(_shard_path(directory, shard, "input.ndjson"), "w", encoding="utf-8")
+        for shard in range(shards)
+    ]
+    counts = [0] * shards
+    fingerprint = _Fingerprint()
+    shard_fingerprints = [_Fingerprint() for _ in range(shards)]
+    ordinal = 0
+
+    try:
+        with open(input_path, "r", encoding="utf-8") as source:
+            for line in source:
+                line = line.strip()
+
+                if not line:
+                    continue
+
+                shard = stable_hash(shard_key(line, key)) % shards
+                sinks[shard].write(f"{ordinal}\t{line}\n")
+                counts[shard] += 1
+                shard_fingerprints[shard].update(f"{ordinal}\t{line}")
+                fingerprint.update(line)
+                ordinal += 1
+    finally:
+        for sink in sinks:
+            sink.close()
+
+    plan = {
+        "shards": shards,
+        "key": key,
+        "sentences": ordinal,
+        "input_fingerprint": fingerprint.hexdigest(),
+        "shard_counts": counts,
+        "shard_input_fingerprints": [f.hexdigest() for f in shard_fingerprints]
+    }
+
+    with open(os.path.join(directory, "plan.json"), "w", encoding="utf-8") as f:
+        json.dump(plan, f, indent=2)
+
+    return plan
+
+
+# ---------- Worker ----------
+
+def run_shard(directory: str, shard: int) -> dict:
+    input_fingerprint = _Fingerprint()
+    result_fingerprint = _Fingerprint()
+    count = 0
+
+    results_path = _shard_path(directory, shard, "results.ndjson")
+
+    with open(_shard_path(directory, shard, "input.ndjson"), "r", encoding="utf-8") as source, \
+            open(results_path + ".tmp", "w", encoding="utf-8") as sink:
+
+        for tagged in source:
+            ordinal, _, line = tagged.rstrip("\n").partition("\t")
+            encoded = encode_result(validate_line(line))
+
+            sink.write(f"{ordinal}\t{encoded}\n")
+            input_fingerprint.update(tagged.rstrip("\n"))
+            result_fingerprint.update(f"{ordinal}\t{encoded}")
+            count += 1
+
+    os.replace(results_path + ".tmp", results_path)
+
+    manifest = {
+        "shard": shard,
+        "count": count,
+        "input_fingerprint": input_fingerprint.hexdigest(),
+        "result_fingerprint": result_fingerprint.hexdigest()
+    }
+
+    with open(_shard_path(directory, shard, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+# ---------- Merge ----------
+
+def _read_json(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def verify_shard(directory: str, shard: int, plan: dict) -> dict:
+    try:
+        manifest = _read_json(_shard_path(directory, shard, "manifest.json"))
+    except OSError:
+        raise ShardMergeError(f"Shard {shard} has no manifest")
+
+    expected_count = plan["shard_counts"][shard]
+
+    if manifest["shard"] != shard or manifest["count"] != expected_count:
+        raise ShardMergeError(
+            f"Shard {shard} manifest reports {manifest['count']} results, "
+            f"plan expects {expected_count}"
+        )
+
+    # A worker given a stale or edited shard input reports a different
+    # input fingerprint, even with the same number of sentences.
+    if manifest["input_fingerprint"] != plan["shard_input_fingerprints"][shard]:
+        raise ShardMergeError(f"Shard {shard} was validated from a different input")
+
+    fingerprint = _Fingerprint()
+    count = 0
+
+    with open(_shard_path(directory, shard, "results.ndjson"), "r", encoding="utf-8") as f:
+        for line in f:
+            fingerprint.update(line.rstrip("\n"))
+            count += 1
+
+    if count != manifest["count"] or \
+            fingerprint.hexdigest() != manifest["result_fingerprint"]:
+        raise ShardMergeError(f"Shard {shard} results do not match its manifest")
+
+    return manifest
+
+
+def _tagged_results(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            ordinal, _, encoded = line.rstrip("\n").partition("\t")
+            yield int(ordinal), encoded
+
+
+def merge_shards(directory: str, output: str) -> dict:
+    """
+    Verifies every shard against plan.json and its manifest, then
+    writes all results to output in input order. Raises
+    ShardMergeError if a shard is missing, incomplete or altered.
+    """
+
+    plan = _read_json(os.path.join(directory, "plan.json"))
+
+    for shard in range(plan["shards"]):
+        verify_shard(directory, shard, plan)
+
+    streams = [
+        _tagged_results(_shard_path(directory, shard, "results.ndjson"))
+        for shard in range(plan["shards"])
+    ]
+    fingerprint = RollingFingerprint()
+    expected = 0
+
+    with open(output + ".tmp", "w", encoding="utf-8") as sink:
+        for ordinal, encoded in heapq.merge(*streams):
+            if ordinal != expected:
+                raise ShardMergeError(f"Result for sentence {expected} is missing")
+
+            sink.write(encoded)
+            sink.write("\n")
+            fingerprint.add(json.loads(encoded))
+            expected += 1
+
+    if expected != plan["sentences"]:
+        raise ShardMergeError(f"Merged {expected} results, plan has {plan['sentences']}")
+
+    os.replace(output + ".tmp", output)
+
+    return {
+        "shards": plan["shards"],
+        "results": expected,
+        "input_fingerprint": plan["input_fingerprint"],
+        "output_fingerprint": fingerprint.hexdigest()
+    }
+
+
+# ---------- Local Cluster ----------
+
+def run_local(
+    input_path: str,
+    output: str,
+    directory: str,
+    shards: int,
+    workers: int = 1,
+    key: str = "sentence"
+) -> dict:
+    """
+    Plans, validates every shard in a separate worker process (up to
+    workers at a time, standing in for hosts) and merges. If a worker
+    fails, the others are terminated before ShardMergeError is raised.
+    """
+
+    plan_shards(input_path, directory, shards, key)
+    pending = list(range(shards))
+    running = []
+
+    while pending or running:
+        while pending and len(running) < max(workers, 1):
+            shard = pending.pop(0)
+            running.append((shard, subprocess.Popen(
+                [sys.executable, _WORKER_SCRIPT, "work", directory, str(shard)],
+                stdout=subprocess.DEVNULL
+            )))
+
+        shard, process = running.pop(0)
+
+        if process.wait() != 0:
+            for _, other in running:
+                other.terminate()
+
+            for _, other in running:
+                other.wait()
+
+            raise ShardMergeError(f"Worker for shard {shard} exited with {process.returncode}")
+
+    return merge_shards(directory, output)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Sharded validation")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    plan = commands.add_parser("plan", help="split INPUT into shards in DIR")
+    plan.add_argument("input")
+    plan.add_argument("directory")
+    plan.add_argument("--shards", type=int, required=True)
+    plan.add_argument("--key", choices=SHARD_KEYS, default="sentence")
+
+    work = commands.add_parser("work", help="validate one shard of DIR")
+    work.add_argument("directory")
+    work.add_argument("shard", type=int)
+
+    merge = commands.add_parser("merge", help="merge verified shards into OUTPUT")
+    merge.add_argument("directory")
+    merge.add_argument("output")
+
+    run = commands.add_parser("run", help="plan, work and merge on this machine")
+    run.add_argument("input")
+    run.add_argument("output")
+    run.add_argument("--directory", required=True)
+    run.add_argument("--shards", type=int, required=True)
+    run.add_argument("--workers", type=int, default=1)
+    run.add_argument("--key", choices=SHARD_KEYS, default="sentence")
+
+    return parser
+
+
+if __name__ == "__main__":
+
+    args = build_parser().parse_args()
+
+    if args.command == "plan":
+        report = plan_shards(args.input, args.directory, args.shards, args.key)
+    elif args.command == "work":
+        report = run_shard(args.directory, args.shard)
+    elif args.command == "merge":
+        report = merge_shards(args.directory, args.output)
+    else:
+        report = run_local(
+            args.input, args.output, args.directory,
+            args.shards, args.workers, args.key
+        )
+
+    print(json.dumps(report))
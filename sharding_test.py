@@ -0,0 +1,153 @@
+import io
+import os
+import tempfile
+from corpus import generate_lines
+from main import stream_mode
+from sharding import (
+    ShardMergeError,
+    merge_shards,
+    plan_shards,
+    run_local,
+    run_shard
+)
+
+
+# --------------------------------------------
+# Sharded Validation Tests
+# --------------------------------------------
+
+def write_input(directory: str) -> str:
+    path = os.path.join(directory, "input.ndjson")
+    lines = list(generate_lines(1500, seed=4))
+    lines[10] = "{broken"
+    lines[20] = ""
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+    return path
+
+
+def sequential_output(path: str) -> str:
+    sink = io.StringIO()
+
+    with open(path, "r", encoding="utf-8") as source:
+        stream_mode(source, sink)
+
+    return sink.getvalue()
+
+
+def read(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def shard_in_process(input_path: str, directory: str, shards: int, key: str = "sentence") -> str:
+    plan_shards(input_path, directory, shards, key)
+
+    for shard in range(shards):
+        run_shard(directory, shard)
+
+    output = os.path.join(directory, "merged.ndjson")
+    merge_shards(directory, output)
+    return output
+
+
+def test_output_is_independent_of_shard_count():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_input(directory)
+        expected = sequential_output(path)
+
+        for shards in (1, 3, 8):
+            for key in ("sentence", "actor"):
+                work = os.path.join(directory, f"{key}-{shards}")
+                assert read(shard_in_process(path, work, shards, key)) == expected
+
+
+def test_actor_key_keeps_actor_on_one_shard():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_input(directory)
+        plan_shards(path, directory, 4, "actor")
+        owners = {}
+
+        for shard in range(4):
+            with open(os.path.join(directory, f"shard-{shard:04d}.input.ndjson")) as f:
+                for line in f:
+                    actor = line.split('"actor":"', 1)[-1].split('"', 1)[0]
+                    assert owners.setdefault(actor, shard) == shard
+
+
+def test_tampered_shard_is_rejected():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_input(directory)
+        shard_in_process(path, directory, 2)
+
+        results = os.path.join(directory, "shard-0001.results.ndjson")
+        with open(results, "a", encoding="utf-8") as f:
+            f.write('999999\t{"classification":"Accepted + Allowed"}\n')
+
+        try:
+            merge_shards(directory, os.path.join(directory, "again.ndjson"))
+        except ShardMergeError:
+            return
+
+        raise AssertionError("Tampered shard was merged")
+
+
+def test_stale_shard_input_is_rejected():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_input(directory)
+        shard_in_process(path, directory, 2)
+
+        # Same number of sentences, one of them edited, then re-validated.
+        shard_input = os.path.join(directory, "shard-0000.input.ndjson")
+        lines = read(shard_input).splitlines()
+        ordinal, _, _ = lines[0].partition("\t")
+        lines[0] = f"{ordinal}\t{{broken"
+
+        with open(shard_input, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+        run_shard(directory, 0)
+
+        try:
+            merge_shards(directory, os.path.join(directory, "again.ndjson"))
+        except ShardMergeError as error:
+            assert "different input" in str(error)
+            return
+
+        raise AssertionError("Stale shard was merged")
+
+
+def test_lone_surrogate_actor_is_sharded():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "input.ndjson")
+        lines = list(generate_lines(50, seed=9))
+        lines.insert(7, lines[7].replace('"actor":"', '"actor":"\\ud800', 1))
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+        assert "\\ud800" in read(path)
+        assert read(shard_in_process(path, directory, 3, "actor")) == sequential_output(path)
+
+
+def test_local_worker_processes():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_input(directory)
+        output = os.path.join(directory, "out.ndjson")
+
+        report = run_local(path, output, os.path.join(directory, "shards"), 3, workers=2)
+
+        assert read(output) == sequential_output(path)
+        assert report["results"] == 1499
+
+
+if __name__ == "__main__":
+    test_output_is_independent_of_shard_count()
+    test_actor_key_keeps_actor_on_one_shard()
+    test_tampered_shard_is_rejected()
+    test_stale_shard_input_is_rejected()
+    test_lone_surrogate_actor_is_sharded()
+    test_local_worker_processes()
+    print("Sharded validation tests passed.")
@@ -0,0 +1,96 @@
+import io
+import json
+from main import stream_mode
+
+
+# --------------------------------------------
+# NDJSON Streaming Mode Tests
+# --------------------------------------------
+
+ALLOWED_LINE = json.dumps({
+    "actor": "User_001",
+    "intent": "Transfer",
+    "context": {"balance": 5000},
+    "constraints": [{"field": "balance", "value": 5000}],
+    "outcome": "Allowed"
+})
+
+REJECTED_LINE = json.dumps({
+    "intent": "Transfer",
+    "context": {"balance": 1000},
+    "constraints": [{"field": "balance", "value": 5000}],
+    "outcome": "Allowed"
+})
+
+
+def run_stream(text: str) -> list:
+    sink = io.StringIO()
+    stream_mode(io.StringIO(text), sink)
+    return sink.getvalue().splitlines()
+
+
+def test_one_compact_line_per_sentence():
+    lines = run_stream(ALLOWED_LINE + "\n" + REJECTED_LINE + "\n")
+
+    assert lines == [
+        '{"classification":"Accepted + Allowed"}',
+        '{"classification":"Rejected (Structural)","failure_class":"SF-01",'
+        '"message":"Missing required primitive: actor"}'
+    ], f"Unexpected stream output: {lines}"
+
+
+def test_blank_lines_skipped():
+    lines = run_stream("\n" + ALLOWED_LINE + "\n\n   \n")
+
+    assert len(lines) == 1, f"Blank lines produced output: {lines}"
+
+
+def test_malformed_lines_keep_stream_alive():
+    lines = run_stream("{not json\n[1, 2]\n" + ALLOWED_LINE + "\n")
+
+    assert [json.loads(line)["failure_class"] for line in lines[:2]] == \
+        ["SF-08", "SF-08"]
+    assert json.loads(lines[2]) == {"classification": "Accepted + Allowed"}
+
+
+def test_unhashable_outcome_keeps_stream_alive():
+    unhashable = json.dumps({
+        "actor": "User_001",
+        "intent": "Transfer",
+        "context": {"balance": 5000},
+        "constraints": [{"field": "balance", "value": 5000}],
+        "outcome": []
+    })
+
+    lines = run_stream(unhashable + "\n" + ALLOWED_LINE + "\n")
+
+    assert json.loads(lines[0])["failure_class"] == "SF-07"
+    assert json.loads(lines[1]) == {"classification": "Accepted + Allowed"}
+
+
+def test_unhashable_field_keeps_stream_alive():
+    lines = []
+
+    for field in ([1], {"a": 1}):
+        lines.append(json.dumps({
+            "actor": "User_001",
+            "intent": "Transfer",
+            "context": {"balance": 5000},
+            "constraints": [{"field": field, "value": 5000}],
+            "outcome": "Allowed"
+        }))
+
+    results = run_stream("\n".join(lines + [ALLOWED_LINE]) + "\n")
+
+    assert [json.loads(line).get("failure_class") for line in results] == \
+        ["SF-08", "SF-08", None]
+    assert json.loads(results[2]) == {"classification": "Accepted + Allowed"}
+
+
+if __name__ == "__main__":
+    test_one_compact_line_per_sentence()
+    test_blank_lines_skipped()
+    test_malformed_lines_keep_stream_alive()
+    test_unhashable_outcome_keeps_stream_alive()
+    test_unhashable_field_keeps_stream_alive()
+    print("Streaming mode tests passed.")
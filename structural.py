@@ -1,9 +1,12 @@
+from itertools import chain
+
 from grammar import (
     REQUIRED_PRIMITIVES,
-    OPTIONAL_PRIMITIVES,
     CANONICAL_ORDER,
-    VALID_OUTCOMES
+    VALID_OUTCOMES,
+    CONSTRAINT_OPERATORS
 )
+from model import Constraint, ConstraintSet, Sentence
 
 
 # --------------------------------------------
@@ -17,19 +20,60 @@ class StructuralValidationError(Exception):
         super().__init__(f"{code}: {message}")
 
 
+# --------------------------------------------
+# Precompiled Grammar Table
+# --------------------------------------------
+
+PRIMITIVE_POSITION = {
+    primitive: position
+    for position, primitive in enumerate(CANONICAL_ORDER)
+}
+
+REQUIRED_SET = frozenset(REQUIRED_PRIMITIVES)
+
+
+def _canonical_shapes() -> frozenset:
+    # Every canonical-order key sequence holding all required
+    # primitives plus any subset of the optional ones.
+    optional = [p for p in CANONICAL_ORDER if p not in REQUIRED_SET]
+    shapes = set()
+
+    for mask in range(1 << len(optional)):
+        present = {
+            primitive for bit, primitive in enumerate(optional)
+            if mask & (1 << bit)
+        }
+        shapes.add(tuple(
+            p for p in CANONICAL_ORDER
+            if p in REQUIRED_SET or p in present
+        ))
+
+    return frozenset(shapes)
+
+
+CANONICAL_SHAPES = _canonical_shapes()
+
+
 # --------------------------------------------
 # Canonical Order Enforcement
 # --------------------------------------------
 
-def check_canonical_order(sentence: dict) -> None:
-    keys = list(sentence.keys())
+def is_canonical_order(keys) -> bool:
+    last = -1
+
+    for key in keys:
+        position = PRIMITIVE_POSITION.get(key)
+
+        if position is None or position <= last:
+            return False
+
+        last = position
 
-    expected_order = [
-        key for key in CANONICAL_ORDER
-        if key in sentence
-    ]
+    return True
 
-    if keys != expected_order:
+
+def check_canonical_order(sentence: dict) -> None:
+    if not is_canonical_order(sentence):
         raise StructuralValidationError(
             "SF-04",
             "Canonical primitive order violated"
@@ -37,28 +81,381 @@ def check_canonical_order(sentence: dict) -> None:
 
 
 # --------------------------------------------
-# Structural Validation Engine (S1–S20)
+# Key-Level Checks (Non-Canonical Shapes Only)
+# --------------------------------------------
+
+def first_unknown_primitive(sentence: dict):
+    if sentence.keys() <= PRIMITIVE_POSITION.keys():
+        return None
+
+    for key in sentence:
+        if key not in PRIMITIVE_POSITION:
+            return key
+
+
+# --------------------------------------------
+# Key-Shape Memoization
 # --------------------------------------------
+#
+# Maps a key tuple to (key_error, ordered, has_reason): the SF-01 or
+# SF-11 (code, message) raised before any value is read, whether the
+# shape is in canonical order (otherwise SF-04 follows the type checks)
+# and whether a reason is present. Canonical shapes are preloaded;
+# further shapes are added until the table is full, after which they
+# are classified on every call, so unusual inputs cannot grow it.
 
-def validate_structure(sentence: dict) -> None:
+SHAPE_CACHE_SIZE = 256
+
+
+def _shape_outcome(shape: tuple) -> tuple:
+    has_reason = "reason" in shape
+
+    if shape in CANONICAL_SHAPES:
+        return None, True, has_reason
 
-    # -------- S1–S5: Mandatory Primitive Presence --------
     for primitive in REQUIRED_PRIMITIVES:
-        if primitive not in sentence:
+        if primitive not in shape:
+            return ("SF-01", f"Missing required primitive: {primitive}"), False, has_reason
+
+    for key in shape:
+        if key not in PRIMITIVE_POSITION:
+            return ("SF-11", f"Unknown primitive: {key}"), False, has_reason
+
+    return None, False, has_reason
+
+
+KEY_SHAPES = {shape: _shape_outcome(shape) for shape in CANONICAL_SHAPES}
+
+
+def clear_shape_cache() -> None:
+    for shape in list(KEY_SHAPES):
+        if shape not in CANONICAL_SHAPES:
+            del KEY_SHAPES[shape]
+
+
+# --------------------------------------------
+# Input Size Budgets (SF-12 to SF-16)
+# --------------------------------------------
+#
+# Checked right after primitive presence and before any other check
+# reads a value. Context and ConstraintSet sizes and the actor and
+# intent lengths are O(1). Context, constraints and reason are then
+# walked one nesting level at a time: every container on a level is
+# sized before its items are expanded, so the walk never expands more
+# than max_values values and stops at the first level holding a
+# violation (strings, then depth, then the value count). Dictionary
+# keys are only ever hashed, never scanned, so the string budget
+# applies to values.
+#
+# Most sentences are flat (scalar context values, constraints of at
+# most three scalar keys or a ConstraintSet). For those, the value count
+# is bounded from container sizes and one type check per value proves
+# the budgets hold; anything else goes through the walk, which alone
+# decides the error.
+
+class InputBudgets:
+    __slots__ = (
+        "max_context_fields",
+        "max_constraints",
+        "max_string_length",
+        "max_depth",
+        "max_values"
+    )
+
+    def __init__(
+        self,
+        max_context_fields: int = 10_000,
+        max_constraints: int = 1_000,
+        max_string_length: int = 65_536,
+        max_depth: int = 32,
+        max_values: int = 100_000
+    ):
+        self.max_context_fields = max_context_fields
+        self.max_constraints = max_constraints
+        self.max_string_length = max_string_length
+        self.max_depth = max_depth
+        self.max_values = max_values
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{slot}={getattr(self, slot)!r}" for slot in self.__slots__)
+        return f"InputBudgets({fields})"
+
+
+DEFAULT_BUDGETS = InputBudgets()
+
+_PLAIN_TYPES = frozenset({int, float, bool, type(None)})
+
+_FLAT_TYPES = _PLAIN_TYPES | {str}
+
+_KNOWN_TYPES = _FLAT_TYPES | {dict, list, Constraint}
+
+
+def _string_over_budget(budgets: InputBudgets):
+    return StructuralValidationError(
+        "SF-14",
+        f"String longer than {budgets.max_string_length} characters"
+    )
+
+
+def _longest_string(values) -> int:
+    return max([len(value) for value in values if isinstance(value, str)], default=0)
+
+
+def _walk_values(roots: list, budgets: InputBudgets) -> None:
+    remaining = budgets.max_values
+    level = roots
+    depth = 0
+
+    while level:
+        depth += 1
+        kinds = set(map(type, level))
+
+        if kinds <= _PLAIN_TYPES:
+            return
+
+        # Subclasses (e.g. decoder.DuplicateKeyDict) are not in the
+        # known types, so those levels are checked with isinstance.
+        if kinds <= _KNOWN_TYPES:
+            longest = max([len(v) for v in level if type(v) is str]) if str in kinds else 0
+        else:
+            longest = _longest_string(level)
+
+        if longest > budgets.max_string_length:
+            raise _string_over_budget(budgets)
+
+        if kinds <= _FLAT_TYPES:
+            return
+
+        if kinds <= _KNOWN_TYPES and Constraint not in kinds:
+            containers = [v for v in level if type(v) is dict or type(v) is list]
+        else:
+            containers = []
+
+            for value in level:
+                if type(value) is Constraint:
+                    containers.append([value.field, value.value])
+                elif isinstance(value, (dict, list)):
+                    containers.append(value)
+
+        if not containers:
+            return
+
+        if depth > budgets.max_depth:
             raise StructuralValidationError(
-                "SF-01",
-                f"Missing required primitive: {primitive}"
+                "SF-15",
+                f"Values nested deeper than {budgets.max_depth} levels"
             )
 
-    # -------- Unknown Primitive Detection --------
-    valid_primitives = set(REQUIRED_PRIMITIVES + OPTIONAL_PRIMITIVES)
-    for key in sentence.keys():
-        if key not in valid_primitives:
+        remaining -= sum(map(len, containers))
+
+        if remaining < 0:
             raise StructuralValidationError(
-                "SF-11",
-                f"Unknown primitive: {key}"
+                "SF-16",
+                f"Sentence holds more than {budgets.max_values} values"
             )
 
+        level = []
+
+        for container in containers:
+            level.extend(container.values() if isinstance(container, dict) else container)
+
+
+def values_within_budgets(values, budgets: InputBudgets) -> bool:
+    """
+    True if every value is a scalar (no containers) and every string
+    is within budgets.max_string_length.
+    """
+
+    if type(values) is not list:
+        values = list(values)
+
+    kinds = set(map(type, values))
+
+    if not kinds <= _FLAT_TYPES:
+        return False
+
+    return str not in kinds or \
+        max([len(v) for v in values if type(v) is str]) <= budgets.max_string_length
+
+
+def _scalars_within(values, limit: int) -> bool:
+    for value in values:
+        kind = type(value)
+
+        if kind is str:
+            if len(value) > limit:
+                return False
+        elif kind not in _PLAIN_TYPES:
+            return False
+
+    return True
+
+
+# Keys a constraint dictionary may hold on the fast path (field, value
+# and op), so the value count is bounded before any constraint is read.
+_FLAT_CONSTRAINT_KEYS = 3
+
+
+def _flat_within_budgets(context, constraints, reason, budgets: InputBudgets) -> bool:
+    # True only if the walk would find nothing: context values are
+    # scalars and every constraint (and the reason) is a dictionary or
+    # Constraint of scalars. The value count is bounded from container
+    # sizes before any value is read, and nothing is allocated, so
+    # small sentences pay one type check per value. Anything else,
+    # including a bound over max_values, is left to the walk.
+    if type(context) is not dict or budgets.max_depth < 2:
+        return False
+
+    if reason is None:
+        reason_size = 0
+    elif type(reason) is dict:
+        reason_size = len(reason)
+    elif type(reason) is Constraint:
+        reason_size = 2
+    else:
+        return False
+
+    compact = type(constraints) is ConstraintSet
+
+    if not compact and type(constraints) is not list:
+        return False
+
+    # A constraint is one value of the list plus its own values; each
+    # Constraint is walked as a [field, value] pair.
+    per_constraint = 3 if compact else _FLAT_CONSTRAINT_KEYS + 1
+
+    if len(context) + per_constraint * len(constraints) + reason_size > budgets.max_values:
+        return False
+
+    limit = budgets.max_string_length
+
+    for value in context.values():
+        kind = type(value)
+
+        if kind is str:
+            if len(value) > limit:
+                return False
+        elif kind not in _PLAIN_TYPES:
+            return False
+
+    if compact:
+        for constraint in constraints.items:
+            field = constraint.field
+            value = constraint.value
+
+            if type(field) is not str or len(field) > limit:
+                return False
+
+            kind = type(value)
+
+            if kind is str:
+                if len(value) > limit:
+                    return False
+            elif kind not in _PLAIN_TYPES:
+                return False
+    else:
+        for constraint in constraints:
+            if type(constraint) is not dict or len(constraint) > _FLAT_CONSTRAINT_KEYS:
+                return False
+
+            for value in constraint.values():
+                kind = type(value)
+
+                if kind is str:
+                    if len(value) > limit:
+                        return False
+                elif kind not in _PLAIN_TYPES:
+                    return False
+
+    if reason is None:
+        return True
+
+    if type(reason) is Constraint:
+        return _scalars_within((reason.field, reason.value), limit)
+
+    return _scalars_within(reason.values(), limit)
+
+
+def check_budgets(actor, intent, context, constraints, reason, budgets: InputBudgets) -> None:
+    """
+    Raises SF-12 to SF-16 for primitives beyond budgets. Values of the
+    wrong type are left to the type checks that follow.
+    """
+
+    # O(1) size checks first, then the flat fast path, then the walk.
+    if isinstance(context, dict) and len(context) > budgets.max_context_fields:
+        raise StructuralValidationError(
+            "SF-12",
+            f"Context has more than {budgets.max_context_fields} fields"
+        )
+
+    if isinstance(constraints, (list, ConstraintSet)) and \
+            len(constraints) > budgets.max_constraints:
+        raise StructuralValidationError(
+            "SF-13",
+            f"ConstraintSet has more than {budgets.max_constraints} constraints"
+        )
+
+    limit = budgets.max_string_length
+
+    if isinstance(actor, str) and len(actor) > limit or \
+            isinstance(intent, str) and len(intent) > limit:
+        raise _string_over_budget(budgets)
+
+    if _flat_within_budgets(context, constraints, reason, budgets):
+        return
+
+    if type(constraints) is ConstraintSet:
+        constraints = list(constraints.items)
+
+    _walk_values([context, constraints, reason], budgets)
+
+
+# --------------------------------------------
+# Structural Validation Engine (S1–S20)
+# --------------------------------------------
+
+def validate_structure(sentence: dict, budgets: InputBudgets = None) -> None:
+    """
+    Raises StructuralValidationError for the first structural failure
+    of sentence. budgets defaults to DEFAULT_BUDGETS.
+    """
+
+    if budgets is None:
+        budgets = DEFAULT_BUDGETS
+
+    if type(sentence) is Sentence:
+        return validate_compact_structure(sentence, budgets)
+
+    # Every key-level outcome (presence, unknown primitives, order,
+    # cardinality, reason presence) depends only on the key sequence,
+    # so it is looked up once per shape. Value-level checks still run
+    # in their original order around it.
+    shape = tuple(sentence)
+    outcome_of_keys = KEY_SHAPES.get(shape)
+
+    if outcome_of_keys is None:
+        outcome_of_keys = _shape_outcome(shape)
+
+        if len(KEY_SHAPES) < SHAPE_CACHE_SIZE:
+            KEY_SHAPES[shape] = outcome_of_keys
+
+    key_error, ordered, has_reason = outcome_of_keys
+
+    # -------- S1–S5 Presence / Unknown Primitive Detection --------
+    if key_error is not None:
+        raise StructuralValidationError(*key_error)
+
+    # -------- SF-12–SF-16: Input Size Budgets --------
+    check_budgets(
+        sentence["actor"],
+        sentence["intent"],
+        sentence["context"],
+        sentence["constraints"],
+        sentence.get("reason"),
+        budgets
+    )
+
     # -------- Primitive Type Enforcement --------
     if not isinstance(sentence["actor"], str):
         raise StructuralValidationError(
@@ -79,42 +476,51 @@ def validate_structure(sentence: dict) -> None:
         )
 
     # -------- S8–S12: Canonical Order --------
-    check_canonical_order(sentence)
+    if not ordered:
+        raise StructuralValidationError(
+            "SF-04",
+            "Canonical primitive order violated"
+        )
 
     # -------- S20: Outcome Domain Check --------
     outcome = sentence["outcome"]
 
-    if outcome not in VALID_OUTCOMES:
+    if not isinstance(outcome, str) or outcome not in VALID_OUTCOMES:
         raise StructuralValidationError(
             "SF-07",
             "Invalid outcome value"
         )
 
     # -------- S6–S7: Conditional Reason Rules --------
-    if outcome == "Refused" and "reason" not in sentence:
+    if outcome == "Refused" and not has_reason:
         raise StructuralValidationError(
             "SF-03",
             "Reason required when outcome is Refused"
         )
 
-    if outcome == "Allowed" and "reason" in sentence:
+    if outcome == "Allowed" and has_reason:
         raise StructuralValidationError(
             "SF-03",
             "Reason forbidden when outcome is Allowed"
         )
 
     # -------- S17: Reason Multiplicity --------
-    if isinstance(sentence.get("reason"), list):
+    if has_reason and isinstance(sentence["reason"], list):
         raise StructuralValidationError(
             "SF-06",
             "Multiple reasons not allowed"
         )
 
     # -------- S13–S16: Cardinality / Duplicate Keys --------
-    if len(set(sentence.keys())) != len(sentence.keys()):
+    # Canonical shapes hold each primitive once. A primitive repeated
+    # in the source text is only visible when the sentence was read
+    # with decoder.decode_sentence, which records it while parsing.
+    duplicates = getattr(sentence, "duplicate_keys", None)
+
+    if duplicates:
         raise StructuralValidationError(
             "SF-05",
-            "Duplicate primitive detected"
+            f"Duplicate primitive detected: {duplicates[0]}"
         )
 
     # -------- S2: ConstraintSet Integrity --------
@@ -134,25 +540,168 @@ def validate_structure(sentence: dict) -> None:
 
     # -------- S18: Constraint Structural Integrity --------
     for constraint in constraints:
+        _check_constraint(constraint)
 
-        if not isinstance(constraint, dict):
+    # -------- S10: Primitive Nesting / Interleaving --------
+    # By now actor/intent are strings, constraints a list and outcome
+    # a domain string, so only context and reason can hold primitives.
+    reason = sentence.get("reason")
+
+    if not REQUIRED_SET.isdisjoint(sentence["context"]) or (
+        isinstance(reason, dict) and not REQUIRED_SET.isdisjoint(reason)
+    ):
+        raise StructuralValidationError(
+            "SF-10",
+            "Primitive nesting detected"
+        )
+
+
+# --------------------------------------------
+# Compact Sentences (model.Sentence)
+# --------------------------------------------
+#
+# A Sentence holds each primitive in its own slot, in canonical order,
+# so every key-level check (S1-S5, S8-S16, unknown primitives) holds by
+# construction. The remaining checks run in the same order as above.
+
+def validate_compact_structure(sentence: Sentence, budgets: InputBudgets = None) -> None:
+
+    check_budgets(
+        sentence.actor,
+        sentence.intent,
+        sentence.context,
+        sentence.constraints,
+        sentence.reason if sentence.has_reason else None,
+        DEFAULT_BUDGETS if budgets is None else budgets
+    )
+
+    if not isinstance(sentence.actor, str):
+        raise StructuralValidationError("SF-08", "Actor must be string")
+
+    if not isinstance(sentence.intent, str):
+        raise StructuralValidationError("SF-08", "Intent must be string")
+
+    if not isinstance(sentence.context, dict):
+        raise StructuralValidationError("SF-08", "Context must be dictionary")
+
+    outcome = sentence.outcome
+
+    if not isinstance(outcome, str) or outcome not in VALID_OUTCOMES:
+        raise StructuralValidationError("SF-07", "Invalid outcome value")
+
+    has_reason = sentence.has_reason
+
+    if outcome == "Refused" and not has_reason:
+        raise StructuralValidationError(
+            "SF-03",
+            "Reason required when outcome is Refused"
+        )
+
+    if outcome == "Allowed" and has_reason:
+        raise StructuralValidationError(
+            "SF-03",
+            "Reason forbidden when outcome is Allowed"
+        )
+
+    reason = sentence.reason if has_reason else None
+
+    if isinstance(reason, list):
+        raise StructuralValidationError("SF-06", "Multiple reasons not allowed")
+
+    constraints = sentence.constraints
+
+    if type(constraints) is ConstraintSet:
+        # Every item is a Constraint, which always has field and value.
+        if not constraints.items:
             raise StructuralValidationError(
-                "SF-08",
-                "Constraint must be dictionary"
+                "SF-02",
+                "ConstraintSet must not be empty"
             )
 
-        if "field" not in constraint or "value" not in constraint:
+        for constraint in constraints.items:
+            if not isinstance(constraint.field, str):
+                raise StructuralValidationError(
+                    "SF-08",
+                    "Constraint field must be string"
+                )
+    else:
+        _check_constraint_list(constraints)
+
+    if not REQUIRED_SET.isdisjoint(sentence.context) or (
+        isinstance(reason, dict) and not REQUIRED_SET.isdisjoint(reason)
+    ):
+        raise StructuralValidationError("SF-10", "Primitive nesting detected")
+
+
+def _check_constraint_list(constraints) -> None:
+    if not isinstance(constraints, list):
+        raise StructuralValidationError("SF-09", "ConstraintSet must be list")
+
+    if len(constraints) == 0:
+        raise StructuralValidationError(
+            "SF-02",
+            "ConstraintSet must not be empty"
+        )
+
+    for constraint in constraints:
+        _check_constraint(constraint)
+
+
+# --------------------------------------------
+# Constraint Operators (grammar.CONSTRAINT_OPERATORS)
+# --------------------------------------------
+
+_SCALARS = (str, int, float, bool, type(None))
+
+_NUMBERS = (int, float)
+
+
+def _check_constraint(constraint) -> None:
+
+    if not isinstance(constraint, dict):
+        raise StructuralValidationError(
+            "SF-08",
+            "Constraint must be dictionary"
+        )
+
+    if "field" not in constraint or "value" not in constraint:
+        raise StructuralValidationError(
+            "SF-08",
+            "Constraint missing field or value"
+        )
+
+    if not isinstance(constraint["field"], str):
+        raise StructuralValidationError(
+            "SF-08",
+            "Constraint field must be string"
+        )
+
+    if "op" not in constraint:
+        return
+
+    op = constraint["op"]
+
+    if not isinstance(op, str) or op not in CONSTRAINT_OPERATORS:
+        raise StructuralValidationError(
+            "SF-08",
+            "Unknown constraint operator"
+        )
+
+    value = constraint["value"]
+
+    if op == "in" or op == "not_in":
+        if not isinstance(value, list) or not value or \
+                not all(type(member) in _SCALARS for member in value):
             raise StructuralValidationError(
                 "SF-08",
-                "Constraint missing field or value"
+                "Membership value must be a non-empty list of scalars"
             )
 
-    # -------- S10: Primitive Nesting / Interleaving --------
-    for key, value in sentence.items():
-        if isinstance(value, dict):
-            for nested_key in value.keys():
-                if nested_key in REQUIRED_PRIMITIVES:
-                    raise StructuralValidationError(
-                        "SF-10",
-                        "Primitive nesting detected"
-                    )
+    elif op == "between":
+        if not isinstance(value, list) or len(value) != 2 or \
+                type(value[0]) not in _NUMBERS or type(value[1]) not in _NUMBERS or \
+                not value[0] <= value[1]:
+            raise StructuralValidationError(
+                "SF-08",
+                "Range value must be [low, high] numbers with low <= high"
+            )
@@ -0,0 +1,128 @@
+import structural
+from structural import (
+    CANONICAL_SHAPES,
+    KEY_SHAPES,
+    SHAPE_CACHE_SIZE,
+    StructuralValidationError,
+    clear_shape_cache,
+    validate_structure
+)
+
+
+# --------------------------------------------
+# Key-Shape Memoization Tests
+# --------------------------------------------
+
+VALID_BASE = {
+    "actor": "User_001",
+    "intent": "Transfer",
+    "context": {"balance": 5000},
+    "constraints": [{"field": "balance", "value": 5000}],
+    "outcome": "Allowed"
+}
+
+
+def failure_code(sentence: dict):
+    try:
+        validate_structure(sentence)
+    except StructuralValidationError as e:
+        return e.code, e.message
+
+    return None
+
+
+def test_canonical_shapes_are_preloaded():
+    clear_shape_cache()
+    assert set(KEY_SHAPES) == set(CANONICAL_SHAPES)
+
+
+def test_cached_shape_keeps_value_checks_first():
+    # Out of order, but SF-08 on actor still wins over SF-04.
+    reordered = dict(reversed(list(VALID_BASE.items())))
+    bad_actor = dict(reordered, actor=1)
+
+    for _ in range(2):
+        assert failure_code(reordered)[0] == "SF-04"
+        assert failure_code(bad_actor)[0] == "SF-08"
+
+    assert tuple(reordered) in KEY_SHAPES
+
+
+def test_cached_key_errors_keep_their_message():
+    missing = dict(VALID_BASE)
+    missing.pop("intent")
+    unknown = dict(VALID_BASE, extra=1, other=2)
+
+    for _ in range(2):
+        assert failure_code(missing) == ("SF-01", "Missing required primitive: intent")
+        assert failure_code(unknown) == ("SF-11", "Unknown primitive: extra")
+
+
+def test_table_is_bounded():
+    clear_shape_cache()
+
+    for i in range(SHAPE_CACHE_SIZE * 2):
+        assert failure_code(dict(VALID_BASE, **{f"key_{i}": i}))[0] == "SF-11"
+
+    assert len(structural.KEY_SHAPES) == SHAPE_CACHE_SIZE
+    clear_shape_cache()
+
+
+def test_cached_shape_is_not_reclassified():
+    clear_shape_cache()
+    calls = []
+    classify = structural._shape_outcome
+
+    def counting(shape):
+        calls.append(shape)
+        return classify(shape)
+
+    structural._shape_outcome = counting
+
+    try:
+        unknown = dict(VALID_BASE, extra=1)
+
+        for _ in range(3):
+            assert failure_code(unknown)[0] == "SF-11"
+            assert failure_code(VALID_BASE) is None
+    finally:
+        structural._shape_outcome = classify
+        clear_shape_cache()
+
+    assert calls == [tuple(unknown)], calls
+
+
+def test_full_table_keeps_entries_and_results():
+    clear_shape_cache()
+    missing = dict(VALID_BASE)
+    missing.pop("actor")
+    unknown = dict(VALID_BASE, extra=1)
+    expected = [failure_code(missing), failure_code(unknown)]
+    cached = dict(KEY_SHAPES)
+
+    for i in range(SHAPE_CACHE_SIZE * 2):
+        failure_code(dict(VALID_BASE, **{f"key_{i}": i}))
+
+    # New shapes are not added once full; nothing already cached is evicted.
+    assert len(KEY_SHAPES) == SHAPE_CACHE_SIZE
+    assert cached.items() <= KEY_SHAPES.items()
+    assert tuple(dict(VALID_BASE, key_999=1)) not in KEY_SHAPES
+
+    # Memoized, full-table and uncached lookups give the same failures.
+    assert [failure_code(missing), failure_code(unknown)] == expected
+    assert failure_code(dict(VALID_BASE, key_999=1)) == ("SF-11", "Unknown primitive: key_999")
+
+    clear_shape_cache()
+    assert [failure_code(missing), failure_code(unknown)] == expected
+    assert expected[0] == ("SF-01", "Missing required primitive: actor")
+    clear_shape_cache()
+
+
+if __name__ == "__main__":
+    test_canonical_shapes_are_preloaded()
+    test_cached_shape_keeps_value_checks_first()
+    test_cached_key_errors_keep_their_message()
+    test_table_is_bounded()
+    test_cached_shape_is_not_reclassified()
+    test_full_table_keeps_entries_and_results()
+    print("Key-shape memoization tests passed.")
@@ -1,3 +1,5 @@
+import json
+from decoder import decode_sentence
 from validator import validate
 
 
@@ -128,12 +130,11 @@ def test_sf04_order_violation_3():
 # ---------- SF-05: Duplicate Primitive (1 test) ----------
 
 def test_sf05_duplicate_keys():
-    s = dict(VALID_BASE)
-    s["actor"] = "User_002"
-    # Python dict cannot truly duplicate keys,
-    # this test simulates by tampering detection layer if needed.
-    # (Already guarded by key uniqueness)
-    assert True
+    text = json.dumps(VALID_BASE).replace(
+        '"actor": "User_001"',
+        '"actor": "User_001", "actor": "User_002"'
+    )
+    assert_rejected(decode_sentence(text), "SF-05")
 
 
 # ---------- SF-07: Invalid Outcome (2 tests) ----------
@@ -277,6 +278,8 @@ if __name__ == "__main__":
     test_sf04_order_violation_2()
     test_sf04_order_violation_3()
 
+    test_sf05_duplicate_keys()
+
     test_sf07_invalid_outcome()
     test_sf07_none_outcome()
 
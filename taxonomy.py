@@ -1,4 +1,4 @@
-# Structural Failure Taxonomy (SF-01 to SF-10)
+# Structural Failure Taxonomy (SF-01 to SF-16)
 
 STRUCTURAL_FAILURES = {
     "SF-01": "Missing mandatory primitive",
@@ -10,5 +10,11 @@ STRUCTURAL_FAILURES = {
     "SF-07": "Invalid outcome domain",
     "SF-08": "Constraint structural invalidity",
     "SF-09": "Constraint order corruption",
-    "SF-10": "Primitive nesting/interleaving violation"
+    "SF-10": "Primitive nesting/interleaving violation",
+    "SF-11": "Unknown primitive",
+    "SF-12": "Context size budget exceeded",
+    "SF-13": "ConstraintSet size budget exceeded",
+    "SF-14": "String length budget exceeded",
+    "SF-15": "Nesting depth budget exceeded",
+    "SF-16": "Value count budget exceeded"
 }
@@ -1,12 +1,70 @@
-from structural import validate_structure, StructuralValidationError
-from semantic import evaluate_constraints
+import asyncio
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from time import perf_counter
+
+from structural import (
+    validate_structure,
+    values_within_budgets,
+    StructuralValidationError,
+    REQUIRED_SET,
+    DEFAULT_BUDGETS
+)
+from semantic import evaluate_constraints, reevaluate_constraints
 from resolution import resolve
 from phase_tracker import PhaseTracker
+from result_cache import sentence_key
+from model import Constraint, ConstraintSet, Sentence
+
+
+def validate(
+    sentence: dict,
+    return_phase_log: bool = False,
+    cache=None,
+    metrics=None,
+    budgets=None
+) -> dict:
+    """
+    Validates one sentence through Structural -> Semantic -> Resolution.
+    sentence may be a dictionary or a compact model.Sentence.
+
+    An optional result_cache.ResultCache short-circuits repeated
+    sentences: a hit returns a fresh copy of the stored result without
+    running any phase. Phase-logged calls always run the phases.
+
+    An optional phase_tracker.PhaseMetrics records end-to-end and
+    per-phase latency and outcome counters (cache hits count towards
+    latency and classification only).
+
+    budgets (a structural.InputBudgets) replaces the default input size
+    budgets; cached results are keyed by the budgets they were
+    validated under.
+    """
 
+    if metrics is not None:
+        started = perf_counter()
 
-def validate(sentence: dict, return_phase_log: bool = False) -> dict:
+    if cache is None or not cache.enabled or return_phase_log:
+        result = _run_phases(sentence, return_phase_log, metrics, budgets)
+    else:
+        key = sentence_key(sentence, budgets)
+        result = cache.get(key)
 
-    tracker = PhaseTracker()
+        if result is None:
+            result = _run_phases(sentence, False, metrics, budgets)
+            cache.put(key, result)
+
+    if metrics is not None:
+        metrics.observe_result(result, perf_counter() - started)
+
+    return result
+
+
+def _run_phases(sentence: dict, return_phase_log: bool, metrics=None, budgets=None) -> dict:
+
+    tracker = PhaseTracker(metrics)
 
     # ----------------------------
     # Phase 1 — Structural
@@ -14,9 +72,10 @@ def validate(sentence: dict, return_phase_log: bool = False) -> dict:
     tracker.enter("Structural")
 
     try:
-        validate_structure(sentence)
+        validate_structure(sentence, budgets)
 
     except StructuralValidationError as e:
+        tracker.finish()
         tracker.verify_sequence()
 
         result = {
@@ -35,10 +94,12 @@ def validate(sentence: dict, return_phase_log: bool = False) -> dict:
     # ----------------------------
     tracker.enter("Semantic")
 
-    evaluation_result = evaluate_constraints(
-        sentence["constraints"],
-        sentence["context"]
-    )
+    if type(sentence) is Sentence:
+        constraints, context = sentence.constraints, sentence.context
+    else:
+        constraints, context = sentence["constraints"], sentence["context"]
+
+    evaluation_result = evaluate_constraints(constraints, context)
 
     # ----------------------------
     # Phase 3 — Resolution
@@ -47,9 +108,306 @@ def validate(sentence: dict, return_phase_log: bool = False) -> dict:
 
     resolution_result = resolve(evaluation_result)
 
+    tracker.finish()
     tracker.verify_sequence()
 
+    if metrics is not None and evaluation_result["failed_index"] is not None:
+        metrics.observe_failed_index(evaluation_result["failed_index"])
+
     if return_phase_log:
         resolution_result["phase_log"] = tracker.phases
 
     return resolution_result
+
+
+# --------------------------------------------
+# Incremental Revalidation (Context Deltas)
+# --------------------------------------------
+
+_UNKNOWN = object()
+
+
+def _previous_failure(constraints, previous: dict):
+    # The first constraint equal to the reported reason is the one that
+    # failed: any equal constraint before it would have failed first.
+    classification = previous.get("classification")
+
+    if classification == "Accepted + Allowed":
+        return None
+
+    if classification != "Accepted + Refused":
+        return _UNKNOWN
+
+    try:
+        if type(constraints) is ConstraintSet:
+            return constraints.items.index(Constraint.from_dict(previous["reason"]))
+
+        return constraints.index(previous["reason"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return _UNKNOWN
+
+
+def failed_index(sentence, result: dict):
+    """
+    Index of the failed constraint behind a Refused result of sentence,
+    None for any other result. Raises ValueError if result's reason is
+    not one of the sentence's constraints.
+    """
+
+    if result.get("classification") != "Accepted + Refused":
+        return None
+
+    constraints = sentence.constraints if type(sentence) is Sentence \
+        else sentence.get("constraints")
+    index = _previous_failure(constraints, result)
+
+    if index is _UNKNOWN:
+        raise ValueError("Result reason is not a constraint of the sentence")
+
+    return index
+
+
+def revalidate(
+    sentence: dict,
+    previous: dict,
+    delta: dict = None,
+    removed=(),
+    plan=None,
+    budgets=None
+) -> dict:
+    """
+    Applies a context delta to sentence in place (delta's fields are
+    set, removed fields deleted) and returns the result validate would
+    now return, given previous, the sentence's result before the change.
+
+    Only constraints on changed fields are re-evaluated (see
+    semantic.reevaluate_constraints). Structurally rejected sentences,
+    deltas touching primitive names (SF-10) and results that do not
+    belong to the sentence fall back to a full validate, as do deltas
+    that add context fields or set anything but in-budget scalars
+    (which could exceed an input size budget). Pass
+    plan=semantic.compile_constraints(constraints) when re-checking the
+    same sentence repeatedly, to skip rebuilding it on every call.
+    """
+
+    delta = delta or {}
+    compact = type(sentence) is Sentence
+    context = sentence.context if compact else sentence.get("context")
+
+    if not isinstance(context, dict):
+        return validate(sentence, budgets=budgets)
+
+    # Replacing existing fields with in-budget scalars (or removing
+    # fields) cannot push an accepted sentence over a budget.
+    within_budgets = context.keys() >= delta.keys() and values_within_budgets(
+        delta.values(), DEFAULT_BUDGETS if budgets is None else budgets
+    )
+
+    context.update(delta)
+
+    for field in removed:
+        context.pop(field, None)
+
+    if previous.get("classification") == "Rejected (Structural)" or \
+            not within_budgets or \
+            not REQUIRED_SET.isdisjoint(delta) or \
+            not REQUIRED_SET.isdisjoint(removed):
+        return validate(sentence, budgets=budgets)
+
+    constraints = sentence.constraints if compact else sentence["constraints"]
+    previous_index = _previous_failure(constraints, previous)
+
+    if previous_index is _UNKNOWN:
+        return validate(sentence, budgets=budgets)
+
+    changed = set(delta)
+    changed.update(removed)
+
+    return resolve(
+        reevaluate_constraints(constraints, context, previous_index, changed, plan)
+    )
+
+
+# --------------------------------------------
+# Batch Validation (Order-Preserving Process Pool)
+# --------------------------------------------
+
+DEFAULT_CHUNK_SIZE = 512
+
+
+def _validate_chunk(sentences: list, budgets=None) -> list:
+    return [validate(sentence, budgets=budgets) for sentence in sentences]
+
+
+def _chunked(items, chunk_size: int):
+    chunk = []
+
+    for item in items:
+        chunk.append(item)
+
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def imap_chunks(func, items, workers=None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Applies func to consecutive chunks of items and yields the
+    per-item results in input order.
+
+    func must be a module-level callable taking a list and returning
+    a list of the same length. With workers <= 1 everything runs in
+    the calling process; otherwise chunks are spread over a process
+    pool with a bounded number of chunks in flight, so arbitrarily
+    long iterables are consumed lazily.
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    chunks = _chunked(items, chunk_size)
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield from func(chunk)
+        return
+
+    max_in_flight = workers * 2
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in chunks:
+            pending.append(pool.submit(func, chunk))
+
+            if len(pending) >= max_in_flight:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def iter_validate_many(
+    sentences,
+    workers=None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    budgets=None
+):
+    """
+    Lazily validates sentences across a process pool, yielding
+    results in input order.
+    """
+
+    func = _validate_chunk if budgets is None else partial(_validate_chunk, budgets=budgets)
+    return imap_chunks(func, sentences, workers, chunk_size)
+
+
+def validate_many(
+    sentences,
+    workers=None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    budgets=None
+) -> list:
+    """
+    Validates many sentences across a process pool.
+
+    Results are returned in input order and are identical to
+    [validate(s, budgets=budgets) for s in sentences]. Sentences are
+    shipped to workers in chunks rather than one at a time.
+    """
+    return list(iter_validate_many(sentences, workers, chunk_size, budgets))
+
+
+# --------------------------------------------
+# Asyncio API (Executor-Offloaded Chunks)
+# --------------------------------------------
+#
+# Validation is CPU-bound, so it never runs on the event loop thread.
+# Sentences travel to the executor in chunks (one hop per chunk, not per
+# sentence) with at most `concurrency` chunks in flight. The default
+# executor is the loop's thread pool, which keeps the loop responsive;
+# pass a ProcessPoolExecutor to also validate in parallel.
+
+DEFAULT_ASYNC_CONCURRENCY = 4
+
+
+async def validate_async(sentence: dict, executor=None, budgets=None) -> dict:
+    """
+    Validates one sentence off the event loop thread.
+    """
+    loop = asyncio.get_running_loop()
+    func = validate if budgets is None else partial(validate, budgets=budgets)
+    return await loop.run_in_executor(executor, func, sentence)
+
+
+async def _achunked(items, chunk_size: int):
+    if hasattr(items, "__aiter__"):
+        chunk = []
+
+        async for item in items:
+            chunk.append(item)
+
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+    else:
+        for chunk in _chunked(items, chunk_size):
+            yield chunk
+
+
+async def iter_validate_async(
+    sentences,
+    executor=None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+    budgets=None
+):
+    """
+    Asynchronously yields validate(s, budgets=budgets) for every
+    sentence, in input order. sentences may be a regular or an async
+    iterable and is consumed lazily. Closing the iterator or cancelling its consumer
+    cancels every chunk not yet started.
+    """
+
+    if chunk_size < 1 or concurrency < 1:
+        raise ValueError("chunk_size and concurrency must be positive")
+
+    func = _validate_chunk if budgets is None else partial(_validate_chunk, budgets=budgets)
+    loop = asyncio.get_running_loop()
+    pending = deque()
+
+    try:
+        async for chunk in _achunked(sentences, chunk_size):
+            pending.append(loop.run_in_executor(executor, func, chunk))
+
+            if len(pending) >= concurrency:
+                for result in await pending.popleft():
+                    yield result
+
+        while pending:
+            for result in await pending.popleft():
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def validate_many_async(
+    sentences,
+    executor=None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+    budgets=None
+) -> list:
+    return [
+        result async for result in
+        iter_validate_async(sentences, executor, chunk_size, concurrency, budgets)
+    ]